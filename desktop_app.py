@@ -1,8 +1,14 @@
+import json
 import os
+import queue
 import sys
+import time
 import tkinter as tk
 from tkinter import ttk, messagebox
 
+# Start of the time-to-first-window measurement (Django setup included)
+_PROCESS_STARTED = time.perf_counter()
+
 # Bootstrap Django
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 if BASE_DIR not in sys.path:
@@ -15,10 +21,17 @@ import django
 django.setup()
 print("Django setup completed successfully.")
 
-import pyttsx3
+from recommender.models import EducationStage, Stream, UserProfile, Feedback  # noqa: E402
+from recommender import instrumentation  # noqa: E402
+from recommender.background import TaskPool  # noqa: E402
+from recommender import session as sessions  # noqa: E402
+from recommender import speech  # noqa: E402
+from recommender.tts_cache import TTSCache  # noqa: E402
+from recommender import services as _services  # noqa: E402
+from recommender.models import ScreenTiming  # noqa: E402
 
-from recommender.models import EducationStage, Question, OptionScore, Stream, UserProfile, Feedback  # noqa: E402
-from recommender import services  # noqa: E402
+# Service calls made while a screen is shown count towards its timing sample
+services = instrumentation.timed_module(_services)
 
 
 class LoginWindow(tk.Tk):
@@ -458,9 +471,42 @@ class LogoutWindow(tk.Toplevel):
         self.on_logout()
 
 
+class TkDispatcher:
+    """Run callbacks from worker threads on the Tk main loop.
+
+    Tk calls are only safe from the main thread, so workers put callbacks on a
+    queue that the main loop drains every ``poll_ms`` via ``after()``.
+    """
+
+    def __init__(self, root: tk.Misc, poll_ms: int = 30):
+        self.root = root
+        self.poll_ms = poll_ms
+        self._queue = queue.Queue()
+        self.root.after(self.poll_ms, self._drain)
+
+    def __call__(self, callback):
+        self._queue.put(callback)
+
+    def _drain(self):
+        while True:
+            try:
+                callback = self._queue.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                callback()
+            except Exception as e:
+                print(f"Background result handler failed: {e}")
+        try:
+            self.root.after(self.poll_ms, self._drain)
+        except tk.TclError:
+            pass  # window already destroyed
+
+
 class ScreenManager(tk.Tk):
     def __init__(self, username):
         print("Initializing ScreenManager...")
+        started = time.perf_counter()
         super().__init__()
         self.username = username
         print("Tk window created.")
@@ -533,23 +579,15 @@ class ScreenManager(tk.Tk):
         self.interest_answers = {}
         self.subject_levels = {}
         self.stream_recommendations = {}
+        # Recommendation view model for the current answers (see recommender/session.py)
+        self.session = None
+        self.visible_frame = None
+
+        # ORM and service calls for screens run here; results come back through after()
+        self.tasks = TaskPool(TkDispatcher(self), name="tk-worker")
         
-        # Initialize text-to-speech engine
-        try:
-            self.tts_engine = pyttsx3.init()
-            self.tts_engine.setProperty('rate', 150)  # Speed of speech
-            self.tts_engine.setProperty('volume', 0.9)  # Volume level (0.0 to 1.0)
-            
-            # Get available voices and set a clear, pleasant voice
-            voices = self.tts_engine.getProperty('voices')
-            # Try to select a female voice if available (often clearer for instructions)
-            for voice in voices:
-                if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
-                    self.tts_engine.setProperty('voice', voice.id)
-                    break
-        except Exception as e:
-            print(f"Text-to-speech initialization failed: {e}")
-            self.tts_engine = None
+        # Text-to-speech starts on first use (see the ``speech`` property)
+        self._speech = None
 
         # Header bar with title and step indicator
         try:
@@ -563,6 +601,12 @@ class ScreenManager(tk.Tk):
             )
             self.title_label.pack(side="left")
 
+            # Speech status with a stop button, shown only while reading
+            self.speech_bar = ttk.Frame(header, style="Header.TFrame")
+            self.speech_label = ttk.Label(self.speech_bar, text="", style="SubHeader.TLabel")
+            self.speech_label.pack(side="left", padx=(20, 6))
+            ttk.Button(self.speech_bar, text="⏹ Stop", command=self.stop_speech).pack(side="left")
+
             # Logout button
             logout_btn = tk.Button(
                 header,
@@ -604,24 +648,26 @@ class ScreenManager(tk.Tk):
             container = ttk.Frame(self, style="App.TFrame")
             container.pack(fill="both", expand=True)
 
+            # Screens are built the first time they are shown (see get_frame)
+            self._container = container
             self.frames = {}
-            for F in (
-                HomeScreen,
-                StageSelectionScreen,
-                QuestionnaireScreen,
-                SubjectStrengthScreen,
-                ResultsScreen,
-                SkillRoadmapScreen,
-                ProgressScreen,
-                DashboardScreen,  # New dashboard screen
-                HistoryScreen,
-                AnalyticsScreen,
-                FeedbackScreen,  # New feedback screen
-                AccessibilitySettingsScreen,  # New accessibility settings screen
-            ):
-                frame = F(parent=container, controller=self)
-                self.frames[F.__name__] = frame
-                frame.grid(row=0, column=0, sticky="nsew")
+            self._screen_classes = {
+                F.__name__: F
+                for F in (
+                    HomeScreen,
+                    StageSelectionScreen,
+                    QuestionnaireScreen,
+                    SubjectStrengthScreen,
+                    ResultsScreen,
+                    SkillRoadmapScreen,
+                    ProgressScreen,
+                    DashboardScreen,  # New dashboard screen
+                    HistoryScreen,
+                    AnalyticsScreen,
+                    FeedbackScreen,  # New feedback screen
+                    AccessibilitySettingsScreen,  # New accessibility settings screen
+                )
+            }
 
             self._step_info = {
                 "HomeScreen": (1, "Welcome"),
@@ -642,6 +688,8 @@ class ScreenManager(tk.Tk):
             import traceback
             traceback.print_exc()
             raise
+
+        report_first_window(self, "startup.main_window", started)
     
     def logout(self):
         # Show logout confirmation window
@@ -649,15 +697,44 @@ class ScreenManager(tk.Tk):
     
     def perform_logout(self):
         # Close the main application window
+        self.close_speech()
         self.destroy()
         
         # Show login window again
         login_window = LoginWindow(start_application)
         login_window.mainloop()
 
+    @property
+    def speech(self) -> speech.SpeechWorker:
+        """Speech worker, started (and pyttsx3 imported on its thread) on first use."""
+        if self._speech is None:
+            # Text-to-speech runs on its own thread so reading never blocks the UI
+            # Sentences are played from pre-rendered WAV files when this machine can play them
+            self._speech = speech.SpeechWorker(
+                speech.create_pyttsx3_engine,
+                dispatch=self.tasks.dispatch,
+                cache=TTSCache.from_settings() if speech.can_play_wav() else None,
+            )
+        return self._speech
+
+    def close_speech(self):
+        if self._speech is not None:
+            self._speech.close()
+
+    def get_frame(self, name: str):
+        """Return the screen called ``name``, building it on first use."""
+        frame = self.frames.get(name)
+        if frame is None:
+            with instrumentation.measure_screen(ScreenTiming.TK, f"{name}.build"):
+                frame = self._screen_classes[name](parent=self._container, controller=self)
+            frame.grid(row=0, column=0, sticky="nsew")
+            self.frames[name] = frame
+        return frame
+
     def show_frame(self, name: str):
-        frame = self.frames[name]
+        frame = self.get_frame(name)
         frame.tkraise()
+        self.visible_frame = frame
 
         # Update step indicator
         step_num, label = self._step_info.get(name, (1, "Welcome"))
@@ -665,33 +742,37 @@ class ScreenManager(tk.Tk):
         self.step_progress["value"] = step_num
 
         if hasattr(frame, "on_show"):
-            frame.on_show()
-    
-    def speak_text(self, text: str):
-        """Speak the given text using text-to-speech."""
-        if self.tts_engine:
-            try:
-                self.tts_engine.say(text)
-                self.tts_engine.runAndWait()
-            except Exception as e:
-                print(f"Text-to-speech failed: {e}")
+            with instrumentation.measure_screen(ScreenTiming.TK, name):
+                frame.on_show()
     
+    def speak_text(self, text: str, interrupt: bool = True):
+        """Speak the given text on the speech thread, replacing whatever is being read."""
+        self.speech.speak(
+            text,
+            priority=speech.HIGH if interrupt else speech.NORMAL,
+            interrupt=interrupt,
+            on_progress=self._speech_progress,
+            on_done=self._speech_done,
+        )
+
     def speak_section(self, title: str, content: str):
-        """Speak a section with title and content separately for better clarity."""
-        if self.tts_engine:
-            try:
-                self.tts_engine.say(f"{title}. {content}")
-                self.tts_engine.runAndWait()
-            except Exception as e:
-                print(f"Text-to-speech failed: {e}")
-    
+        """Queue a section with title and content after anything already being read."""
+        self.speak_text(f"{title}. {content}", interrupt=False)
+
     def stop_speech(self):
-        """Stop any ongoing speech."""
-        if self.tts_engine:
-            try:
-                self.tts_engine.stop()
-            except Exception as e:
-                print(f"Failed to stop speech: {e}")
+        """Stop any ongoing speech immediately."""
+        if self._speech is not None:
+            self._speech.cancel()
+
+    def _speech_progress(self, index: int, total: int, sentence: str):
+        self.speech_label.config(text=f"🔊 Reading {index + 1} of {total}")
+        if not self.speech_bar.winfo_ismapped():
+            self.speech_bar.pack(side="left")
+
+    def _speech_done(self, completed: bool):
+        if not self.speech.is_speaking():
+            self.speech_label.config(text="")
+            self.speech_bar.pack_forget()
 
 
 class BaseScreen(ttk.Frame):
@@ -705,6 +786,40 @@ class BaseScreen(ttk.Frame):
         self.card = ttk.Frame(self, padding=20, style="Card.TFrame")
         self.card.grid(row=0, column=0, padx=40, pady=40, sticky="nsew")
 
+        self._load_generation = 0
+        self._loading_label = ttk.Label(self, text="Loading…", font=("Segoe UI", 12, "bold"))
+
+    def load_async(self, load, render, *args):
+        """Run ``load(*args)`` on the worker pool, then ``render(result)`` on the Tk thread.
+
+        A loading label is shown meanwhile. The result is dropped if the user has
+        moved to another screen or this screen started a newer load.
+        """
+        self._load_generation += 1
+        generation = self._load_generation
+        name = type(self).__name__
+
+        def is_current():
+            return generation == self._load_generation and self.controller.visible_frame is self
+
+        def timed_load(*load_args):
+            with instrumentation.measure_screen(ScreenTiming.TK, f"{name}.load"):
+                return load(*load_args)
+
+        def done(result):
+            if is_current():
+                self._loading_label.place_forget()
+                render(result)
+
+        def failed(error):
+            if is_current():
+                self._loading_label.config(text=f"Could not load this screen: {error}")
+
+        self._loading_label.config(text="Loading…")
+        self._loading_label.place(relx=0.5, rely=0.5, anchor="center")
+        self._loading_label.lift()
+        self.controller.tasks.submit(timed_load, *args, on_done=done, on_error=failed)
+
 
 class HomeScreen(BaseScreen):
     def __init__(self, parent, controller):
@@ -897,7 +1012,7 @@ class QuestionnaireScreen(BaseScreen):
         if not stage:
             return
 
-        qs = Question.objects.filter(stage=stage, is_active=True)[:5]
+        qs = services.get_questionnaire(stage, limit=5)
         if not qs:
             ttk.Label(self.questions_frame, text="No questions defined for this stage (admin can add some).",
                       foreground="red").pack()
@@ -909,31 +1024,12 @@ class QuestionnaireScreen(BaseScreen):
             ttk.Label(frame, text=q.text, wraplength=700, justify="left").pack(anchor="w")
             var = tk.IntVar(value=0)
             self.option_vars[q.id] = var
-            for opt in q.options.all():
-                ttk.Radiobutton(frame, text=opt.option_text, value=opt.id, variable=var).pack(anchor="w")
+            for opt in q.options:
+                ttk.Radiobutton(frame, text=opt.text, value=opt.id, variable=var).pack(anchor="w")
 
     def next_clicked(self):
-        answers = []
-        for qid, var in self.option_vars.items():
-            opt_id = var.get()
-            if opt_id:
-                try:
-                    opt = OptionScore.objects.get(id=opt_id)
-                except OptionScore.DoesNotExist:
-                    continue
-                answers.append(
-                    {
-                        "logical": opt.logical_score,
-                        "analytical": opt.analytical_score,
-                        "creative": opt.creative_score,
-                        "practical": opt.practical_score,
-                        "people": opt.people_score,
-                        "scientific": opt.scientific_score,
-                        "design": opt.design_score,
-                    }
-                )
-
-        self.controller.interest_answers = answers
+        selected = [var.get() for var in self.option_vars.values() if var.get()]
+        self.controller.interest_answers = services.get_option_scores(selected, self.controller.current_stage)
 
         stage_code = self.controller.current_stage.code if self.controller.current_stage else None
         if stage_code in (EducationStage.HIGH_SCHOOL, EducationStage.HIGHER_SECONDARY):
@@ -1017,29 +1113,41 @@ class ResultsScreen(BaseScreen):
         if not user or not stage:
             return
 
-        profile = services.InterestProfile.from_option_scores(self.controller.interest_answers)
+        self.load_async(self._load, self._render, sessions.current(self.controller))
+
+    def _load(self, session):
+        """Compute the session's results; runs on a worker thread."""
+        session.results()
+        # Saved by its own task, so a failed history write never keeps the results from showing
+        self.controller.tasks.submit(session.save_history)
+        return session
+
+    def _render(self, session):
+        self._clear_tabs()
+        stage = session.stage
+        data = session.results()
 
         if stage.code in (EducationStage.HIGH_SCHOOL, EducationStage.HIGHER_SECONDARY):
-            streams = services.recommend_streams_with_explanations(profile, self.controller.subject_levels)
+            streams = data["streams"]
             self.controller.stream_recommendations = streams
 
             for plan_label in ["Plan A", "Plan B", "Plan C"]:
                 if plan_label not in streams:
                     continue
-                data = streams[plan_label]
-                s: Stream = data["stream"]
+                data_for_plan = streams[plan_label]
+                s: Stream = data_for_plan["stream"]
 
                 frame = ttk.Frame(self.notebook, padding=12, style="Card.TFrame")
                 self.notebook.add(frame, text=plan_label)
 
                 ttk.Label(frame, text=f"{s.name} Stream", font=("Segoe UI", 14, "bold")).pack(anchor="w", pady=(0, 6))
-                ttk.Label(frame, text=data["explanation"], wraplength=760, justify="left").pack(anchor="w", pady=(0, 10))
+                ttk.Label(frame, text=data_for_plan["explanation"], wraplength=760, justify="left").pack(anchor="w", pady=(0, 10))
 
                 info = ttk.Frame(frame, style="Card.TFrame")
                 info.pack(fill="x", pady=(0, 8))
-                ttk.Label(info, text=f"Required strengths: {data['required_strengths']}", wraplength=760, justify="left").pack(anchor="w", pady=2)
-                ttk.Label(info, text=f"Key subjects: {data['key_subjects']}", wraplength=760, justify="left").pack(anchor="w", pady=2)
-                ttk.Label(info, text=f"Early preparation: {data['early_preparation_ideas']}", wraplength=760, justify="left").pack(anchor="w", pady=2)
+                ttk.Label(info, text=f"Required strengths: {data_for_plan['required_strengths']}", wraplength=760, justify="left").pack(anchor="w", pady=2)
+                ttk.Label(info, text=f"Key subjects: {data_for_plan['key_subjects']}", wraplength=760, justify="left").pack(anchor="w", pady=2)
+                ttk.Label(info, text=f"Early preparation: {data_for_plan['early_preparation_ideas']}", wraplength=760, justify="left").pack(anchor="w", pady=2)
 
                 # Show careers only for Plan A by default (most relevant)
                 if plan_label == "Plan A":
@@ -1047,7 +1155,7 @@ class ResultsScreen(BaseScreen):
                     careers_box.pack(fill="both", expand=True, pady=(10, 0))
                     ttk.Label(careers_box, text="Career directions and entrance exams:", font=("Segoe UI", 11, "bold")).pack(anchor="w", pady=(0, 4))
 
-                    careers = services.get_career_recommendations_for_stream(s, profile)
+                    careers = data["careers"]
                     if not careers:
                         ttk.Label(careers_box, text="No careers configured yet for this stream.").pack(anchor="w")
                     else:
@@ -1065,10 +1173,10 @@ class ResultsScreen(BaseScreen):
             self.notebook.add(frame, text="Activities")
 
             ttk.Label(frame, text="Growth activities (not career-specific yet)", font=("Segoe UI", 13, "bold")).pack(anchor="w", pady=(0, 8))
-            for act in services.get_activity_suggestions(stage):
+            for act in data["activities"]:
                 ttk.Label(frame, text=f"• {act.title}: {act.description}", wraplength=760, justify="left").pack(anchor="w", pady=1)
 
-            tips = services.get_motivation_tips(stage, audience="SCHOOL")
+            tips = data["tips"]
             if tips:
                 ttk.Label(frame, text="\nMotivation tips:", font=("Segoe UI", 11, "bold")).pack(anchor="w", pady=(8, 2))
                 for t in tips:
@@ -1089,10 +1197,9 @@ class ResultsScreen(BaseScreen):
             frame = ttk.Frame(self.notebook, padding=12, style="Card.TFrame")
             self.notebook.add(frame, text="Career switch roadmap")
 
-            roadmap = services.career_switch_roadmap(user.current_role, user.target_role)
             ttk.Label(
                 frame,
-                text=roadmap,
+                text=data["roadmap"],
                 wraplength=760,
                 justify="left",
             ).pack(anchor="w")
@@ -1111,57 +1218,11 @@ class ResultsScreen(BaseScreen):
 
     def read_recommendations(self):
         """Read the current recommendations using text-to-speech."""
-        user = self.controller.current_user
-        stage = self.controller.current_stage
-        if not user or not stage:
+        if not self.controller.current_user or not self.controller.current_stage:
             return
 
-        # Stop any ongoing speech
-        self.controller.stop_speech()
-
-        # Collect text to read
-        texts_to_read = []
-        
-        if stage.code in (EducationStage.HIGH_SCHOOL, EducationStage.HIGHER_SECONDARY):
-            texts_to_read.append("Here are your stream recommendations:")
-            streams = self.controller.stream_recommendations
-            for plan_label in ["Plan A", "Plan B", "Plan C"]:
-                if plan_label in streams:
-                    data = streams[plan_label]
-                    s = data["stream"]
-                    texts_to_read.append(f"{plan_label}: {s.name} stream.")
-                    texts_to_read.append(data["explanation"])
-                    
-                    # For Plan A, also read career directions
-                    if plan_label == "Plan A":
-                        careers = services.get_career_recommendations_for_stream(s, 
-                            services.InterestProfile.from_option_scores(self.controller.interest_answers))
-                        if careers:
-                            texts_to_read.append("Career directions for this stream:")
-                            for c in careers:
-                                texts_to_read.append(f"{c['name']}. {c['why_fit']}")
-        elif stage.code in (EducationStage.PRIMARY, EducationStage.MIDDLE):
-            texts_to_read.append("Here are growth activities for your stage:")
-            for act in services.get_activity_suggestions(stage):
-                texts_to_read.append(f"{act.title}. {act.description}")
-            
-            tips = services.get_motivation_tips(stage, audience="SCHOOL")
-            if tips:
-                texts_to_read.append("Here are some motivation tips:")
-                for t in tips:
-                    texts_to_read.append(t.text)
-        elif stage.code in (EducationStage.UG, EducationStage.PG):
-            texts_to_read.append("We will suggest skill paths based on your interests and education level. You can then track progress step by step.")
-        elif stage.code == EducationStage.PROFESSIONAL:
-            texts_to_read.append("Here is your career switch roadmap:")
-            roadmap = services.career_switch_roadmap(user.current_role, user.target_role)
-            texts_to_read.append(roadmap)
-        else:
-            texts_to_read.append("Counselor mode: focus on the student's curiosities, comfort with subjects, and wellbeing. Use this tool as a guide, and combine it with your own observations.")
-
-        # Speak all collected text
-        full_text = " ".join(texts_to_read)
-        self.controller.speak_text(full_text)
+        # Same session the tabs were rendered from, so nothing is recomputed
+        self.controller.speak_text(sessions.current(self.controller).results_read_aloud())
 
 
 class SkillRoadmapScreen(BaseScreen):
@@ -1199,21 +1260,21 @@ class SkillRoadmapScreen(BaseScreen):
         if not user or not stage:
             return
 
-        stream = None
-        if self.controller.stream_recommendations:
-            best = self.controller.stream_recommendations.get("Plan A")
-            if best:
-                stream = best["stream"]
+        self.load_async(self._load, self._render, sessions.current(self.controller))
 
-        profile = services.InterestProfile.from_option_scores(self.controller.interest_answers)
-        paths = services.get_skill_paths_for_target(stage, stream, getattr(user, "target_role", ""), profile)
-        if not paths:
+    def _load(self, session):
+        """Resolve the plan paths and their steps; runs on a worker thread."""
+        return session.skill_paths()
+
+    def _render(self, plans):
+        self._clear_tabs()
+        if not plans:
             frame = ttk.Frame(self.notebook, padding=12, style="Card.TFrame")
             self.notebook.add(frame, text="No paths")
             ttk.Label(frame, text="No skill paths defined yet. Admin can add them in Django admin.").pack(anchor="w")
             return
 
-        for label, path in paths.items():
+        for label, path, steps in plans:
             frame = ttk.Frame(self.notebook, padding=12, style="Card.TFrame")
             self.notebook.add(frame, text=label)
             self.plan_paths[label] = path
@@ -1234,7 +1295,7 @@ class SkillRoadmapScreen(BaseScreen):
             tree.column("time", width=80)
             tree.pack(fill="both", expand=True, pady=(4, 0))
 
-            for step in path.steps.all():
+            for step in steps:
                 level_text = dict(step.LEVEL_CHOICES).get(step.level, step.level)
                 tree.insert(
                     "",
@@ -1276,44 +1337,10 @@ class SkillRoadmapScreen(BaseScreen):
 
     def read_roadmaps(self):
         """Read the current skill roadmaps using text-to-speech."""
-        user = self.controller.current_user
-        stage = self.controller.current_stage
-        if not user or not stage:
+        if not self.controller.current_user or not self.controller.current_stage:
             return
 
-        # Stop any ongoing speech
-        self.controller.stop_speech()
-
-        # Collect text to read
-        texts_to_read = ["Here are your skill path roadmaps:"]
-        
-        stream = None
-        if self.controller.stream_recommendations:
-            best = self.controller.stream_recommendations.get("Plan A")
-            if best:
-                stream = best["stream"]
-
-        profile = services.InterestProfile.from_option_scores(self.controller.interest_answers)
-        paths = services.get_skill_paths_for_target(stage, stream, getattr(user, "target_role", ""), profile)
-        if not paths:
-            texts_to_read.append("No skill paths are currently defined.")
-        else:
-            for label, path in paths.items():
-                texts_to_read.append(f"{label}: {path.name}.")
-                if path.description:
-                    texts_to_read.append(path.description)
-                
-                # Read steps
-                steps = list(path.steps.all())
-                if steps:
-                    texts_to_read.append("Steps for this path:")
-                    for i, step in enumerate(steps, 1):
-                        level_text = dict(step.LEVEL_CHOICES).get(step.level, step.level)
-                        texts_to_read.append(f"Step {i}: {step.skill.name}, {level_text}, {step.difficulty.label} difficulty, estimated time: {step.estimated_weeks} weeks.")
-
-        # Speak all collected text
-        full_text = " ".join(texts_to_read)
-        self.controller.speak_text(full_text)
+        self.controller.speak_text(sessions.current(self.controller).skill_paths_read_aloud())
 
 
 class ProgressScreen(BaseScreen):
@@ -1357,6 +1384,12 @@ class ProgressScreen(BaseScreen):
         # Double-click to quickly advance status (Not started -> In progress -> Completed)
         self.tree.bind("<Double-1>", self._on_double_click)
 
+        # Progress rows shown in the tree, keyed by tree item id, and the summary they add up to
+        self._rows = {}
+        self._path = None
+        self._summary = None
+        self._milestones = []
+
         btn_frame = ttk.Frame(self.card)
         btn_frame.pack(fill="x", pady=(5, 0))
         ttk.Button(btn_frame, text="Mark as In Progress", command=lambda: self.update_status("IN_PROGRESS")).pack(side="left")
@@ -1377,11 +1410,34 @@ class ProgressScreen(BaseScreen):
         if not user or not stage:
             return
 
-        # Pick first path for this user (from progress records)
+        self.load_async(self._load, self._render, user)
+
+    def _load(self, user):
+        """Read progress rows, summary and badges; runs on a worker thread."""
         from recommender.models import UserSkillProgress
 
-        qs = UserSkillProgress.objects.filter(user_profile=user).select_related("step__skill", "skill_path")
-        if not qs.exists():
+        # Write any queued status changes before reading progress back
+        services.flush_progress_events()
+
+        # Pick first path for this user (from progress records)
+        rows = list(UserSkillProgress.objects.filter(user_profile=user).select_related("step__skill", "skill_path"))
+        if not rows:
+            return None
+        path = rows[0].skill_path
+        return {
+            "rows": rows,
+            "path": path,
+            "summary": services.compute_progress_summary(user, path),
+            "milestones": services.get_user_milestones(user),
+        }
+
+    def _render(self, data):
+        for row in self.tree.get_children():
+            self.tree.delete(row)
+        self._rows.clear()
+        self._path = self._summary = None
+
+        if data is None:
             self.summary_lbl.config(text="No skill path is being tracked yet.")
             self.progress_bar["value"] = 0
             self.progress_label.config(text="0%")
@@ -1390,8 +1446,18 @@ class ProgressScreen(BaseScreen):
             self.hard_label.config(text="Hard: 0")
             return
 
-        path = qs.first().skill_path
-        summary = services.compute_progress_summary(user, path)
+        self._path = data["path"]
+        self._summary = data["summary"]
+        self._milestones = data["milestones"]
+        self._render_summary()
+
+        for p in data["rows"]:
+            self._rows[str(p.id)] = p
+            self.tree.insert("", tk.END, iid=str(p.id), values=(p.step.skill.name, self._status_display(p)))
+
+    def _render_summary(self):
+        path = self._path
+        summary = self._summary
         
         # Update progress bar
         self.progress_bar["maximum"] = 100
@@ -1421,7 +1487,7 @@ class ProgressScreen(BaseScreen):
         streak_text = f"Current streak: {summary.get('streak', 0)} days"
         
         # Get user's earned milestones
-        user_milestones = services.get_user_milestones(user)
+        user_milestones = self._milestones
         
         self.summary_lbl.config(
             text=(
@@ -1444,49 +1510,28 @@ class ProgressScreen(BaseScreen):
             current_text = self.summary_lbl.cget("text")
             self.summary_lbl.config(text=current_text + milestone_text)
 
-        for p in qs:
-            # Add milestone indicator to status if achieved
-            status_display = p.get_status_display()
-            if p.milestone_achieved:
-                status_display += " 🏆"
-            
-            self.tree.insert("", tk.END, iid=str(p.id), values=(p.step.skill.name, status_display))
+    def _status_display(self, prog) -> str:
+        # Add milestone indicator to status if achieved
+        status_display = prog.get_status_display()
+        if prog.milestone_achieved:
+            status_display += " 🏆"
+        return status_display
 
     def update_status(self, status_code: str):
-        from recommender.models import UserSkillProgress
-        from recommender import services
-
         sel = self.tree.selection()
         if not sel:
             messagebox.showinfo("Select a step", "Please select a skill step to update.")
             return
 
-        prog_id = int(sel[0])
-        try:
-            prog = UserSkillProgress.objects.get(id=prog_id)
-        except UserSkillProgress.DoesNotExist:
-            return
-        
-        # Use the new service function to update progress
-        services.update_skill_step_progress(
-            user=prog.user_profile,
-            step=prog.step,
-            status=status_code
-        )
-        self.on_show()
+        self._record_status(sel[0], status_code)
 
     def _on_double_click(self, event):
         """Advance status in a simple cycle when the user double-clicks a row."""
         from recommender.models import UserSkillProgress
-        from recommender import services
 
         item_id = self.tree.identify_row(event.y)
-        if not item_id:
-            return
-
-        try:
-            prog = UserSkillProgress.objects.get(id=int(item_id))
-        except UserSkillProgress.DoesNotExist:
+        prog = self._rows.get(item_id)
+        if prog is None:
             return
 
         if prog.status == UserSkillProgress.NOT_STARTED:
@@ -1497,13 +1542,24 @@ class ProgressScreen(BaseScreen):
             # Already completed; keep as-is
             return
 
-        # Use the new service function to update progress
-        services.update_skill_step_progress(
-            user=prog.user_profile,
-            step=prog.step,
-            status=new_status
+        self._record_status(item_id, new_status)
+
+    def _record_status(self, item_id: str, status_code: str):
+        """Queue a status change and patch the changed row and the summary in place."""
+        prog = self._rows.get(item_id)
+        if prog is None or prog.status == status_code:
+            return
+
+        delta = services.record_skill_step_status(
+            self.controller.current_user, prog.step, prog.status, status_code
         )
-        self.on_show()
+        prog.status = status_code
+        self.tree.item(item_id, values=(prog.step.skill.name, self._status_display(prog)))
+
+        # The summary only covers the tracked path
+        if self._summary is not None and prog.skill_path_id == self._path.id:
+            self._summary = services.apply_progress_summary_delta(self._summary, delta)
+            self._render_summary()
 
 
 class DashboardScreen(BaseScreen):
@@ -1530,6 +1586,13 @@ class DashboardScreen(BaseScreen):
         ttk.Button(nav, text="Back", command=lambda: controller.show_frame("ProgressScreen")).pack(side="left")
 
     def on_show(self):
+        user = self.controller.current_user
+        if not user:
+            return
+        # Cached per user until progress or milestones change; a miss runs on a worker thread
+        self.load_async(services.get_dashboard, self._render, user)
+
+    def _render(self, data):
         # Clear previous content
         for child in self.stats_frame.winfo_children():
             child.destroy()
@@ -1540,35 +1603,22 @@ class DashboardScreen(BaseScreen):
         for child in self.activity_frame.winfo_children():
             child.destroy()
         
-        user = self.controller.current_user
-        if not user:
-            return
-            
-        # Get user's progress data
-        from recommender.models import UserSkillProgress
-        from recommender import services
-        
         # Stats section
         stats_title = ttk.Label(self.stats_frame, text="Overview", font=("Segoe UI", 12, "bold"))
         stats_title.pack(anchor="w", pady=(0, 10))
         
-        # Get all user progress records
-        user_progress = UserSkillProgress.objects.filter(user_profile=user)
-        
-        if not user_progress.exists():
+        total_steps = data["total"]
+        if not total_steps:
             ttk.Label(self.stats_frame, text="No progress data available yet.").pack(anchor="w")
             return
             
         # Calculate statistics
-        total_steps = user_progress.count()
-        completed_steps = user_progress.filter(status=UserSkillProgress.COMPLETED).count()
-        in_progress_steps = user_progress.filter(status=UserSkillProgress.IN_PROGRESS).count()
-        not_started_steps = user_progress.filter(status=UserSkillProgress.NOT_STARTED).count()
-        
-        completion_rate = int(round((completed_steps / total_steps) * 100)) if total_steps > 0 else 0
+        completed_steps = data["completed"]
+        in_progress_steps = data["in_progress"]
+        completion_rate = data["completion_rate"]
         
         # Get milestones
-        user_milestones = services.get_user_milestones(user)
+        user_milestones = data["milestones"]
         milestones_count = len(user_milestones)
         
         # Display stats in a grid
@@ -1608,11 +1658,7 @@ class DashboardScreen(BaseScreen):
         
         ttk.Label(difficulty_chart, text="Difficulty Distribution:", font=("Segoe UI", 10, "bold")).pack(anchor="w")
         
-        # Calculate difficulty distribution
-        difficulty_counts = {"Easy": 0, "Medium": 0, "Hard": 0}
-        for prog in user_progress.select_related("step__difficulty"):
-            label = prog.step.difficulty.label
-            difficulty_counts[label] = difficulty_counts.get(label, 0) + 1
+        difficulty_counts = data["difficulty"]
         
         # Display as simple bar chart using text
         chart_text = ""
@@ -1663,21 +1709,34 @@ class HistoryScreen(BaseScreen):
         nav = ttk.Frame(self.card)
         nav.pack(fill="x", pady=(10, 0))
         ttk.Button(nav, text="Back", command=lambda: controller.show_frame("ProgressScreen")).pack(side="left")
+        ttk.Button(nav, text="Load older", command=self.load_older).pack(side="left", padx=(5, 0))
         ttk.Button(nav, text="Analytics", command=lambda: controller.show_frame("AnalyticsScreen")).pack(side="right")
 
     def on_show(self):
         self.listbox.delete(0, tk.END)
         self.text.delete("1.0", tk.END)
+        self.histories = []
+        self.load_older()
 
-        from recommender.models import RecommendationHistory
-
+    def load_older(self):
+        """Append the next 20 sessions; past the retention period they come from the archives."""
         user = self.controller.current_user
         if not user:
             return
 
-        self.histories = list(RecommendationHistory.objects.filter(user_profile=user).order_by("-created_at")[:20])
-        for h in self.histories:
-            self.listbox.insert(tk.END, f"{h.created_at:%Y-%m-%d %H:%M} - {h.stage_snapshot}")
+        last = self.histories[-1] if self.histories else None
+        before = (last.created_at, last.id) if last else None
+        self.load_async(self._load, self._append, user, before)
+
+    def _load(self, user, before):
+        """Read one page, opening the monthly archive files if needed; runs on a worker thread."""
+        return services.get_user_history(user, limit=20, before=before)
+
+    def _append(self, page):
+        self.histories.extend(page)
+        for h in page:
+            suffix = " (archived)" if getattr(h, "archived", False) else ""
+            self.listbox.insert(tk.END, f"{h.created_at:%Y-%m-%d %H:%M} - {h.stage_snapshot}{suffix}")
 
     def on_select(self, event=None):
         if not hasattr(self, "histories"):
@@ -1688,7 +1747,10 @@ class HistoryScreen(BaseScreen):
         idx = sel[0]
         h = self.histories[idx]
         self.text.delete("1.0", tk.END)
-        self.text.insert(tk.END, f"Input: {h.input_data}\n\nStreams: {h.output_streams}\n\nSkills: {h.output_skill_paths}")
+        self.text.insert(
+            tk.END,
+            f"Input: {json.dumps(h.inputs)}\n\nStreams: {json.dumps(h.streams)}\n\nSkills: {json.dumps(h.skill_paths)}",
+        )
 
 
 class AnalyticsScreen(BaseScreen):
@@ -1709,10 +1771,22 @@ class AnalyticsScreen(BaseScreen):
 
     def on_show(self):
         self.text.delete("1.0", tk.END)
-        most_stream = services.offline_analytics_most_chosen_stream()
-        most_path = services.offline_analytics_most_popular_skill_path()
+        self.load_async(services.get_analytics_snapshot, self._render)
 
-        self.text.insert(tk.END, "Offline usage summary (based on saved sessions):\n\n")
+    def _render(self, snapshot):
+        self.text.delete("1.0", tk.END)
+        most_stream = snapshot["most_chosen_stream"]
+        most_path = snapshot["most_popular_skill_path"]
+
+        self.text.insert(tk.END, "Offline usage summary (based on saved sessions):\n")
+        self.text.insert(tk.END, f"(figures as of {int(snapshot['age_seconds'])} seconds ago)\n\n")
+        self.text.insert(
+            tk.END,
+            f"Users: {snapshot['total_users']}   Saved sessions: {snapshot['total_sessions']}   "
+            f"Feedback: {snapshot['total_feedback']}"
+            + (f" (avg rating {snapshot['average_rating']})" if snapshot["average_rating"] else "")
+            + "\n\n",
+        )
         if most_stream:
             self.text.insert(tk.END, f"Most frequently recommended stream: {most_stream}\n")
         else:
@@ -1723,6 +1797,20 @@ class AnalyticsScreen(BaseScreen):
         else:
             self.text.insert(tk.END, "No skill path progress data yet.\n")
 
+        # Weekly trend from the pre-aggregated rollup table
+        trend = snapshot["weekly_trend"]
+        self.text.insert(tk.END, "\nWeekly activity (last 8 weeks):\n")
+        if not trend:
+            self.text.insert(tk.END, "No rollup data yet (run update_analytics_rollups).\n")
+        for week in trend:
+            line = (
+                f"Week of {week['bucket_start']:%d %b %Y}: {week['recommendations']} recommendations, "
+                f"{week['enrollments']} enrollments, {week['completions']} completions"
+            )
+            if week["rating_count"]:
+                line += f", avg rating {week['rating_sum'] / week['rating_count']:.1f}"
+            self.text.insert(tk.END, line + "\n")
+
 
 class FeedbackScreen(BaseScreen):
     def __init__(self, parent, controller):
@@ -1798,7 +1886,7 @@ class FeedbackScreen(BaseScreen):
         suggestion = self.suggestion_text.get("1.0", tk.END).strip()
         
         try:
-            services.submit_user_feedback(
+            services.queue_user_feedback(
                 user_profile=self.controller.current_user,
                 feedback_type=feedback_type,
                 rating=rating,
@@ -1884,16 +1972,22 @@ class AccessibilitySettingsScreen(BaseScreen):
         # Initialize voice options
         self.populate_voice_options()
 
+    def on_show(self):
+        # The speech thread may still have been starting when the screen was built
+        if not self.voice_combo['values']:
+            self.populate_voice_options()
+
     def populate_voice_options(self):
         """Populate voice selection combobox with available voices."""
-        if self.controller.tts_engine:
+        # The speech thread starts with the first screen that needs it
+        if self.controller.speech.wait_ready(2.0):
             try:
-                voices = self.controller.tts_engine.getProperty('voices')
+                voices = self.controller.speech.voices
                 voice_names = [f"{voice.name} ({voice.id})" for voice in voices]
                 self.voice_combo['values'] = voice_names
                 
                 # Select current voice
-                current_voice = self.controller.tts_engine.getProperty('voice')
+                current_voice = self.controller.speech.get_property('voice')
                 for i, voice in enumerate(voices):
                     if voice.id == current_voice:
                         self.voice_combo.current(i)
@@ -1911,40 +2005,32 @@ class AccessibilitySettingsScreen(BaseScreen):
 
     def test_speech(self):
         """Test the current speech settings."""
-        if self.controller.tts_engine:
+        if self.controller.speech.available:
             try:
-                # Save current settings temporarily
-                current_rate = self.controller.tts_engine.getProperty('rate')
-                current_volume = self.controller.tts_engine.getProperty('volume')
-                
-                # Apply test settings
-                self.controller.tts_engine.setProperty('rate', self.rate_var.get())
-                self.controller.tts_engine.setProperty('volume', self.volume_var.get())
-                
-                # Speak test phrase
-                self.controller.tts_engine.say("This is a test of the text-to-speech settings.")
-                self.controller.tts_engine.runAndWait()
-                
-                # Restore previous settings
-                self.controller.tts_engine.setProperty('rate', current_rate)
-                self.controller.tts_engine.setProperty('volume', current_volume)
+                # Test settings apply to this phrase only; the speech thread restores the saved ones
+                self.controller.speech.speak(
+                    "This is a test of the text-to-speech settings.",
+                    priority=speech.HIGH,
+                    interrupt=True,
+                    properties={'rate': self.rate_var.get(), 'volume': self.volume_var.get()},
+                )
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to test speech: {str(e)}")
 
     def apply_settings(self):
         """Apply the selected accessibility settings."""
-        if self.controller.tts_engine:
+        if self.controller.speech.available:
             try:
                 # Apply settings
-                self.controller.tts_engine.setProperty('rate', self.rate_var.get())
-                self.controller.tts_engine.setProperty('volume', self.volume_var.get())
+                self.controller.speech.set_property('rate', self.rate_var.get())
+                self.controller.speech.set_property('volume', self.volume_var.get())
                 
                 # Apply voice if selected
                 if self.voice_var.get():
                     # Extract voice ID from combo box text
                     voice_text = self.voice_var.get()
                     voice_id = voice_text.split("(")[-1].rstrip(")")
-                    self.controller.tts_engine.setProperty('voice', voice_id)
+                    self.controller.speech.set_property('voice', voice_id)
                 
                 # Show success message
                 self.status_label.config(text="Settings applied successfully!")
@@ -1964,9 +2050,9 @@ class AccessibilitySettingsScreen(BaseScreen):
         self.update_volume_display(0.9)
         
         # Try to select a female voice if available
-        if self.controller.tts_engine:
+        if self.controller.speech.available:
             try:
-                voices = self.controller.tts_engine.getProperty('voices')
+                voices = self.controller.speech.voices
                 for i, voice in enumerate(voices):
                     if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
                         self.voice_combo.current(i)
@@ -1980,6 +2066,18 @@ class AccessibilitySettingsScreen(BaseScreen):
         self.after(3000, lambda: self.status_label.config(text=""))
 
 
+def report_first_window(window, screen: str, started: float):
+    """Record the time from ``started`` until ``window`` is first mapped as a timing sample."""
+    def on_map(event):
+        if event.widget is not window or getattr(window, "_startup_reported", False):
+            return
+        window._startup_reported = True
+        elapsed = instrumentation.record_startup(ScreenTiming.TK, screen, started)
+        print(f"Time to first window ({screen}): {elapsed:.0f} ms")
+
+    window.bind("<Map>", on_map, add="+")
+
+
 def show_login_window():
     """Show the login window."""
     def on_login_success(username):
@@ -1990,6 +2088,7 @@ def show_login_window():
         show_registration_window()
     
     login_window = LoginWindow(on_login_success, on_register_click)
+    report_first_window(login_window, "startup.login_window", _PROCESS_STARTED)
     login_window.mainloop()
 
 def show_registration_window():
@@ -2011,6 +2110,11 @@ def start_application(username):
         app = ScreenManager(username)
         print("ScreenManager initialized, starting mainloop...")
         app.mainloop()
+        app.tasks.shutdown()
+        app.close_speech()
+        # Write queued feedback and progress clicks before the process exits
+        services.flush_feedback()
+        services.flush_progress_events()
         print("Application closed.")
     except Exception as e:
         print(f"Error in Tkinter application: {e}")
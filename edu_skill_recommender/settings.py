@@ -121,3 +121,14 @@ STATIC_URL = 'static/'
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+# Recommendation history retention (see `python manage.py archive_history`)
+HISTORY_ARCHIVE_DIR = BASE_DIR / 'archive'
+HISTORY_RETENTION_DAYS = 180
+
+# Per-screen timing samples for `python manage.py screen_timing_report`
+SCREEN_TIMING_ENABLED = True
+
+# Pre-rendered read-aloud audio (see `python manage.py prewarm_tts_cache`)
+TTS_CACHE_DIR = BASE_DIR / 'tts_cache'
+TTS_CACHE_MAX_MB = 200
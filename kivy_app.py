@@ -1,7 +1,11 @@
 import os
 import sys
+import time
 import webbrowser
 
+# Start of the time-to-first-window measurement (Django and Kivy imports included)
+_PROCESS_STARTED = time.perf_counter()
+
 # Bootstrap Django
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 if BASE_DIR not in sys.path:
@@ -23,19 +27,196 @@ try:
     from kivy.uix.spinner import Spinner
     from kivy.uix.checkbox import CheckBox
     from kivy.uix.scrollview import ScrollView
-    from kivy.uix.popup import Popup
-    from kivy.uix.slider import Slider
+    from kivy.clock import Clock
+    from kivy.uix.recycleview import RecycleView
+    from kivy.uix.recycleview.views import RecycleDataViewBehavior
+    from kivy.uix.recycleboxlayout import RecycleBoxLayout
     from kivy.metrics import dp
-    from kivy.properties import ObjectProperty
+    from kivy.properties import BooleanProperty, ListProperty, NumericProperty, ObjectProperty, StringProperty
 except ImportError:
     print("Kivy is not installed. Please install it with 'pip install kivy' to use this interface.")
     sys.exit(1)
 
-from recommender.models import EducationStage, Question, OptionScore, Stream, UserProfile, Feedback
-from recommender import services
+from recommender.models import EducationStage, Stream, UserProfile, Feedback, ScreenTiming
+from recommender import instrumentation
+from recommender.background import ScreenLoader, TaskPool
+from recommender import session as sessions
+from recommender import services as _services
+
+# Service calls made while a screen is entered count towards its timing sample
+services = instrumentation.timed_module(_services)
+
+
+class TimedScreen(Screen):
+    """Screen whose ``on_enter`` handlers are timed (see recommender/instrumentation.py)."""
+
+    def dispatch(self, event_type, *args, **kwargs):
+        if event_type != "on_enter":
+            return super().dispatch(event_type, *args, **kwargs)
+        with instrumentation.measure_screen(ScreenTiming.KIVY, self.name):
+            return super().dispatch(event_type, *args, **kwargs)
+
+    def on_leave(self, *args):
+        # Whatever this screen was still loading is no longer wanted
+        self.manager.loader.cancel(self.name)
+
+    def load_async(self, load, render, *key, refresh=False, placeholder=None):
+        """Run ``load()`` on the worker pool and ``render(result)`` on the Kivy thread.
+
+        Results are cached briefly per screen, user and ``key``; ``refresh=True``
+        reloads. ``placeholder`` (a layout) shows a loading label meanwhile.
+        """
+        user = self.manager.current_user
+        cache_key = (self.name, user.id if user else None) + key
+
+        def timed_load():
+            with instrumentation.measure_screen(ScreenTiming.KIVY, f"{self.name}.load"):
+                return load()
+
+        def failed(error):
+            if placeholder is not None:
+                placeholder.clear_widgets()
+                placeholder.add_widget(Label(text=f"Could not load this screen: {error}", size_hint_y=None, height=dp(40)))
+
+        if placeholder is not None:
+            placeholder.clear_widgets()
+            placeholder.add_widget(Label(text="Loading…", size_hint_y=None, height=dp(40)))
+        self.manager.loader.load(self.name, cache_key, timed_load, render, on_error=failed, refresh=refresh)
+
+
+def _kivy_dispatch(callback):
+    # Clock.schedule_once is safe to call from worker threads
+    Clock.schedule_once(lambda dt: callback())
+
+
+class LazyScreenManager(ScreenManager):
+    """ScreenManager that builds each registered screen the first time it is shown.
+
+    Kivy looks screens up through ``get_screen`` when ``current`` changes, so
+    setting ``manager.current = name`` is enough to construct a screen that has
+    only been registered.
+    """
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self._factories = {}
+
+    def register(self, name, factory):
+        """Build ``factory(name=name)`` on first navigation to ``name``."""
+        self._factories[name] = factory
+
+    def get_screen(self, name):
+        factory = self._factories.pop(name, None)
+        if factory is not None:
+            with instrumentation.measure_screen(ScreenTiming.KIVY, f"{name}.build"):
+                self.add_widget(factory(name=name))
+        return super().get_screen(name)
+
+    def has_screen(self, name):
+        return name in self._factories or super().has_screen(name)
+
+
+class PagedRecycleView(RecycleView):
+    """Virtualized list over flat row dicts that asks for the next page near the bottom.
+
+    Only the rows on screen have ``viewclass`` widgets; scrolling rebinds them to
+    other dicts in ``data``. ``load_more(next_after)`` is called once per page
+    when the view is scrolled into its last 10%.
+    """
+
+    def __init__(self, viewclass, row_height, load_more=None, **kwargs):
+        super().__init__(**kwargs)
+        self.viewclass = viewclass
+        layout = RecycleBoxLayout(
+            default_size=(None, row_height),
+            default_size_hint=(1, None),
+            size_hint_y=None,
+            orientation='vertical',
+            spacing=dp(5),
+        )
+        layout.bind(minimum_height=layout.setter('height'))
+        self.add_widget(layout)
+        self.load_more = load_more
+        self.next_after = None
+        self._loading_more = False
+        self.bind(scroll_y=self._check_end)
+
+    def set_rows(self, rows, next_after):
+        self.data = rows
+        self.next_after = next_after
+        self._loading_more = False
+        self.scroll_y = 1
+
+    def append_rows(self, rows, next_after):
+        self.data.extend(rows)
+        self.next_after = next_after
+        self._loading_more = False
+
+    def _check_end(self, instance, value):
+        if value <= 0.1 and self.next_after is not None and not self._loading_more and self.load_more:
+            self._loading_more = True
+            self.load_more(self.next_after)
+
+
+class ResourceRow(RecycleDataViewBehavior, BoxLayout):
+    """One learning resource; reused for whichever row is scrolled into view."""
+
+    title = StringProperty('')
+    description = StringProperty('')
+    duration_text = StringProperty('')
+    url = StringProperty('')
 
+    def __init__(self, **kwargs):
+        super().__init__(orientation='vertical', **kwargs)
+        title_label = Label(size_hint_y=None, height=dp(40), font_size=dp(14), bold=True, halign='left')
+        title_label.bind(size=title_label.setter('text_size'))
+        self.bind(title=title_label.setter('text'))
+        self.add_widget(title_label)
+        
+        desc_label = Label(size_hint_y=None, height=dp(40), halign='left', valign='top')
+        desc_label.bind(size=desc_label.setter('text_size'))
+        self.bind(description=desc_label.setter('text'))
+        self.add_widget(desc_label)
+        
+        # Duration and action button
+        bottom_layout = BoxLayout(size_hint_y=None, height=dp(40), spacing=10)
+        duration_label = Label(size_hint_x=None, width=dp(120), halign='left')
+        self.bind(duration_text=duration_label.setter('text'))
+        bottom_layout.add_widget(duration_label)
+        
+        watch_btn = Button(text='Watch on YouTube', size_hint_x=None, width=dp(150))
+        watch_btn.bind(on_press=lambda x: webbrowser.open(self.url))
+        bottom_layout.add_widget(watch_btn)
+        self.add_widget(bottom_layout)
+
+
+class ProgressRow(RecycleDataViewBehavior, BoxLayout):
+    """One skill step with its status and an Update button."""
+
+    skill_name = StringProperty('')
+    status_text = StringProperty('')
+    status_color = ListProperty([0.7, 0.7, 0.7, 1])
+    step_id = NumericProperty(0)
+    status = StringProperty('')
+    milestone_achieved = BooleanProperty(False)
+    update_callback = ObjectProperty(None, allownone=True)
 
-class HomeScreen(Screen):
+    def __init__(self, **kwargs):
+        super().__init__(orientation='horizontal', spacing=10, **kwargs)
+        skill_label = Label(size_hint_x=0.6, halign='left')
+        self.bind(skill_name=skill_label.setter('text'))
+        self.add_widget(skill_label)
+        
+        status_label = Label(size_hint_x=0.3)
+        self.bind(status_text=status_label.setter('text'), status_color=status_label.setter('color'))
+        self.add_widget(status_label)
+        
+        action_btn = Button(text='Update', size_hint_x=0.1, font_size=dp(12))
+        action_btn.bind(on_press=lambda x: self.update_callback and self.update_callback(self))
+        self.add_widget(action_btn)
+
+
+class HomeScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -164,7 +345,7 @@ class HomeScreen(Screen):
         self.manager.current = 'stage_selection'
 
 
-class StageSelectionScreen(Screen):
+class StageSelectionScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -307,7 +488,7 @@ class StageSelectionScreen(Screen):
         self.manager.current = 'questionnaire'
 
 
-class QuestionnaireScreen(Screen):
+class QuestionnaireScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -375,7 +556,8 @@ class QuestionnaireScreen(Screen):
         if not stage:
             return
         
-        qs = Question.objects.filter(stage=stage, is_active=True)[:5]
+        # Served from the memory-mapped catalog snapshot on kiosks, else the database
+        qs = services.get_questionnaire(stage, limit=5)
         if not qs:
             no_questions = Label(
                 text='No questions defined for this stage (admin can add some).',
@@ -405,12 +587,12 @@ class QuestionnaireScreen(Screen):
             var = f"question_{q.id}"
             self.option_vars[q.id] = {"var": var, "selected": None}
             
-            for opt in q.options.all():
+            for opt in q.options:
                 opt_layout = BoxLayout(size_hint_y=None, height=dp(30))
                 checkbox = CheckBox(group=var, size_hint_x=None, width=dp(40))
                 checkbox.bind(active=lambda cb, value, opt_id=opt.id, q_id=q.id: self.on_option_select(q_id, opt_id, value))
                 
-                opt_label = Label(text=opt.option_text, halign='left')
+                opt_label = Label(text=opt.text, halign='left')
                 opt_label.bind(size=opt_label.setter('text_size'))
                 
                 opt_layout.add_widget(checkbox)
@@ -428,27 +610,8 @@ class QuestionnaireScreen(Screen):
         self.manager.current = 'stage_selection'
     
     def next_clicked(self, instance):
-        answers = []
-        for qid, var_data in self.option_vars.items():
-            opt_id = var_data["selected"]
-            if opt_id:
-                try:
-                    opt = OptionScore.objects.get(id=opt_id)
-                except OptionScore.DoesNotExist:
-                    continue
-                answers.append(
-                    {
-                        "logical": opt.logical_score,
-                        "analytical": opt.analytical_score,
-                        "creative": opt.creative_score,
-                        "practical": opt.practical_score,
-                        "people": opt.people_score,
-                        "scientific": opt.scientific_score,
-                        "design": opt.design_score,
-                    }
-                )
-        
-        self.manager.interest_answers = answers
+        selected = [var_data["selected"] for var_data in self.option_vars.values() if var_data["selected"]]
+        self.manager.interest_answers = services.get_option_scores(selected, self.manager.current_stage)
         
         stage_code = self.manager.current_stage.code if self.manager.current_stage else None
         if stage_code in (EducationStage.HIGH_SCHOOL, EducationStage.HIGHER_SECONDARY):
@@ -457,7 +620,7 @@ class QuestionnaireScreen(Screen):
             self.manager.current = 'results'
 
 
-class SubjectStrengthScreen(Screen):
+class SubjectStrengthScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -543,7 +706,7 @@ class SubjectStrengthScreen(Screen):
         self.manager.current = 'results'
 
 
-class ResultsScreen(Screen):
+class ResultsScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -614,10 +777,13 @@ class ResultsScreen(Screen):
         if not user or not stage:
             return
         
-        profile = services.InterestProfile.from_option_scores(self.manager.interest_answers)
+        # Computed once per set of answers and shared with the roadmap screen and history
+        session = sessions.current(self.manager)
+        data = session.results()
+        self.manager.loader.pool.submit(session.save_history)
         
         if stage.code in (EducationStage.HIGH_SCHOOL, EducationStage.HIGHER_SECONDARY):
-            streams = services.recommend_streams_with_explanations(profile, self.manager.subject_levels)
+            streams = data["streams"]
             self.manager.stream_recommendations = streams
             
             for plan_label in ["Plan A", "Plan B", "Plan C"]:
@@ -691,7 +857,7 @@ class ResultsScreen(Screen):
             activities_text_layout = GridLayout(cols=1, spacing=5, size_hint_y=None)
             activities_text_layout.bind(minimum_height=activities_text_layout.setter('height'))
             
-            for act in services.get_activity_suggestions(stage):
+            for act in data["activities"]:
                 act_label = Label(
                     text=f"• {act.title}: {act.description}",
                     size_hint_y=None,
@@ -732,7 +898,7 @@ class ResultsScreen(Screen):
         self.manager.current = 'professional_development'
 
 
-class SkillRoadmapScreen(Screen):
+class SkillRoadmapScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -793,15 +959,7 @@ class SkillRoadmapScreen(Screen):
         if not user or not stage:
             return
         
-        stream = None
-        if hasattr(self.manager, 'stream_recommendations') and self.manager.stream_recommendations:
-            best = self.manager.stream_recommendations.get("Plan A")
-            if best:
-                stream = best["stream"]
-        
-        # Create interest profile from user answers
-        profile = services.InterestProfile.from_option_scores(self.manager.interest_answers)
-        paths = services.get_skill_paths_for_target(stage, stream, getattr(user, "target_role", ""), profile)
+        paths = sessions.current(self.manager).skill_paths()
         if not paths:
             no_paths = Label(
                 text='No skill paths defined yet. Admin can add them in Django admin.',
@@ -824,7 +982,7 @@ class SkillRoadmapScreen(Screen):
             self.progress_bar.value = 0
             self.progress_label.text = "0%"
         
-        for label, path in paths.items():
+        for label, path, steps in paths:
             path_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(250))
             path_title = Label(
                 text=f'{path.name} ({label})',
@@ -867,7 +1025,7 @@ class SkillRoadmapScreen(Screen):
                 steps_layout.add_widget(header_label)
             
             # Steps data
-            for step in path.steps.all():
+            for step in steps:
                 level_text = dict(step.LEVEL_CHOICES).get(step.level, step.level)
                 
                 skill_label = Label(
@@ -914,7 +1072,7 @@ class SkillRoadmapScreen(Screen):
         self.manager.current = 'progress_tracking'
 
 
-class LearningResourcesScreen(Screen):
+class LearningResourcesScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -937,12 +1095,13 @@ class LearningResourcesScreen(Screen):
         desc.bind(size=desc.setter('text_size'))
         self.layout.add_widget(desc)
         
-        # Resources area
-        self.resources_scroll = ScrollView()
-        self.resources_layout = GridLayout(cols=1, spacing=10, size_hint_y=None)
-        self.resources_layout.bind(minimum_height=self.resources_layout.setter('height'))
-        self.resources_scroll.add_widget(self.resources_layout)
-        self.layout.add_widget(self.resources_scroll)
+        # Loading / empty messages
+        self.status_layout = BoxLayout(size_hint_y=None, height=dp(40))
+        self.layout.add_widget(self.status_layout)
+        
+        # Resources area: only the visible rows hold widgets
+        self.resources_view = PagedRecycleView(ResourceRow, dp(120), load_more=self.load_more_resources)
+        self.layout.add_widget(self.resources_view)
         
         # Navigation
         nav_layout = BoxLayout(size_hint_y=None, height=dp(50), spacing=10)
@@ -956,16 +1115,19 @@ class LearningResourcesScreen(Screen):
         
         self.layout.add_widget(nav_layout)
         self.add_widget(self.layout)
+        
+        self._query = None
+        self._feed_ids = ()
     
     def on_enter(self):
         self.load_resources()
     
-    def load_resources(self):
-        self.resources_layout.clear_widgets()
-        
+    def load_resources(self, refresh=False):
         user = self.manager.current_user
         stage = self.manager.current_stage
         if not user:
+            self.status_layout.clear_widgets()
+            self.resources_view.set_rows([], None)
             return
         
         # Get personalized learning resources
@@ -975,72 +1137,64 @@ class LearningResourcesScreen(Screen):
             if best:
                 stream = best["stream"]
         
-        resources = services.get_personalized_youtube_recommendations(user, stage, stream)
+        profile = services.InterestProfile.from_option_scores(self.manager.interest_answers)
+        self._query = (stage, stream, stage.id if stage else None, stream.id if stream else None, tuple(profile.to_dict().values()))
         
-        if not resources:
-            no_resources = Label(
-                text='No learning resources found. Check back later for updates.',
-                size_hint_y=None,
-                height=dp(40),
-                halign='left'
-            )
-            self.resources_layout.add_widget(no_resources)
-            return
+        def fetch():
+            # The precomputed feed comes first, then the rest of the catalog page by page
+            feed = services.get_recommendation_feed(user, stage, stream, profile)["resources"]
+            feed_ids = tuple(r["id"] for r in feed)
+            # Videos only, like the feed: every row links to YouTube
+            rows, next_after = services.page_learning_resources(stage, stream, exclude_ids=feed_ids, resource_type='VIDEO')
+            return {"feed_ids": feed_ids, "rows": feed + rows, "next_after": next_after}
         
-        for resource in resources:
-            resource_layout = BoxLayout(orientation='vertical', size_hint_y=None, height=dp(120))
-            
-            title_label = Label(
-                text=resource.title,
-                size_hint_y=None,
-                height=dp(40),
-                font_size=dp(14),
-                bold=True,
-                halign='left'
+        self.load_async(fetch, self._render_resources, *self._query[2:], refresh=refresh, placeholder=self.status_layout)
+    
+    def load_more_resources(self, after_id):
+        stage, stream = self._query[:2]
+        feed_ids = self._feed_ids
+        
+        def fetch():
+            rows, next_after = services.page_learning_resources(
+                stage, stream, after_id=after_id, exclude_ids=feed_ids, resource_type='VIDEO'
             )
-            title_label.bind(size=title_label.setter('text_size'))
-            resource_layout.add_widget(title_label)
-            
-            desc_label = Label(
-                text=resource.description or "No description available",
+            return {"rows": rows, "next_after": next_after}
+        
+        self.load_async(fetch, self._append_resources, *self._query[2:], "page", after_id)
+    
+    @staticmethod
+    def _row(resource):
+        return {
+            "title": resource["title"],
+            "description": resource["description"] or "No description available",
+            "duration_text": f"Duration: {resource['duration_minutes'] or '?'} mins",
+            "url": resource["url"],
+        }
+    
+    def _render_resources(self, data):
+        self._feed_ids = data["feed_ids"]
+        self.status_layout.clear_widgets()
+        if not data["rows"]:
+            no_resources = Label(
+                text='No learning resources found. Check back later for updates.',
                 size_hint_y=None,
                 height=dp(40),
-                halign='left',
-                valign='top'
-            )
-            desc_label.bind(size=desc_label.setter('text_size'))
-            resource_layout.add_widget(desc_label)
-            
-            # Duration and action button
-            bottom_layout = BoxLayout(size_hint_y=None, height=dp(40), spacing=10)
-            
-            duration_label = Label(
-                text=f"Duration: {resource.duration_minutes or '?'} mins",
-                size_hint_x=None,
-                width=dp(120),
                 halign='left'
             )
-            bottom_layout.add_widget(duration_label)
-            
-            watch_btn = Button(
-                text='Watch on YouTube',
-                size_hint_x=None,
-                width=dp(150)
-            )
-            watch_btn.bind(on_press=lambda x, url=resource.url: webbrowser.open(url))
-            bottom_layout.add_widget(watch_btn)
-            
-            resource_layout.add_widget(bottom_layout)
-            self.resources_layout.add_widget(resource_layout)
+            self.status_layout.add_widget(no_resources)
+        self.resources_view.set_rows([self._row(r) for r in data["rows"]], data["next_after"])
+    
+    def _append_resources(self, data):
+        self.resources_view.append_rows([self._row(r) for r in data["rows"]], data["next_after"])
     
     def back_clicked(self, instance):
         self.manager.current = 'results'
     
     def refresh_clicked(self, instance):
-        self.load_resources()
+        self.load_resources(refresh=True)
 
 
-class ProfessionalDevelopmentScreen(Screen):
+class ProfessionalDevelopmentScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -1153,7 +1307,7 @@ class ProfessionalDevelopmentScreen(Screen):
         self.load_plan()
 
 
-class ProgressTrackingScreen(Screen):
+class ProgressTrackingScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -1223,12 +1377,13 @@ class ProgressTrackingScreen(Screen):
         self.progress_layout.add_widget(self.difficulty_layout)
         self.layout.add_widget(self.progress_layout)
         
-        # Progress steps area
-        self.steps_scroll = ScrollView()
-        self.steps_layout = GridLayout(cols=1, spacing=5, size_hint_y=None)
-        self.steps_layout.bind(minimum_height=self.steps_layout.setter('height'))
-        self.steps_scroll.add_widget(self.steps_layout)
-        self.layout.add_widget(self.steps_scroll)
+        # Loading / empty messages
+        self.status_layout = BoxLayout(size_hint_y=None, height=dp(40))
+        self.layout.add_widget(self.status_layout)
+        
+        # Progress steps area: only the visible rows hold widgets
+        self.steps_view = PagedRecycleView(ProgressRow, dp(50), load_more=self.load_more_progress)
+        self.layout.add_widget(self.steps_view)
         
         # Navigation
         nav_layout = BoxLayout(size_hint_y=None, height=dp(50), spacing=10)
@@ -1250,18 +1405,71 @@ class ProgressTrackingScreen(Screen):
     def on_enter(self):
         self.load_progress()
     
-    def load_progress(self):
-        self.steps_layout.clear_widgets()
-        
+    def load_progress(self, refresh=False):
         user = self.manager.current_user
         if not user:
+            self.status_layout.clear_widgets()
+            self.steps_view.set_rows([], None)
             return
+        self.load_async(lambda: self._fetch_progress(user), self._render_progress, refresh=refresh, placeholder=self.status_layout)
+    
+    def load_more_progress(self, after_id):
+        user = self.manager.current_user
         
-        # Get user progress
+        def fetch():
+            rows, next_after = services.page_user_skill_progress(user, after_id=after_id)
+            return {"rows": rows, "next_after": next_after}
+        
+        self.load_async(fetch, self._append_progress, "page", after_id)
+    
+    def _fetch_progress(self, user):
+        """Worker thread: the summary plus the first page of steps, fully materialised."""
+        # Write any queued status changes before reading progress back
+        services.flush_progress_events()
+        
+        from recommender.models import SkillPath
+        rows, next_after = services.page_user_skill_progress(user)
+        if not rows:
+            return {"rows": [], "next_after": None, "summary": None, "milestones": []}
+        path = SkillPath.objects.get(id=rows[0]["skill_path_id"])
+        return {
+            "rows": rows,
+            "next_after": next_after,
+            "summary": services.compute_progress_summary(user, path),
+            "milestones": services.get_user_milestones(user),
+        }
+    
+    def _row(self, progress):
         from recommender.models import UserSkillProgress
-        user_progress = UserSkillProgress.objects.filter(user_profile=user).select_related("step__skill", "skill_path")
+        status_colors = {
+            'NOT_STARTED': (0.7, 0.7, 0.7, 1),
+            'IN_PROGRESS': (0.98, 0.75, 0.18, 1),
+            'COMPLETED': (0.29, 0.84, 0.35, 1)
+        }
+        
+        # Add milestone indicator to status if achieved
+        status_text = dict(UserSkillProgress.STATUS_CHOICES).get(progress["status"], progress["status"])
+        if progress["milestone_achieved"]:
+            status_text += " 🏆"
+        
+        return {
+            "skill_name": progress["skill_name"],
+            "status_text": status_text,
+            "status_color": status_colors.get(progress["status"], (0.7, 0.7, 0.7, 1)),
+            "step_id": progress["step_id"],
+            "status": progress["status"],
+            "milestone_achieved": progress["milestone_achieved"],
+            "update_callback": self.update_progress,
+        }
+    
+    def _append_progress(self, data):
+        self.steps_view.append_rows([self._row(p) for p in data["rows"]], data["next_after"])
+    
+    def _render_progress(self, data):
+        self.status_layout.clear_widgets()
+        self.steps_view.set_rows([self._row(p) for p in data["rows"]], data["next_after"])
         
-        if not user_progress.exists():
+        if not data["rows"]:
             no_progress = Label(
                 text='No progress tracked yet. Start a skill path to begin tracking.',
                 size_hint_y=None,
@@ -1269,7 +1477,7 @@ class ProgressTrackingScreen(Screen):
                 halign='left',
                 color=(0.7, 0.7, 0.7, 1)
             )
-            self.steps_layout.add_widget(no_progress)
+            self.status_layout.add_widget(no_progress)
             self.progress_bar.value = 0
             self.progress_text.text = '0% completed'
             self.easy_label.text = 'Easy: 0'
@@ -1277,9 +1485,7 @@ class ProgressTrackingScreen(Screen):
             self.hard_label.text = 'Hard: 0'
             return
         
-        # Calculate summary
-        path = user_progress.first().skill_path
-        summary = services.compute_progress_summary(user, path)
+        summary = data["summary"]
         
         # Update progress visualization
         self.progress_bar.value = summary['percent']
@@ -1310,10 +1516,8 @@ class ProgressTrackingScreen(Screen):
         # Add milestone info to the progress text
         self.progress_text.text = f"{summary['percent']}% completed | {milestones_text} | {streak_text}"
         
-        # Get user's earned milestones
-        user_milestones = services.get_user_milestones(user)
-        
         # Display earned milestones if any
+        user_milestones = data["milestones"]
         if user_milestones:
             milestone_text = "\nEarned Badges: "
             for milestone in user_milestones[:3]:  # Show only first 3
@@ -1323,52 +1527,13 @@ class ProgressTrackingScreen(Screen):
             
             # Add to progress text
             self.progress_text.text += milestone_text
-        
-        # Display steps
-        for progress in user_progress:
-            step_layout = BoxLayout(orientation='horizontal', size_hint_y=None, height=dp(50), spacing=10)
-            
-            # Skill name
-            skill_label = Label(
-                text=progress.step.skill.name,
-                size_hint_x=0.6,
-                halign='left'
-            )
-            step_layout.add_widget(skill_label)
-            
-            # Status
-            status_colors = {
-                'NOT_STARTED': (0.7, 0.7, 0.7, 1),
-                'IN_PROGRESS': (0.98, 0.75, 0.18, 1),
-                'COMPLETED': (0.29, 0.84, 0.35, 1)
-            }
-            status_color = status_colors.get(progress.status, (0.7, 0.7, 0.7, 1))
-            
-            # Add milestone indicator to status if achieved
-            status_text = progress.get_status_display()
-            if progress.milestone_achieved:
-                status_text += " 🏆"
-            
-            status_label = Label(
-                text=status_text,
-                size_hint_x=0.3,
-                color=status_color
-            )
-            step_layout.add_widget(status_label)
-            
-            # Action button
-            action_btn = Button(
-                text='Update',
-                size_hint_x=0.1,
-                font_size=dp(12)
-            )
-            action_btn.bind(on_press=lambda x, p=progress: self.update_progress(p))
-            step_layout.add_widget(action_btn)
-            
-            self.steps_layout.add_widget(step_layout)
     
-    def update_progress(self, progress):
+    def update_progress(self, row):
+        # Rows are recycled while scrolling, so copy what the popup needs
+        progress = {"skill_name": row.skill_name, "step_id": int(row.step_id), "status": row.status}
+        
         # Create popup for status selection
+        from kivy.uix.popup import Popup
         popup = Popup(
             title='Update Progress',
             size_hint=(0.8, 0.6)
@@ -1377,7 +1542,7 @@ class ProgressTrackingScreen(Screen):
         content = BoxLayout(orientation='vertical', padding=10, spacing=10)
         
         title_label = Label(
-            text=f'Update status for: {progress.step.skill.name}',
+            text=f'Update status for: {progress["skill_name"]}',
             size_hint_y=None,
             height=dp(40),
             halign='left'
@@ -1394,7 +1559,7 @@ class ProgressTrackingScreen(Screen):
             (UserSkillProgress.COMPLETED, 'Completed')
         ]
         
-        self.selected_status = progress.status
+        self.selected_status = progress["status"]
         
         for status_value, status_label in statuses:
             btn = Button(
@@ -1402,7 +1567,7 @@ class ProgressTrackingScreen(Screen):
                 size_hint_y=None,
                 height=dp(40)
             )
-            if status_value == progress.status:
+            if status_value == progress["status"]:
                 btn.background_color = (0.2, 0.7, 0.3, 1)  # Highlight current status
             
             btn.bind(on_press=lambda x, s=status_value: setattr(self, 'selected_status', s))
@@ -1427,15 +1592,23 @@ class ProgressTrackingScreen(Screen):
         popup.open()
     
     def save_progress(self, progress, popup):
-        # Use the new service function to update progress
-        from recommender import services
-        services.update_skill_step_progress(
-            user=progress.user_profile,
-            step=progress.step,
+        # Queue the change; the background writer persists it
+        services.record_skill_step_event(
+            user=self.manager.current_user,
+            step=progress["step_id"],
             status=self.selected_status
         )
         popup.dismiss()
-        self.load_progress()  # Refresh the display
+        
+        # Cached progress and dashboard views are stale now
+        self.manager.loader.invalidate()
+        
+        # Refresh once after a short pause so rapid updates share one reload
+        Clock.unschedule(self._deferred_reload)
+        Clock.schedule_once(self._deferred_reload, 0.5)
+    
+    def _deferred_reload(self, dt):
+        self.load_progress(refresh=True)
     
     def back_clicked(self, instance):
         self.manager.current = 'skill_roadmap'
@@ -1444,10 +1617,10 @@ class ProgressTrackingScreen(Screen):
         self.manager.current = 'dashboard'
     
     def refresh_clicked(self, instance):
-        self.load_progress()
+        self.load_progress(refresh=True)
 
 
-class DashboardScreen(Screen):
+class DashboardScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -1505,24 +1678,24 @@ class DashboardScreen(Screen):
     def on_enter(self):
         self.load_dashboard()
     
-    def load_dashboard(self):
+    def load_dashboard(self, refresh=False):
+        user = self.manager.current_user
+        if not user:
+            self.stats_grid.clear_widgets()
+            self.charts_layout.clear_widgets()
+            self.activity_layout.clear_widgets()
+            return
+        if refresh:
+            services.invalidate_dashboard(user.pk)
+        self.load_async(lambda: services.get_dashboard(user), self._render_dashboard, refresh=refresh, placeholder=self.stats_grid)
+    
+    def _render_dashboard(self, data):
         # Clear previous content
         self.stats_grid.clear_widgets()
         self.charts_layout.clear_widgets()
         self.activity_layout.clear_widgets()
         
-        user = self.manager.current_user
-        if not user:
-            return
-            
-        # Get user's progress data
-        from recommender.models import UserSkillProgress
-        from recommender import services
-        
-        # Get all user progress records
-        user_progress = UserSkillProgress.objects.filter(user_profile=user)
-        
-        if not user_progress.exists():
+        if not data["total"]:
             no_data = Label(
                 text='No progress data available yet.',
                 size_hint_y=None,
@@ -1533,15 +1706,12 @@ class DashboardScreen(Screen):
             return
             
         # Calculate statistics
-        total_steps = user_progress.count()
-        completed_steps = user_progress.filter(status=UserSkillProgress.COMPLETED).count()
-        in_progress_steps = user_progress.filter(status=UserSkillProgress.IN_PROGRESS).count()
-        not_started_steps = user_progress.filter(status=UserSkillProgress.NOT_STARTED).count()
+        total_steps = data["total"]
+        completed_steps = data["completed"]
+        in_progress_steps = data["in_progress"]
+        completion_rate = data["completion_rate"]
         
-        completion_rate = int(round((completed_steps / total_steps) * 100)) if total_steps > 0 else 0
-        
-        # Get milestones
-        user_milestones = services.get_user_milestones(user)
+        user_milestones = data["milestones"]
         milestones_count = len(user_milestones)
         
         # Display stats in cards
@@ -1611,11 +1781,7 @@ class DashboardScreen(Screen):
         )
         difficulty_chart.add_widget(difficulty_title)
         
-        # Calculate difficulty distribution
-        difficulty_counts = {"Easy": 0, "Medium": 0, "Hard": 0}
-        for prog in user_progress.select_related("step__difficulty"):
-            label = prog.step.difficulty.label
-            difficulty_counts[label] = difficulty_counts.get(label, 0) + 1
+        difficulty_counts = data["difficulty"]
         
         # Display as simple bar chart using text
         chart_text = ""
@@ -1700,10 +1866,10 @@ class DashboardScreen(Screen):
         self.manager.current = 'accessibility'
     
     def refresh_clicked(self, instance):
-        self.load_dashboard()
+        self.load_dashboard(refresh=True)
 
 
-class FeedbackScreen(Screen):
+class FeedbackScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -1863,7 +2029,7 @@ class FeedbackScreen(Screen):
         suggestion = self.suggestion_input.text.strip()
         
         try:
-            services.submit_user_feedback(
+            services.queue_user_feedback(
                 user_profile=self.manager.current_user,
                 feedback_type=feedback_type,
                 rating=rating,
@@ -1900,7 +2066,7 @@ class FeedbackScreen(Screen):
         self.manager.current = 'dashboard'
 
 
-class AccessibilitySettingsScreen(Screen):
+class AccessibilitySettingsScreen(TimedScreen):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.layout = BoxLayout(orientation='vertical', padding=20, spacing=10)
@@ -1945,6 +2111,7 @@ class AccessibilitySettingsScreen(Screen):
         )
         self.layout.add_widget(rate_label)
         
+        from kivy.uix.slider import Slider
         self.rate_slider = Slider(min=50, max=300, value=150)
         self.layout.add_widget(self.rate_slider)
         
@@ -2051,21 +2218,21 @@ class AccessibilitySettingsScreen(Screen):
 
 class EduSkillRecommenderApp(App):
     def build(self):
-        sm = ScreenManager()
-        
-        # Add all screens
-        sm.add_widget(HomeScreen(name='home'))
-        sm.add_widget(StageSelectionScreen(name='stage_selection'))
-        sm.add_widget(QuestionnaireScreen(name='questionnaire'))
-        sm.add_widget(SubjectStrengthScreen(name='subject_strength'))
-        sm.add_widget(ResultsScreen(name='results'))
-        sm.add_widget(SkillRoadmapScreen(name='skill_roadmap'))
-        sm.add_widget(LearningResourcesScreen(name='learning_resources'))
-        sm.add_widget(ProfessionalDevelopmentScreen(name='professional_development'))
-        sm.add_widget(ProgressTrackingScreen(name='progress_tracking'))
-        sm.add_widget(DashboardScreen(name='dashboard'))  # New dashboard screen
-        sm.add_widget(FeedbackScreen(name='feedback'))  # New feedback screen
-        sm.add_widget(AccessibilitySettingsScreen(name='accessibility'))  # New accessibility settings screen
+        sm = LazyScreenManager()
+        
+        # Register all screens; each is built on first navigation
+        sm.register('home', HomeScreen)
+        sm.register('stage_selection', StageSelectionScreen)
+        sm.register('questionnaire', QuestionnaireScreen)
+        sm.register('subject_strength', SubjectStrengthScreen)
+        sm.register('results', ResultsScreen)
+        sm.register('skill_roadmap', SkillRoadmapScreen)
+        sm.register('learning_resources', LearningResourcesScreen)
+        sm.register('professional_development', ProfessionalDevelopmentScreen)
+        sm.register('progress_tracking', ProgressTrackingScreen)
+        sm.register('dashboard', DashboardScreen)  # New dashboard screen
+        sm.register('feedback', FeedbackScreen)  # New feedback screen
+        sm.register('accessibility', AccessibilitySettingsScreen)  # New accessibility settings screen
         
         # Initialize manager attributes
         sm.current_user = None
@@ -2073,10 +2240,31 @@ class EduSkillRecommenderApp(App):
         sm.interest_answers = []
         sm.subject_levels = {}
         sm.stream_recommendations = {}
+        sm.session = None
+        
+        # ORM work for the resources, progress and dashboard screens runs off the UI thread
+        sm.loader = ScreenLoader(TaskPool(_kivy_dispatch, name="kivy-worker"))
         
         sm.current = 'home'
         return sm
 
+    def on_start(self):
+        # The first frame is drawn right after on_start returns
+        Clock.schedule_once(self._report_startup)
+
+    def _report_startup(self, dt):
+        elapsed = instrumentation.record_startup(ScreenTiming.KIVY, "startup.first_window", _PROCESS_STARTED)
+        print(f"Time to first window: {elapsed:.0f} ms", flush=True)
+        if os.environ.get("EDU_STARTUP_PROFILE"):
+            # launcher.py --profile-startup only needs the first frame
+            self.stop()
+
+    def on_stop(self):
+        self.root.loader.pool.shutdown()
+        # Write queued feedback and progress clicks before the window closes
+        services.flush_feedback()
+        services.flush_progress_events()
+
 
 if __name__ == '__main__':
     EduSkillRecommenderApp().run()
\ No newline at end of file
@@ -10,14 +10,31 @@ Requirements:
 - Python 3.8+
 - Django
 - Kivy
+
+Start-up is kept cheap: dependencies are looked up without importing them, and
+Django and Kivy are first imported by the GUI module itself. Run
+``python launcher.py --profile-startup`` to launch once with ``-X importtime``,
+exit after the first frame and print the slowest imports, the time to first
+frame and whether it met ``STARTUP_BUDGET_MS``.
 """
 
+import argparse
+import importlib.util
 import os
+import re
 import sys
-import subprocess
-import argparse
+import time
 from pathlib import Path
 
+# Time-to-interactive target: process start until the first Kivy frame is drawn
+STARTUP_BUDGET_MS = 3000
+
+# Set for the child process of --profile-startup; the GUI stops after its first frame
+PROFILE_ENV = "EDU_STARTUP_PROFILE"
+FIRST_FRAME_MARKER = "Time to first window:"
+
+_IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$")
+
 def check_python_version():
     """Check if Python version is compatible."""
     if sys.version_info < (3, 8):
@@ -26,21 +43,20 @@ def check_python_version():
         return False
     return True
 
-def check_dependencies():
-    """Check if required dependencies are installed."""
-    missing_packages = []
+def check_dependencies(report_versions=False):
+    """Check if required dependencies are installed.
     
-    try:
-        import django
-        print(f"Django version: {django.VERSION}")
-    except ImportError:
-        missing_packages.append("Django")
+    Packages are only located, not imported, unless ``report_versions`` asks
+    for their versions to be printed.
+    """
+    missing_packages = []
     
-    try:
-        import kivy
-        print(f"Kivy version: {kivy.__version__}")
-    except ImportError:
-        missing_packages.append("Kivy")
+    for module, package in (("django", "Django"), ("kivy", "Kivy")):
+        if importlib.util.find_spec(module) is None:
+            missing_packages.append(package)
+        elif report_versions:
+            mod = importlib.import_module(module)
+            print(f"{package} version: {getattr(mod, '__version__', getattr(mod, 'VERSION', '?'))}")
     
     if missing_packages:
         print(f"Missing packages: {', '.join(missing_packages)}")
@@ -73,6 +89,10 @@ def run_database_migrations():
     """Run database migrations if needed."""
     try:
         from django.core.management import execute_from_command_line
+        from recommender import fingerprints
+        if fingerprints.migrations_current():
+            print("Database schema is up to date.")
+            return True
         execute_from_command_line(['manage.py', 'migrate'])
         print("Database migrations completed.")
         return True
@@ -84,6 +104,11 @@ def seed_database():
     """Seed database with initial data."""
     try:
         from django.core.management import execute_from_command_line
+        from recommender import fingerprints
+        if fingerprints.seeds_current():
+            print("Seed data is up to date.")
+            return True
+        # Each command applies only the sections whose data changed since the last run
         print("Seeding database with initial data...")
         execute_from_command_line(['manage.py', 'seed_recommender'])
         execute_from_command_line(['manage.py', 'import_comprehensive_data'])
@@ -104,6 +129,72 @@ def launch_gui():
         print(f"Error launching GUI: {e}")
         return False
 
+def summarize_importtime(lines, top=15):
+    """Summarize ``-X importtime`` output.
+    
+    Returns the ``top`` slowest modules by cumulative time and the self time
+    summed per top-level package (all of them when ``top`` is None), both as
+    ``(name, milliseconds)`` lists sorted slowest first, plus the total import
+    time in milliseconds.
+    """
+    modules = []
+    packages = {}
+    total_us = 0
+    for line in lines:
+        match = _IMPORTTIME_LINE.match(line.rstrip("\n"))
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = int(match[1]), int(match[2]), match[3], match[4]
+        modules.append((name, cumulative_us / 1000))
+        root = name.split(".")[0]
+        packages[root] = packages.get(root, 0) + self_us / 1000
+        # Only outermost imports count towards the total; nested ones are in their cumulative time
+        if len(indent) <= 1:
+            total_us += cumulative_us
+    modules.sort(key=lambda item: item[1], reverse=True)
+    return {
+        "modules": modules[:top],
+        "packages": sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top],
+        "total_ms": total_us / 1000,
+    }
+
+
+def profile_startup(launcher_args, budget_ms=STARTUP_BUDGET_MS):
+    """Launch once under ``-X importtime``, stop at the first frame and print a start-up report.
+    
+    Returns True if the first frame was drawn within ``budget_ms``.
+    """
+    import subprocess
+    import tempfile
+
+    env = dict(os.environ, **{PROFILE_ENV: "1"})
+    command = [sys.executable, "-X", "importtime", str(Path(__file__).absolute())] + launcher_args
+    with tempfile.TemporaryFile(mode="w+") as importtime_log:
+        started = time.perf_counter()
+        child = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=importtime_log, text=True, env=env)
+        first_frame_ms = None
+        for line in child.stdout:
+            if first_frame_ms is None and line.startswith(FIRST_FRAME_MARKER):
+                first_frame_ms = (time.perf_counter() - started) * 1000
+            sys.stdout.write(line)
+        child.wait()
+        importtime_log.seek(0)
+        summary = summarize_importtime(importtime_log)
+
+    print(f"Slowest imports (cumulative, {summary['total_ms']:.0f} ms in total):")
+    for name, ms in summary["modules"]:
+        print(f"  {ms:8.1f} ms  {name}")
+    print("Import time per top-level package (self):")
+    for name, ms in summary["packages"]:
+        print(f"  {ms:8.1f} ms  {name}")
+    if first_frame_ms is None:
+        print(f"The GUI did not draw a frame (exit code {child.returncode}).")
+        return False
+    verdict = "within" if first_frame_ms <= budget_ms else "OVER"
+    print(f"Time to first frame: {first_frame_ms:.0f} ms ({verdict} the {budget_ms} ms budget)")
+    return first_frame_ms <= budget_ms
+
+
 def main():
     """Main launcher function."""
     print("=" * 50)
@@ -115,19 +206,27 @@ def main():
     parser.add_argument('--setup', action='store_true', help='Run initial setup')
     parser.add_argument('--seed', action='store_true', help='Seed database with data')
     parser.add_argument('--migrate', action='store_true', help='Run database migrations')
+    parser.add_argument(
+        '--profile-startup',
+        action='store_true',
+        help=f'Report import times and time to first frame, failing over {STARTUP_BUDGET_MS} ms',
+    )
     args = parser.parse_args()
     
+    if args.profile_startup:
+        sys.exit(0 if profile_startup([]) else 1)
+    
     # Check Python version
     if not check_python_version():
         sys.exit(1)
     
     # Check dependencies
-    if not check_dependencies():
+    if not check_dependencies(report_versions=args.setup):
         print("\nPlease install the missing dependencies and try again.")
         sys.exit(1)
     
-    # Setup Django
-    if not setup_django():
+    # Django is set up here only for maintenance; kivy_app bootstraps it on import
+    if (args.migrate or args.seed or args.setup) and not setup_django():
         print("\nFailed to setup Django environment.")
         sys.exit(1)
     
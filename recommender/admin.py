@@ -1,3 +1,5 @@
+import json
+
 from django.contrib import admin
 
 from . import models
@@ -80,9 +82,26 @@ class RecommendationRuleAdmin(admin.ModelAdmin):
 
 @admin.register(models.RecommendationHistory)
 class RecommendationHistoryAdmin(admin.ModelAdmin):
-    list_display = ("id", "user_profile", "created_at", "stage_snapshot")
-    list_filter = ("stage_snapshot", "created_at")
+    list_display = ("id", "user_profile", "created_at", "stage_snapshot", "top_stream_code", "top_career")
+    list_filter = ("stage_snapshot", "top_stream_code", "created_at")
     search_fields = ("notes",)
+    readonly_fields = ("decoded_payload",)
+
+    @admin.display(description="Payload")
+    def decoded_payload(self, obj):
+        return json.dumps(obj.decoded(), indent=2, ensure_ascii=False)
+
+
+@admin.register(models.RecommendationFeed)
+class RecommendationFeedAdmin(admin.ModelAdmin):
+    list_display = ("user_profile", "catalog_version", "generated_at")
+
+
+@admin.register(models.AnalyticsRollup)
+class AnalyticsRollupAdmin(admin.ModelAdmin):
+    list_display = ("period", "bucket_start", "stage_code", "stream_code", "skill_path", "resource_type",
+                    "recommendations", "enrollments", "completions", "feedback_count")
+    list_filter = ("period", "stage_code", "stream_code")
 
 
 @admin.register(models.UserSkillProgress)
@@ -91,6 +110,12 @@ class UserSkillProgressAdmin(admin.ModelAdmin):
     list_filter = ("status", "skill_path")
 
 
+@admin.register(models.ProgressEvent)
+class ProgressEventAdmin(admin.ModelAdmin):
+    list_display = ("user_profile", "step", "resource", "status", "progress_percent", "created_at", "compacted")
+    list_filter = ("compacted", "status")
+
+
 @admin.register(models.MotivationTip)
 class MotivationTipAdmin(admin.ModelAdmin):
     list_display = ("audience", "stage", "text")
@@ -102,3 +127,15 @@ class ActivitySuggestionAdmin(admin.ModelAdmin):
     list_display = ("title", "stage", "focus_area")
     list_filter = ("stage", "focus_area")
     search_fields = ("title",)
+
+
+@admin.register(models.ScreenTiming)
+class ScreenTimingAdmin(admin.ModelAdmin):
+    list_display = ("app", "screen", "duration_ms", "query_count", "service_ms", "created_at")
+    list_filter = ("app", "screen")
+
+
+@admin.register(models.SetupFingerprint)
+class SetupFingerprintAdmin(admin.ModelAdmin):
+    list_display = ("key", "digest", "updated_at")
+    search_fields = ("key",)
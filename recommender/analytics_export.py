@@ -0,0 +1,309 @@
+"""Chunked columnar export of history and progress tables for offline analysis.
+
+Every run appends one *part* per table under ``<output>/<table>/part-NNNNN/``:
+
+* one raw little-endian file per column (``<column>.bin``), readable with
+  ``numpy.fromfile(path, dtype=manifest_dtype)``,
+* ``<column>.dict.json`` for string columns, which are dictionary-encoded as
+  int32 codes (``-1`` is null),
+* ``manifest.json`` describing row count, dtypes, null markers and watermark.
+
+``<output>/export_state.json`` keeps a high-water mark per table so the next
+run only exports new rows (history, keyed on ``id``) or rows changed since the
+last run (progress tables, keyed on ``(updated_at, id)``). Rows are read with
+``QuerySet.iterator()`` in fixed-size chunks and written column by column, so
+memory stays flat regardless of table size.
+"""
+
+import json
+import os
+import shutil
+import sys
+from array import array
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone as dt_timezone
+from itertools import islice
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from django.db import models
+
+from .models import RecommendationHistory, UserLearningProgress, UserSkillProgress
+
+STATE_FILE = "export_state.json"
+
+# Column kinds -> (array typecode, numpy dtype string, null marker)
+INT64 = "int64"
+BOOL = "bool"
+TIMESTAMP = "timestamp"
+STRING = "string"
+
+_KINDS = {
+    INT64: ("q", "<i8", -1),
+    BOOL: ("B", "|b1", None),
+    TIMESTAMP: ("q", "<M8[us]", -(2 ** 63)),  # numpy NaT
+    STRING: ("i", "<i4", -1),
+}
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+@dataclass(frozen=True)
+class TableSpec:
+    model: type
+    columns: Sequence[Tuple[str, str]]
+    # "id" for append-only tables, "updated_at" for tables whose rows change
+    watermark: str = "id"
+
+
+TABLES: Dict[str, TableSpec] = {
+    "recommendation_history": TableSpec(
+        model=RecommendationHistory,
+        columns=[
+            ("id", INT64),
+            ("user_profile_id", INT64),
+            ("created_at", TIMESTAMP),
+            ("stage_snapshot", STRING),
+            ("top_stream_code", STRING),
+            ("top_career", STRING),
+            ("top_skill_path_id", INT64),
+        ],
+    ),
+    "user_skill_progress": TableSpec(
+        model=UserSkillProgress,
+        columns=[
+            ("id", INT64),
+            ("user_profile_id", INT64),
+            ("skill_path_id", INT64),
+            ("step_id", INT64),
+            ("status", STRING),
+            ("step_progress", INT64),
+            ("milestone_achieved", BOOL),
+            ("milestone_date", TIMESTAMP),
+            ("updated_at", TIMESTAMP),
+        ],
+        watermark="updated_at",
+    ),
+    "user_learning_progress": TableSpec(
+        model=UserLearningProgress,
+        columns=[
+            ("id", INT64),
+            ("user_profile_id", INT64),
+            ("resource_id", INT64),
+            ("status", STRING),
+            ("progress_percent", INT64),
+            ("started_at", TIMESTAMP),
+            ("completed_at", TIMESTAMP),
+            ("updated_at", TIMESTAMP),
+        ],
+        watermark="updated_at",
+    ),
+}
+
+
+def _to_micros(value: Optional[datetime]) -> int:
+    if value is None:
+        return _KINDS[TIMESTAMP][2]
+    epoch = _EPOCH if value.tzinfo else _EPOCH.replace(tzinfo=None)
+    return (value - epoch) // _MICROSECOND
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class _ColumnWriter:
+    """Append values of one column to its ``.bin`` file, one chunk at a time."""
+
+    def __init__(self, part_dir: str, name: str, kind: str):
+        self.name = name
+        self.kind = kind
+        self.typecode, self.dtype, self.null = _KINDS[kind]
+        self.path = os.path.join(part_dir, f"{name}.bin")
+        self._fh = open(self.path, "wb")
+        self._codes: Dict[str, int] = {}
+
+    def write(self, values: List[object]) -> None:
+        if self.kind == STRING:
+            encoded = [self._code(v) for v in values]
+        elif self.kind == TIMESTAMP:
+            encoded = [_to_micros(v) for v in values]
+        elif self.kind == BOOL:
+            encoded = [1 if v else 0 for v in values]
+        else:
+            encoded = [self.null if v is None else int(v) for v in values]
+
+        column = array(self.typecode, encoded)
+        if sys.byteorder != "little":
+            column.byteswap()
+        column.tofile(self._fh)
+
+    def _code(self, value: Optional[str]) -> int:
+        if value is None:
+            return -1
+        code = self._codes.get(value)
+        if code is None:
+            code = self._codes[value] = len(self._codes)
+        return code
+
+    def abort(self) -> None:
+        self._fh.close()
+
+    def close(self) -> Dict[str, object]:
+        """Finish the file and return this column's manifest entry."""
+        self._fh.close()
+        entry: Dict[str, object] = {"name": self.name, "file": os.path.basename(self.path), "dtype": self.dtype}
+        if self.null is not None:
+            entry["null"] = self.null
+        if self.kind == STRING:
+            dict_path = os.path.join(os.path.dirname(self.path), f"{self.name}.dict.json")
+            with open(dict_path, "w", encoding="utf-8") as fh:
+                json.dump(list(self._codes), fh)
+            entry["dictionary"] = os.path.basename(dict_path)
+        return entry
+
+
+def load_state(output_dir: str) -> Dict[str, Dict[str, object]]:
+    path = os.path.join(output_dir, STATE_FILE)
+    if not os.path.exists(path):
+        return {}
+    with open(path, encoding="utf-8") as fh:
+        return json.load(fh)
+
+
+def _save_state(output_dir: str, state: Dict[str, Dict[str, object]]) -> None:
+    path = os.path.join(output_dir, STATE_FILE)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as fh:
+        json.dump(state, fh, indent=2)
+    os.replace(f"{path}.tmp", path)
+
+
+def _pending_rows(spec: TableSpec, watermark: Optional[object]) -> models.QuerySet:
+    fields = [name for name, _kind in spec.columns]
+    if spec.watermark == "id":
+        qs = spec.model.objects.order_by("id")
+        if watermark is not None:
+            qs = qs.filter(id__gt=watermark)
+    else:
+        qs = spec.model.objects.order_by("updated_at", "id")
+        if watermark is not None:
+            since, last_id = _from_micros(watermark[0]), watermark[1]
+            qs = qs.filter(models.Q(updated_at__gt=since) | models.Q(updated_at=since, id__gt=last_id))
+    return qs.values_list(*fields)
+
+
+def export_table(
+    output_dir: str, name: str, spec: TableSpec, state: Dict[str, Dict[str, object]], chunk_size: int
+) -> int:
+    """Write rows past the table's watermark as a new part; returns the number of rows exported."""
+    table_state = state.setdefault(name, {"watermark": None, "parts": 0})
+    part_name = f"part-{table_state['parts']:05d}"
+    table_dir = os.path.join(output_dir, name)
+    if os.path.exists(os.path.join(table_dir, part_name)):
+        # Never write over an exported part; the state file no longer matches the directory
+        raise FileExistsError(
+            f"{os.path.join(table_dir, part_name)} already exists but {STATE_FILE} expects it to be new; "
+            f"re-export {name} with full=True (--full)"
+        )
+    tmp_dir = os.path.join(table_dir, f".{part_name}.tmp")
+    shutil.rmtree(tmp_dir, ignore_errors=True)
+    os.makedirs(tmp_dir)
+
+    writers = [_ColumnWriter(tmp_dir, column, kind) for column, kind in spec.columns]
+    id_index = [column for column, _kind in spec.columns].index("id")
+    wm_index = [column for column, _kind in spec.columns].index(spec.watermark)
+
+    rows = 0
+    last_row = None
+    try:
+        # iterator() streams from the database cursor instead of caching the whole result
+        cursor = _pending_rows(spec, table_state["watermark"]).iterator(chunk_size=chunk_size)
+        while True:
+            chunk = list(islice(cursor, chunk_size))
+            if not chunk:
+                break
+            for index, writer in enumerate(writers):
+                writer.write([row[index] for row in chunk])
+            rows += len(chunk)
+            last_row = chunk[-1]
+        columns = [writer.close() for writer in writers]
+    except BaseException:
+        for writer in writers:
+            writer.abort()
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+
+    if not rows:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        return 0
+
+    if spec.watermark == "id":
+        watermark: object = last_row[id_index]
+    else:
+        watermark = [_to_micros(last_row[wm_index]), last_row[id_index]]
+
+    with open(os.path.join(tmp_dir, "manifest.json"), "w", encoding="utf-8") as fh:
+        json.dump(
+            {
+                "table": name,
+                "rows": rows,
+                "columns": columns,
+                "watermark_column": spec.watermark,
+                "from_watermark": table_state["watermark"],
+                "to_watermark": watermark,
+            },
+            fh,
+            indent=2,
+        )
+    os.replace(tmp_dir, os.path.join(table_dir, part_name))
+
+    table_state["watermark"] = watermark
+    table_state["parts"] += 1
+    return rows
+
+
+def export_analytics(
+    output_dir: str, tables: Optional[Sequence[str]] = None, chunk_size: int = 2000, full: bool = False
+) -> Dict[str, int]:
+    """Export each table past its high-water mark; ``full=True`` starts the requested tables over.
+
+    The state of tables not listed in ``tables`` is kept either way.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    state = load_state(output_dir)
+    if full:
+        for name in tables or TABLES:
+            state.pop(name, None)
+            shutil.rmtree(os.path.join(output_dir, name), ignore_errors=True)
+
+    counts: Dict[str, int] = {}
+    for name in tables or TABLES:
+        counts[name] = export_table(output_dir, name, TABLES[name], state, chunk_size)
+        # Persist after each table so a failure later does not re-export this one
+        _save_state(output_dir, state)
+    return counts
+
+
+def read_column(part_dir: str, name: str) -> List[object]:
+    """Decode one exported column back into Python values (strings and nulls restored)."""
+    with open(os.path.join(part_dir, "manifest.json"), encoding="utf-8") as fh:
+        manifest = json.load(fh)
+    entry = next(c for c in manifest["columns"] if c["name"] == name)
+    typecode = {"<i8": "q", "<M8[us]": "q", "|b1": "B", "<i4": "i"}[entry["dtype"]]
+
+    values = array(typecode)
+    with open(os.path.join(part_dir, entry["file"]), "rb") as fh:
+        values.frombytes(fh.read())
+    if sys.byteorder != "little":
+        values.byteswap()
+
+    if "dictionary" in entry:
+        with open(os.path.join(part_dir, entry["dictionary"]), encoding="utf-8") as fh:
+            dictionary = json.load(fh)
+        return [None if code == -1 else dictionary[code] for code in values]
+    if entry["dtype"] == "|b1":
+        return [bool(v) for v in values]
+    null = entry.get("null")
+    if entry["dtype"] == "<M8[us]":
+        return [None if v == null else _from_micros(v) for v in values]
+    return [None if v == null else v for v in values]
@@ -0,0 +1,138 @@
+"""Thread pool for running ORM and service calls off a GUI main loop.
+
+GUI toolkits must only be touched from their main thread, so results are not
+delivered from the worker: each finished task hands a callback to
+``dispatch``, which the GUI supplies to run it on its own thread (a queue
+drained with Tk ``after()``, or Kivy's ``Clock.schedule_once``).
+:class:`ScreenLoader` adds per-screen cancellation and a short result cache
+on top.
+"""
+
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Hashable, Optional
+
+from django.db import close_old_connections
+
+from .caching import TTLCache
+
+Dispatch = Callable[[Callable[[], None]], None]
+
+
+class TaskPool:
+    def __init__(self, dispatch: Dispatch, max_workers: int = 3, name: str = "gui-worker"):
+        self.dispatch = dispatch
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=name)
+        self._closed = threading.Event()
+
+    def submit(
+        self,
+        func: Callable[..., object],
+        *args: object,
+        on_done: Optional[Callable[[object], None]] = None,
+        on_error: Optional[Callable[[BaseException], None]] = None,
+    ) -> Optional[Future]:
+        """Run ``func(*args)`` on a worker; ``on_done`` / ``on_error`` run via ``dispatch``."""
+        if self._closed.is_set():
+            return None
+
+        def run() -> None:
+            # Same connection hygiene Django applies around each request
+            close_old_connections()
+            try:
+                result = func(*args)
+            except Exception as e:
+                if on_error is not None:
+                    self.dispatch(lambda error=e: on_error(error))
+                else:
+                    print(f"Background task {getattr(func, '__name__', func)!s} failed: {e}")
+                return
+            finally:
+                close_old_connections()
+            if on_done is not None:
+                self.dispatch(lambda: on_done(result))
+
+        return self._executor.submit(run)
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop accepting work; queued tasks that have not started are cancelled."""
+        self._closed.set()
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class ScreenLoader:
+    """Latest-wins background loads per screen, with a short-lived result cache.
+
+    Starting a load for a screen, or calling :meth:`cancel` when the user leaves
+    it, supersedes that screen's previous load: its result is dropped and the
+    task is cancelled if it has not started yet. Results are kept for ``ttl``
+    seconds under the caller's key, so returning to a screen renders at once.
+    """
+
+    def __init__(self, pool: TaskPool, ttl: float = 15.0):
+        self.pool = pool
+        self.cache = TTLCache(ttl, name="screen-loader")
+        self._lock = threading.Lock()
+        self._tokens: Dict[str, int] = {}
+        self._futures: Dict[str, Future] = {}
+
+    def load(
+        self,
+        screen: str,
+        key: Hashable,
+        load: Callable[[], object],
+        render: Callable[[object], None],
+        on_error: Optional[Callable[[BaseException], None]] = None,
+        refresh: bool = False,
+    ) -> bool:
+        """Render ``key`` from the cache, or run ``load`` on the pool and render via dispatch.
+
+        Returns True when the result was rendered straight from the cache.
+        ``refresh=True`` skips the cache and replaces the entry.
+        """
+        token = self._supersede(screen)
+        if refresh:
+            self.cache.invalidate(key)
+        else:
+            cached = self.cache.peek(key)
+            if cached is not None:
+                render(cached)
+                return True
+
+        def done(result):
+            if self.is_current(screen, token):
+                render(result)
+
+        def failed(error):
+            if not self.is_current(screen, token):
+                return
+            if on_error is not None:
+                on_error(error)
+            else:
+                print(f"Loading {screen} failed: {error}")
+
+        future = self.pool.submit(lambda: self.cache.get(key, load)[0], on_done=done, on_error=failed)
+        with self._lock:
+            if self._tokens.get(screen) == token and future is not None:
+                self._futures[screen] = future
+        return False
+
+    def cancel(self, screen: str) -> None:
+        """Drop the pending result for ``screen`` (for example when the user leaves it)."""
+        self._supersede(screen)
+
+    def is_current(self, screen: str, token: int) -> bool:
+        with self._lock:
+            return self._tokens.get(screen) == token
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Forget one cached result, or all of them after a write."""
+        self.cache.invalidate(key)
+
+    def _supersede(self, screen: str) -> int:
+        with self._lock:
+            token = self._tokens[screen] = self._tokens.get(screen, 0) + 1
+            future = self._futures.pop(screen, None)
+        if future is not None:
+            future.cancel()
+        return token
@@ -0,0 +1,202 @@
+"""In-process buffered writers used to batch small ORM inserts off the GUI thread."""
+
+import atexit
+import threading
+import time
+from typing import Callable, List, Optional
+
+from django.db import OperationalError, connections
+
+
+class BufferFull(RuntimeError):
+    """Raised by :meth:`BufferedWriter.append` when a bounded buffer stays full."""
+
+
+def is_database_locked(error: BaseException) -> bool:
+    """True for SQLite's transient lock errors, which are worth retrying."""
+    return isinstance(error, OperationalError) and "database is locked" in str(error)
+
+
+class BufferedWriter:
+    """Collect items in memory and hand them to ``flush_func`` in batches.
+
+    Items are flushed when ``max_pending`` items are waiting, every
+    ``flush_interval`` seconds from a daemon thread, and once more at
+    interpreter exit. With ``flush_interval=None`` no thread is started and
+    callers are expected to call :meth:`flush` themselves (used by tests and
+    management commands).
+
+    With ``ring_size`` set the buffer behaves as a ring: once that many items
+    are waiting (for example because flushes keep failing) the oldest ones
+    are dropped and counted in ``dropped``. Use it for telemetry that may be
+    lost, never for user data.
+
+    With ``max_buffer`` set the buffer is bounded without losing items:
+    :meth:`append` wakes the writer and waits up to ``block_timeout`` seconds
+    for room, then raises :class:`BufferFull` so the caller can fall back.
+
+    Errors for which ``retryable(error)`` is true (for example
+    :func:`is_database_locked`) are retried up to ``retries`` times with
+    exponential backoff before the batch is put back. Any other error is not
+    going to go away, so the batch is written again one item at a time and
+    only the items that still fail are dropped (counted in ``failed``).
+
+    With ``flush_at_exit`` the writer is flushed and stopped at interpreter
+    exit; set it for module-level writers that outlive their callers.
+    """
+
+    def __init__(
+        self,
+        flush_func: Callable[[List[object]], None],
+        max_pending: int = 50,
+        flush_interval: Optional[float] = 1.0,
+        name: str = "buffered-writer",
+        ring_size: Optional[int] = None,
+        max_buffer: Optional[int] = None,
+        block_timeout: float = 2.0,
+        retryable: Optional[Callable[[BaseException], bool]] = None,
+        retries: int = 5,
+        retry_delay: float = 0.1,
+        flush_at_exit: bool = False,
+    ):
+        self.flush_func = flush_func
+        self.max_pending = max_pending
+        self.flush_interval = flush_interval
+        self.name = name
+        self.ring_size = ring_size
+        self.dropped = 0
+        self.max_buffer = max_buffer
+        self.block_timeout = block_timeout
+        self.retryable = retryable
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.failed = 0
+
+        self._pending: List[object] = []
+        self._lock = threading.Lock()
+        self._space = threading.Condition(self._lock)
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stopped = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        if flush_at_exit:
+            atexit.register(self.close)
+
+    def append(self, item: object) -> None:
+        """Queue one item; never touches the database on the caller's thread."""
+        self._ensure_thread()
+        with self._space:
+            deadline = time.monotonic() + self.block_timeout
+            while self.max_buffer is not None and len(self._pending) >= self.max_buffer:
+                self._wakeup.set()
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self._space.wait(remaining):
+                    raise BufferFull(f"{self.name}: {len(self._pending)} items waiting")
+            self._pending.append(item)
+            if self.ring_size is not None and len(self._pending) > self.ring_size:
+                overflow = len(self._pending) - self.ring_size
+                del self._pending[:overflow]
+                self.dropped += overflow
+            full = len(self._pending) >= self.max_pending
+        if full:
+            self._wakeup.set()
+
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    def flush(self) -> int:
+        """Write everything queued so far and return the number of items written."""
+        with self._flush_lock:
+            with self._space:
+                batch, self._pending = self._pending, []
+                self._space.notify_all()
+            if not batch:
+                return 0
+            try:
+                self._call_with_retries(batch)
+            except Exception as e:
+                if not self._is_retryable(e):
+                    # One bad item must not block everything queued after it
+                    return self._write_singly(batch, e)
+                # Put the batch back in front so nothing is lost; the next flush retries it.
+                self._requeue(batch)
+                raise
+            return len(batch)
+
+    def _is_retryable(self, error: BaseException) -> bool:
+        return self.retryable is not None and self.retryable(error)
+
+    def _requeue(self, batch: List[object]) -> None:
+        with self._lock:
+            self._pending[:0] = batch
+            if self.ring_size is not None and len(self._pending) > self.ring_size:
+                overflow = len(self._pending) - self.ring_size
+                del self._pending[:overflow]
+                self.dropped += overflow
+
+    def _write_singly(self, batch: List[object], error: BaseException) -> int:
+        """Write a failed batch item by item, dropping the items that fail; returns the number written."""
+        if len(batch) == 1:
+            self._drop(error)
+            return 0
+        written = 0
+        for index, item in enumerate(batch):
+            try:
+                self._call_with_retries([item])
+            except Exception as e:
+                if self._is_retryable(e):
+                    self._requeue(batch[index:])
+                    raise
+                self._drop(e)
+            else:
+                written += 1
+        return written
+
+    def _drop(self, error: BaseException) -> None:
+        self.failed += 1
+        print(f"{self.name}: dropped an item that cannot be written: {error}")
+
+    def _call_with_retries(self, batch: List[object]) -> None:
+        attempt = 0
+        while True:
+            try:
+                self.flush_func(batch)
+                return
+            except Exception as e:
+                if not self._is_retryable(e) or attempt >= self.retries:
+                    raise
+                time.sleep(self.retry_delay * 2 ** attempt)
+                attempt += 1
+
+    def close(self) -> None:
+        """Stop the background thread and flush whatever is still queued."""
+        self._stopped.set()
+        self._wakeup.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=5)
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"{self.name}: final flush failed: {e}")
+
+    def _ensure_thread(self) -> None:
+        if self.flush_interval is None or self._stopped.is_set():
+            return
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        try:
+            while not self._stopped.is_set():
+                self._wakeup.wait(self.flush_interval)
+                self._wakeup.clear()
+                try:
+                    self.flush()
+                except Exception as e:
+                    print(f"{self.name}: flush failed: {e}")
+        finally:
+            connections.close_all()
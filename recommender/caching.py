@@ -0,0 +1,99 @@
+"""Small in-process caches for values that are expensive to compute and cheap to keep."""
+
+import threading
+import time
+from typing import Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class _Flight:
+    """One in-progress computation that other callers can wait on."""
+
+    def __init__(self, generation: int):
+        self.generation = generation
+        self.done = threading.Event()
+        self.value: object = None
+        self.error: Optional[BaseException] = None
+        self.computed_at = 0.0
+
+
+class TTLCache:
+    """Keyed cache with a time-to-live, explicit invalidation and single-flight loading.
+
+    * Entries expire ``ttl`` seconds after they were computed (``ttl=None`` keeps
+      them until invalidated).
+    * :meth:`invalidate` drops one key or everything and bumps a generation
+      counter, so a computation that was already running when the data changed
+      is returned to its callers but not stored.
+    * Concurrent :meth:`get` calls for the same missing key share a single
+      computation instead of each hitting the database.
+    """
+
+    def __init__(self, ttl: Optional[float] = 60.0, name: str = "cache"):
+        self.ttl = ttl
+        self.name = name
+        self._lock = threading.Lock()
+        self._entries: Dict[Hashable, Tuple[object, float]] = {}
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._generations: Dict[Hashable, int] = {}
+        self._global_generation = 0
+
+    def _generation(self, key: Hashable) -> Tuple[int, int]:
+        return self._global_generation, self._generations.get(key, 0)
+
+    def get(self, key: Hashable, compute: Callable[[], T]) -> Tuple[T, float]:
+        """Return ``(value, computed_at)`` for ``key``, computing it at most once at a time."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or time.monotonic() - entry[1] < self.ttl):
+                return entry[0], entry[1]
+
+            flight = self._flights.get(key)
+            owner = flight is None
+            if owner:
+                flight = self._flights[key] = _Flight(self._generation(key))
+
+        if not owner:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.value, flight.computed_at
+
+        try:
+            flight.value = compute()
+            flight.computed_at = time.monotonic()
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+                # Only keep the result if nothing was invalidated while computing
+                if flight.error is None and flight.generation == self._generation(key):
+                    self._entries[key] = (flight.value, flight.computed_at)
+            flight.done.set()
+        return flight.value, flight.computed_at
+
+    def peek(self, key: Hashable) -> Optional[object]:
+        """Return the cached value if present and fresh, without computing it."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and (self.ttl is None or time.monotonic() - entry[1] < self.ttl):
+                return entry[0]
+        return None
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop one key (or every key when ``key`` is None)."""
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._global_generation += 1
+            else:
+                self._entries.pop(key, None)
+                self._generations[key] = self._generations.get(key, 0) + 1
+
+
+def age_seconds(computed_at: float) -> float:
+    """Seconds since a ``computed_at`` value returned by :meth:`TTLCache.get`."""
+    return max(0.0, time.monotonic() - computed_at)
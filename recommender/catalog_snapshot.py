@@ -0,0 +1,194 @@
+"""Read-only, memory-mapped catalog snapshot for kiosk clients.
+
+The snapshot is a single binary file written by ``manage.py export_catalog_snapshot``:
+
+* a fixed header (magic, format version, catalog version, export time, section sizes),
+* a UTF-8 JSON section with the catalog rows (stages, streams, careers, skill paths,
+  questions and learning resources),
+* an int32 little-endian matrix with one row of interest scores per answer option.
+
+This module only uses the standard library so it can be imported without
+``django.setup()``. The option score matrix is exposed as a ``memoryview``
+over the mapped file, so reading scores never copies them.
+"""
+
+import json
+import mmap
+import os
+import struct
+import sys
+import time
+from typing import Dict, Iterable, List, Optional
+
+MAGIC = b"EDUCAT01"
+FORMAT_VERSION = 1
+
+# magic, format version, catalog version, exported at, json offset, json length, scores offset, option count
+HEADER = struct.Struct("<8sIId4Q")
+
+# Column order of the option score matrix; matches InterestProfile fields
+SCORE_FIELDS = ("logical", "analytical", "creative", "practical", "people", "scientific", "design")
+
+ENV_VAR = "EDU_CATALOG_SNAPSHOT"
+
+
+class SnapshotError(Exception):
+    """Raised when a snapshot file is missing, truncated or of an unknown format."""
+
+
+def write_snapshot(
+    path: str,
+    catalog: Dict[str, list],
+    option_scores: Iterable[Iterable[int]],
+    catalog_version: int = 0,
+) -> int:
+    """Write ``catalog`` and the option score rows to ``path`` atomically.
+
+    Each entry in ``catalog["questions"][i]["options"]`` must carry a ``row``
+    index into ``option_scores``. Returns the number of bytes written.
+    """
+    body = json.dumps(catalog, separators=(",", ":")).encode("utf-8")
+    rows = [tuple(int(v) for v in row) for row in option_scores]
+    for row in rows:
+        if len(row) != len(SCORE_FIELDS):
+            raise ValueError(f"Option score rows need {len(SCORE_FIELDS)} columns, got {len(row)}")
+
+    json_offset = HEADER.size
+    # Align the int32 matrix to 8 bytes so the mapped view is naturally aligned
+    scores_offset = (json_offset + len(body) + 7) // 8 * 8
+    header = HEADER.pack(
+        MAGIC, FORMAT_VERSION, catalog_version, time.time(), json_offset, len(body), scores_offset, len(rows)
+    )
+    matrix = struct.pack(f"<{len(rows) * len(SCORE_FIELDS)}i", *(v for row in rows for v in row))
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as fh:
+        fh.write(header)
+        fh.write(body)
+        fh.write(b"\0" * (scores_offset - json_offset - len(body)))
+        fh.write(matrix)
+    # Readers holding the old file keep their mapping; new readers see the new one
+    os.replace(tmp_path, path)
+    return scores_offset + len(matrix)
+
+
+class CatalogSnapshot:
+    """Read-only view over a snapshot file. Use as a context manager or call :meth:`close`."""
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, "rb") as fh:
+            try:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+            except ValueError as e:  # empty file
+                raise SnapshotError(f"{path}: {e}") from e
+
+        try:
+            self._load()
+        except Exception:
+            self._mm.close()
+            raise
+
+    def _load(self) -> None:
+        if len(self._mm) < HEADER.size:
+            raise SnapshotError(f"{self.path}: truncated header")
+        (magic, fmt, catalog_version, exported_at, json_offset, json_len, scores_offset, option_count) = (
+            HEADER.unpack_from(self._mm, 0)
+        )
+        if magic != MAGIC or fmt != FORMAT_VERSION:
+            raise SnapshotError(f"{self.path}: not a catalog snapshot (format {fmt})")
+
+        width = len(SCORE_FIELDS)
+        scores_end = scores_offset + option_count * width * 4
+        if scores_end > len(self._mm):
+            raise SnapshotError(f"{self.path}: truncated score matrix")
+
+        self.catalog_version = catalog_version
+        self.exported_at = exported_at
+        self.option_count = option_count
+        self.catalog = json.loads(self._mm[json_offset:json_offset + json_len].decode("utf-8"))
+
+        self._raw = memoryview(self._mm)[scores_offset:scores_end]
+        if sys.byteorder == "little":
+            # Zero-copy: int32 view straight over the mapped pages
+            self._scores = self._raw.cast("i")
+        else:
+            import array
+
+            swapped = array.array("i", self._raw.tobytes())
+            swapped.byteswap()
+            self._scores = memoryview(swapped)
+
+        self._option_rows: Dict[int, int] = {}
+        self._questions_by_stage: Dict[Optional[int], List[dict]] = {}
+        for question in sorted(self.catalog.get("questions", []), key=lambda q: q["id"]):
+            self._questions_by_stage.setdefault(question.get("stage_id"), []).append(question)
+            for option in question.get("options", []):
+                self._option_rows[option["id"]] = option["row"]
+
+    @property
+    def option_scores(self) -> memoryview:
+        """Flat int32 view of the score matrix (``option_count`` rows of ``len(SCORE_FIELDS)``)."""
+        return self._scores
+
+    def option_score_row(self, option_id: int) -> Optional[memoryview]:
+        """Zero-copy view of one option's scores, in ``SCORE_FIELDS`` order."""
+        row = self._option_rows.get(option_id)
+        if row is None:
+            return None
+        width = len(SCORE_FIELDS)
+        return self._scores[row * width:(row + 1) * width]
+
+    def option_scores_dict(self, option_id: int) -> Optional[Dict[str, int]]:
+        """Scores for one option keyed like ``InterestProfile.from_option_scores`` expects."""
+        row = self.option_score_row(option_id)
+        if row is None:
+            return None
+        return dict(zip(SCORE_FIELDS, row))
+
+    def questions_for_stage(self, stage_id: Optional[int], limit: Optional[int] = None) -> List[dict]:
+        """Active questions for a stage in id order, each with its ``options`` list."""
+        questions = [q for q in self._questions_by_stage.get(stage_id, []) if q.get("is_active", True)]
+        return questions[:limit] if limit is not None else questions
+
+    def rows(self, table: str) -> List[dict]:
+        """All exported rows of one catalog table, e.g. ``"streams"`` or ``"resources"``."""
+        return self.catalog.get(table, [])
+
+    def close(self) -> None:
+        if self._mm.closed:
+            return
+        # Views over the mapping must be released before it can be unmapped
+        self._scores.release()
+        self._raw.release()
+        try:
+            self._mm.close()
+        except BufferError:
+            # A caller still holds a row view; the mapping goes away with it
+            pass
+
+    def __enter__(self) -> "CatalogSnapshot":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+_default_snapshot: Optional[CatalogSnapshot] = None
+
+
+def get_default_snapshot() -> Optional[CatalogSnapshot]:
+    """Open the snapshot named by ``$EDU_CATALOG_SNAPSHOT`` once; None when unset or unreadable."""
+    global _default_snapshot
+    if _default_snapshot is not None:
+        return _default_snapshot
+
+    path = os.environ.get(ENV_VAR)
+    if not path:
+        return None
+    try:
+        _default_snapshot = CatalogSnapshot(path)
+    except (OSError, SnapshotError) as e:
+        print(f"Catalog snapshot unavailable, using the database: {e}")
+        return None
+    return _default_snapshot
@@ -0,0 +1,137 @@
+"""Fingerprints that let set-up skip migrations and seed data that are already applied.
+
+* The migrations fingerprint hashes the name and file contents of every
+  migration on disk. It is recorded after a ``migrate`` that left nothing
+  unapplied (see ``signals.py``). :func:`migrations_current` needs one query
+  on ``django_migrations`` and one on ``SetupFingerprint``.
+* Seed commands are split into :class:`SeedSection` s. The seed data is
+  written inline in each section's code, so a section's digest is the hash of
+  that source. :func:`apply_seed_sections` runs only the sections whose digest
+  differs from the recorded one.
+"""
+
+import hashlib
+import importlib.util
+import inspect
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple
+
+from django.apps import apps
+from django.db import DatabaseError, connection, transaction
+from django.db.migrations.loader import MigrationLoader
+from django.db.migrations.recorder import MigrationRecorder
+
+from .models import SetupFingerprint
+
+SEED_COMMANDS = ("seed_recommender", "import_comprehensive_data")
+
+
+def _migration_files() -> List[Tuple[str, Path]]:
+    """``(app_label, path)`` of every migration file of the installed apps, without importing them."""
+    files = []
+    for app_config in apps.get_app_configs():
+        module_name, _ = MigrationLoader.migrations_module(app_config.label)
+        try:
+            spec = importlib.util.find_spec(module_name) if module_name else None
+        except ModuleNotFoundError:
+            spec = None
+        if spec is None or not spec.submodule_search_locations:
+            continue
+        for location in spec.submodule_search_locations:
+            for path in Path(location).glob("*.py"):
+                if path.name != "__init__.py":
+                    files.append((app_config.label, path))
+    return sorted(files)
+
+
+def migrations_fingerprint() -> str:
+    digest = hashlib.sha256()
+    for app_label, path in _migration_files():
+        digest.update(f"{app_label}.{path.stem}\0".encode("utf-8"))
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()
+
+
+def _unapplied_migrations() -> set:
+    on_disk = {(app_label, path.stem) for app_label, path in _migration_files()}
+    return on_disk - set(MigrationRecorder(connection).applied_migrations())
+
+
+def stored(keys: Iterable[str]) -> Dict[str, str]:
+    """Recorded digests by key; empty when the table does not exist yet."""
+    try:
+        return dict(SetupFingerprint.objects.filter(key__in=list(keys)).values_list("key", "digest"))
+    except DatabaseError:
+        return {}
+
+
+def record(key: str, digest: str) -> None:
+    SetupFingerprint.objects.update_or_create(key=key, defaults={"digest": digest})
+
+
+def migrations_current() -> bool:
+    """True when every migration on disk is applied, unchanged since it was recorded."""
+    fingerprint = migrations_fingerprint()
+    if stored([SetupFingerprint.MIGRATIONS]).get(SetupFingerprint.MIGRATIONS) != fingerprint:
+        return False
+    # Catches migrations rolled back by hand after the fingerprint was recorded
+    return not _unapplied_migrations()
+
+
+def record_migrations() -> bool:
+    """Record the migrations fingerprint if nothing is left unapplied; returns whether it did."""
+    try:
+        if _unapplied_migrations():
+            return False
+        record(SetupFingerprint.MIGRATIONS, migrations_fingerprint())
+    except DatabaseError:
+        return False
+    return True
+
+
+@dataclass
+class SeedSection:
+    """One independently re-runnable part of a seed command.
+
+    ``apply`` writes the section with idempotent ``get_or_create`` calls;
+    ``sources`` are the functions whose code holds the section's data.
+    """
+
+    key: str
+    apply: Callable[[], None]
+    sources: Sequence[Callable]
+
+    def digest(self) -> str:
+        digest = hashlib.sha256()
+        for source in self.sources:
+            digest.update(inspect.getsource(source).encode("utf-8"))
+        return digest.hexdigest()
+
+
+def changed_sections(sections: Sequence[SeedSection]) -> List[Tuple[SeedSection, str]]:
+    """``(section, digest)`` for each section whose recorded digest differs, in one query."""
+    digests = [(section, section.digest()) for section in sections]
+    recorded = stored(section.key for section in sections)
+    return [(section, digest) for section, digest in digests if recorded.get(section.key) != digest]
+
+
+def apply_seed_sections(sections: Sequence[SeedSection], force: bool = False) -> List[str]:
+    """Apply the changed sections (all with ``force``) and record their digests; returns their keys."""
+    todo = [(section, section.digest()) for section in sections] if force else changed_sections(sections)
+    for section, digest in todo:
+        # A section and its fingerprint are written together, so a failed run is redone next time
+        with transaction.atomic():
+            section.apply()
+            record(section.key, digest)
+    return [section.key for section, _ in todo]
+
+
+def seeds_current() -> bool:
+    """True when no section of any seed command has changed since it was applied."""
+    from django.core.management import load_command_class
+
+    sections = []
+    for name in SEED_COMMANDS:
+        sections.extend(load_command_class("recommender", name).seed_sections())
+    return not changed_sections(sections)
@@ -0,0 +1,224 @@
+"""Per-month SQLite archives for old RecommendationHistory rows.
+
+``archive_history`` moves rows older than the retention period out of the
+main database into ``<HISTORY_ARCHIVE_DIR>/history-YYYY-MM.sqlite3`` (one file
+per calendar month of ``created_at``). Archived rows always use the compact
+payload format (see ``history_codec.py``).
+
+Rows are written to the archive and committed there before they are deleted
+from the main database, so a crash in between leaves a row in both places.
+The next run overwrites the archived copy, and :func:`user_history` skips
+archived ids that are still in the main database.
+
+:func:`user_history` reads the main database first and only opens archive
+files, newest month first, when the caller asks for more rows than it holds.
+"""
+
+import os
+import re
+import sqlite3
+from datetime import datetime, timedelta, timezone as dt_timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from . import history_codec
+from .models import RecommendationHistory, UserProfile
+
+FILE_PATTERN = re.compile(r"^history-(\d{4})-(\d{2})\.sqlite3$")
+
+_COLUMNS = (
+    "id",
+    "user_profile_id",
+    "created_at",
+    "stage_snapshot",
+    "notes",
+    "top_stream_code",
+    "top_career",
+    "top_skill_path_id",
+    "payload",
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS history (
+    id INTEGER PRIMARY KEY,
+    user_profile_id INTEGER,
+    created_at TEXT NOT NULL,
+    stage_snapshot TEXT NOT NULL,
+    notes TEXT NOT NULL,
+    top_stream_code TEXT NOT NULL,
+    top_career TEXT NOT NULL,
+    top_skill_path_id INTEGER,
+    payload BLOB NOT NULL
+);
+CREATE INDEX IF NOT EXISTS history_user_created ON history (user_profile_id, created_at);
+"""
+
+
+def archive_dir() -> str:
+    return str(getattr(settings, "HISTORY_ARCHIVE_DIR", os.path.join(settings.BASE_DIR, "archive")))
+
+
+def archive_path(year: int, month: int) -> str:
+    return os.path.join(archive_dir(), f"history-{year:04d}-{month:02d}.sqlite3")
+
+
+def archive_files() -> List[Tuple[Tuple[int, int], str]]:
+    """``((year, month), path)`` of every archive file, newest month first."""
+    directory = archive_dir()
+    if not os.path.isdir(directory):
+        return []
+    found = []
+    for name in os.listdir(directory):
+        match = FILE_PATTERN.match(name)
+        if match:
+            found.append(((int(match.group(1)), int(match.group(2))), os.path.join(directory, name)))
+    return sorted(found, reverse=True)
+
+
+def _connect(path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(path)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def _to_text(value: datetime) -> str:
+    # Fixed-width UTC ISO strings sort in time order
+    return value.astimezone(dt_timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.%f+00:00")
+
+
+def _archive_row(history: RecommendationHistory) -> Tuple[object, ...]:
+    payload = history.payload
+    if payload is None:
+        payload = history_codec.encode_history(*history_codec.legacy_parts(history))
+    return (
+        history.id,
+        history.user_profile_id,
+        _to_text(history.created_at),
+        history.stage_snapshot,
+        history.notes,
+        history.top_stream_code,
+        history.top_career,
+        history.top_skill_path_id,
+        bytes(payload),
+    )
+
+
+def archive_history(older_than_days: Optional[int] = None, batch_size: int = 500) -> Dict[str, int]:
+    """Move history rows older than ``older_than_days`` (default ``HISTORY_RETENTION_DAYS``) to the archives.
+
+    Returns how many rows were moved and how many archive files were written to.
+    """
+    if older_than_days is None:
+        older_than_days = getattr(settings, "HISTORY_RETENTION_DAYS", 180)
+    cutoff = timezone.now() - timedelta(days=older_than_days)
+    os.makedirs(archive_dir(), exist_ok=True)
+
+    moved = 0
+    touched = set()
+    while True:
+        batch = list(RecommendationHistory.objects.filter(created_at__lt=cutoff).order_by("id")[:batch_size])
+        if not batch:
+            break
+
+        by_month: Dict[Tuple[int, int], List[Tuple[object, ...]]] = {}
+        for history in batch:
+            created = history.created_at.astimezone(dt_timezone.utc)
+            by_month.setdefault((created.year, created.month), []).append(_archive_row(history))
+
+        for (year, month), rows in by_month.items():
+            conn = _connect(archive_path(year, month))
+            try:
+                with conn:
+                    conn.executemany(
+                        f"INSERT OR REPLACE INTO history ({', '.join(_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(_COLUMNS))})",
+                        rows,
+                    )
+            finally:
+                conn.close()
+            touched.add((year, month))
+
+        with transaction.atomic():
+            RecommendationHistory.objects.filter(id__in=[history.id for history in batch]).delete()
+        moved += len(batch)
+    return {"rows": moved, "files": len(touched)}
+
+
+def _from_archive(row: Tuple[object, ...]) -> RecommendationHistory:
+    values = dict(zip(_COLUMNS, row))
+    values["created_at"] = datetime.fromisoformat(values["created_at"])
+    history = RecommendationHistory(**values)
+    history.archived = True
+    return history
+
+
+def _archived_rows(user_profile_id: int, before: Optional[Tuple[datetime, int]]) -> Iterator[RecommendationHistory]:
+    """Archived rows of one user after the ``(created_at, id)`` cursor, newest first, lazily walking the monthly files."""
+    before_month = None
+    if before is not None:
+        before_utc = before[0].astimezone(dt_timezone.utc)
+        before_month = (before_utc.year, before_utc.month)
+    for month, path in archive_files():
+        if before_month is not None and month > before_month:
+            continue
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            query = f"SELECT {', '.join(_COLUMNS)} FROM history WHERE user_profile_id = ?"
+            params: List[object] = [user_profile_id]
+            if before is not None:
+                query += " AND (created_at < ? OR (created_at = ? AND id < ?))"
+                params.extend([_to_text(before[0]), _to_text(before[0]), before[1]])
+            rows = conn.execute(query + " ORDER BY created_at DESC, id DESC", params).fetchall()
+        finally:
+            conn.close()
+        for row in rows:
+            yield _from_archive(row)
+
+
+def user_history(
+    user: UserProfile, limit: int = 20, before: Optional[Tuple[datetime, int]] = None
+) -> List[RecommendationHistory]:
+    """The user's sessions newest first, across the main database and the archives.
+
+    ``before`` pages backwards: pass ``(created_at, id)`` of the last row shown.
+    The id breaks ties, so sessions saved in the same instant are not skipped.
+    Rows that came from an archive have ``archived = True`` and must not be saved.
+    """
+    qs = RecommendationHistory.objects.filter(user_profile=user).order_by("-created_at", "-id")
+    if before is not None:
+        created_at, history_id = before
+        qs = qs.filter(Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=history_id))
+    rows = list(qs[:limit])
+    if len(rows) >= limit:
+        return rows
+
+    # Every hot row before ``before`` is in ``rows`` now; archived copies of them are skipped
+    seen = {history.id for history in rows}
+    archived: List[RecommendationHistory] = []
+    for history in _archived_rows(user.id, before):
+        if history.id not in seen:
+            archived.append(history)
+        if len(archived) >= limit:
+            break
+    rows.extend(archived)
+    rows.sort(key=lambda history: (history.created_at, history.id), reverse=True)
+    return rows[:limit]
+
+
+def archived_stream_counts() -> Dict[str, int]:
+    """Plan A stream counts across every archive file (archived rows still count towards analytics)."""
+    counts: Dict[str, int] = {}
+    for _month, path in archive_files():
+        conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        try:
+            for code, count in conn.execute(
+                "SELECT top_stream_code, COUNT(*) FROM history WHERE top_stream_code != '' GROUP BY top_stream_code"
+            ):
+                counts[code] = counts.get(code, 0) + count
+        finally:
+            conn.close()
+    return counts
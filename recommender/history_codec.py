@@ -0,0 +1,73 @@
+"""Compact storage format for RecommendationHistory payloads.
+
+A compact row keeps its four payloads (inputs, streams, careers, skill paths)
+in one ``payload`` blob instead of four JSON text columns. The blob is the
+same JSON the text columns hold, model instances written as their
+``{"id", "code", "name"}`` snapshot, without whitespace and compressed with
+zlib. The text a session copied from the catalog (a stream plan's pros/cons,
+a career's description and exams) is kept as it was shown, so catalog edits
+and deletions never rewrite history, and decoding needs no queries.
+"""
+
+import json
+import zlib
+from typing import Dict, Tuple
+
+from django.db import models
+
+FORMAT_V1 = b"\x01"
+PARTS = ("inputs", "streams", "careers", "skill_paths")
+
+
+class HistoryCodecError(ValueError):
+    """Raised when a payload blob is not in a known format."""
+
+
+def _encode(value: object) -> object:
+    if isinstance(value, models.Model):
+        from .models import Stream
+
+        # The JSON form text-column rows use for a model instance
+        if isinstance(value, Stream):
+            return {"id": value.pk, "code": value.code, "name": value.name}
+        return {"id": value.pk, "name": str(value)}
+    if isinstance(value, dict):
+        return {str(key): _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return str(value)
+
+
+def encode_history(inputs: object, streams: object, careers: object, skill_paths: object) -> bytes:
+    """Encode the four history payloads (live objects or decoded legacy JSON) into one blob."""
+    document = {part: _encode(value) for part, value in zip(PARTS, (inputs, streams, careers, skill_paths))}
+    text = json.dumps(document, separators=(",", ":"), ensure_ascii=False)
+    return FORMAT_V1 + zlib.compress(text.encode("utf-8"), 9)
+
+
+def decode_history(blob: bytes) -> Dict[str, object]:
+    """Decode one blob into ``{"inputs", "streams", "careers", "skill_paths"}``."""
+    blob = bytes(blob)
+    if not blob.startswith(FORMAT_V1):
+        raise HistoryCodecError(f"unknown history payload format {blob[:1]!r}")
+    document = json.loads(zlib.decompress(blob[1:]).decode("utf-8"))
+    return {part: document.get(part) for part in PARTS}
+
+
+def legacy_parts(history: models.Model) -> Tuple[object, object, object, object]:
+    """Parse the four JSON text columns of a row saved before the compact format."""
+
+    def parse(text: str) -> object:
+        try:
+            return json.loads(text) if text else None
+        except ValueError:
+            return text
+
+    return (
+        parse(history.input_data),
+        parse(history.output_streams),
+        parse(history.output_careers),
+        parse(history.output_skill_paths),
+    )
@@ -0,0 +1,197 @@
+"""Per-screen timing for both GUIs.
+
+:func:`measure_screen` wraps one ``on_show`` / ``on_enter`` call and records
+its wall time, the ORM queries it ran on this thread (via
+``connection.execute_wrapper``) and the time spent inside ``services``
+functions called through :func:`timed_module`. Samples go into a bounded ring
+buffer that a background :class:`BufferedWriter` flushes to ``ScreenTiming``
+in batches, so measuring never writes to the database on the GUI thread.
+``python manage.py screen_timing_report`` prints the percentiles.
+"""
+
+import functools
+import threading
+import time
+import types
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Dict, Iterator, List, Optional, Sequence
+
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+from .buffering import BufferedWriter
+from .models import ScreenTiming
+
+RING_SIZE = 1000
+
+
+@dataclass
+class Sample:
+    app: str
+    screen: str
+    started: float = field(default_factory=time.perf_counter)
+    duration_ms: float = 0.0
+    query_count: int = 0
+    query_ms: float = 0.0
+    service_ms: float = 0.0
+    created_at: object = field(default_factory=timezone.now)
+
+
+def _write_samples(samples: List[Sample]) -> None:
+    ScreenTiming.objects.bulk_create(
+        [
+            ScreenTiming(
+                app=s.app,
+                screen=s.screen,
+                duration_ms=s.duration_ms,
+                query_count=s.query_count,
+                query_ms=s.query_ms,
+                service_ms=s.service_ms,
+                created_at=s.created_at,
+            )
+            for s in samples
+        ]
+    )
+
+
+_writer = BufferedWriter(
+    _write_samples, max_pending=100, flush_interval=10.0, name="screen-timing", ring_size=RING_SIZE, flush_at_exit=True
+)
+_local = threading.local()
+
+
+def enabled() -> bool:
+    return getattr(settings, "SCREEN_TIMING_ENABLED", True)
+
+
+def _active() -> List[Sample]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _count_queries(execute, sql, params, many, context):
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        elapsed = (time.perf_counter() - start) * 1000
+        for sample in _active():
+            sample.query_count += 1
+            sample.query_ms += elapsed
+
+
+@contextmanager
+def measure_screen(app: str, screen: str) -> Iterator[Optional[Sample]]:
+    """Time the enclosed screen display and queue the sample for the background flush."""
+    if not enabled():
+        yield None
+        return
+    sample = Sample(app=app, screen=screen)
+    stack = _active()
+    stack.append(sample)
+    try:
+        with connection.execute_wrapper(_count_queries):
+            yield sample
+    finally:
+        stack.remove(sample)
+        sample.duration_ms = (time.perf_counter() - sample.started) * 1000
+        _writer.append(sample)
+
+
+def record_startup(app: str, screen: str, started: float) -> float:
+    """Queue a sample from ``started`` (a ``perf_counter`` value) until now; return its milliseconds."""
+    sample = Sample(app=app, screen=screen, started=started)
+    sample.duration_ms = (time.perf_counter() - started) * 1000
+    if enabled():
+        _writer.append(sample)
+    return sample.duration_ms
+
+
+class _TimedModule:
+    """Module proxy that adds the time spent in each function call to the active samples."""
+
+    def __init__(self, module: types.ModuleType):
+        self._module = module
+        self._wrapped: Dict[str, object] = {}
+
+    def __getattr__(self, name: str) -> object:
+        value = getattr(self._module, name)
+        if not isinstance(value, types.FunctionType):
+            return value
+        wrapped = self._wrapped.get(name)
+        if wrapped is None or wrapped.__wrapped__ is not value:
+            wrapped = self._wrapped[name] = _timed(value)
+        return wrapped
+
+
+def _timed(func):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        stack = _active()
+        if not stack:
+            return func(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            for sample in stack:
+                sample.service_ms += elapsed
+
+    return wrapper
+
+
+def timed_module(module: types.ModuleType) -> _TimedModule:
+    """Wrap a service module so calls made during :func:`measure_screen` count as service time."""
+    return _TimedModule(module)
+
+
+def flush() -> int:
+    return _writer.flush()
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of an ascending sequence."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, -(-len(sorted_values) * pct // 100))
+    return sorted_values[int(rank) - 1]
+
+
+def timing_report(app: Optional[str] = None, since=None) -> List[Dict[str, object]]:
+    """p50/p95/p99 duration plus mean query count, query time and service time per screen."""
+    qs = ScreenTiming.objects.all()
+    if app:
+        qs = qs.filter(app=app)
+    if since is not None:
+        qs = qs.filter(created_at__gte=since)
+
+    grouped: Dict[tuple, List[tuple]] = {}
+    for row in qs.order_by("app", "screen", "duration_ms").values_list(
+        "app", "screen", "duration_ms", "query_count", "query_ms", "service_ms"
+    ).iterator():
+        grouped.setdefault(row[:2], []).append(row[2:])
+
+    report = []
+    for (app_code, screen), rows in grouped.items():
+        durations = [r[0] for r in rows]
+        count = len(rows)
+        report.append(
+            {
+                "app": app_code,
+                "screen": screen,
+                "samples": count,
+                "p50": percentile(durations, 50),
+                "p95": percentile(durations, 95),
+                "p99": percentile(durations, 99),
+                "queries": sum(r[1] for r in rows) / count,
+                "query_ms": sum(r[2] for r in rows) / count,
+                "service_ms": sum(r[3] for r in rows) / count,
+            }
+        )
+    report.sort(key=lambda item: item["p95"], reverse=True)
+    return report
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from recommender import history_archive
+
+
+class Command(BaseCommand):
+    help = "Move old RecommendationHistory rows into per-month SQLite archive files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-days",
+            type=int,
+            default=None,
+            help="Archive rows older than this many days (default: HISTORY_RETENTION_DAYS)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows moved per batch (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        stats = history_archive.archive_history(
+            older_than_days=options["older_than_days"], batch_size=options["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Archived {stats['rows']} history rows into {stats['files']} monthly files "
+                f"under {history_archive.archive_dir()}."
+            )
+        )
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from recommender import services
+
+
+class Command(BaseCommand):
+    help = "Fill the indexed Plan A columns of RecommendationHistory from the stored JSON outputs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Rows read and updated per batch (default: 500)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every row, not only rows whose columns are still empty",
+        )
+
+    def handle(self, *args, **options):
+        count = services.backfill_history_top_fields(
+            batch_size=options["batch_size"], only_missing=not options["all"]
+        )
+        self.stdout.write(self.style.SUCCESS(f"Backfilled {count} recommendation history rows."))
@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from recommender import services
+
+
+class Command(BaseCommand):
+    help = "Convert RecommendationHistory rows stored as JSON text columns to the compressed compact format"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=200,
+            help="Rows read and updated per batch (default: 200)",
+        )
+        parser.add_argument(
+            "--vacuum",
+            action="store_true",
+            help="Run VACUUM afterwards so SQLite returns the freed pages to the file system",
+        )
+
+    def handle(self, *args, **options):
+        stats = services.compact_history_rows(batch_size=options["batch_size"])
+        before, after = stats["bytes_before"], stats["bytes_after"]
+        ratio = f" ({before / after:.1f}x smaller)" if after else ""
+        self.stdout.write(
+            self.style.SUCCESS(f"Compacted {stats['rows']} history rows: {before} -> {after} bytes{ratio}.")
+        )
+        if options["vacuum"] and connection.vendor == "sqlite":
+            with connection.cursor() as cursor:
+                cursor.execute("VACUUM")
+            self.stdout.write(self.style.SUCCESS("Vacuumed the database."))
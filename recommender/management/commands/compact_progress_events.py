@@ -0,0 +1,19 @@
+from django.core.management.base import BaseCommand
+
+from recommender import services
+
+
+class Command(BaseCommand):
+    help = "Fold queued progress events into UserSkillProgress and UserLearningProgress"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=500,
+            help="Number of events folded per transaction (default: 500)",
+        )
+
+    def handle(self, *args, **options):
+        count = services.compact_progress_events(batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Compacted {count} progress events."))
@@ -0,0 +1,27 @@
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from recommender import services
+
+
+class Command(BaseCommand):
+    help = "Write the catalog to a memory-mapped snapshot file for kiosk clients"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=os.path.join(settings.BASE_DIR, "catalog.snapshot"),
+            help="Snapshot file to write (default: catalog.snapshot next to manage.py)",
+        )
+
+    def handle(self, *args, **options):
+        stats = services.export_catalog_snapshot(options["output"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote catalog v{stats['catalog_version']} snapshot to {options['output']} "
+                f"({stats['questions']} questions, {stats['options']} options, {stats['bytes']} bytes)."
+            )
+        )
+        self.stdout.write(f"Point kiosks at it with {services.catalog_snapshot.ENV_VAR}={options['output']}")
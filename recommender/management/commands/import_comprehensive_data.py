@@ -1,5 +1,6 @@
-import json
+import inspect
 from django.core.management.base import BaseCommand
+from recommender import fingerprints
 from recommender.models import (
     ActivitySuggestion,
     Career,
@@ -19,9 +20,46 @@ from recommender.models import (
 class Command(BaseCommand):
     help = "Import comprehensive data for the Edu & Skill Path Recommender"
 
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Apply every section even if it is unchanged")
+
     def handle(self, *args, **options):
         self.stdout.write("Importing comprehensive data...")
-        
+        applied = fingerprints.apply_seed_sections(self.seed_sections(), force=options["force"])
+        if applied:
+            self.stdout.write(self.style.SUCCESS(f"Comprehensive data import completed ({', '.join(applied)})."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Comprehensive data unchanged since the last run; nothing to do."))
+
+    def seed_sections(self):
+        def section(name, create):
+            def apply():
+                # Each create_* method names the lookups it needs as its parameters
+                lookups = self.lookups()
+                create(**{param: lookups[param] for param in inspect.signature(create).parameters})
+
+            return fingerprints.SeedSection(f"import_comprehensive_data.{name}", apply, [create])
+
+        return [
+            # Comprehensive learning resources
+            section("learning_resources", self.create_comprehensive_learning_resources),
+            # Additional questions for better profiling
+            section("questions", self.create_additional_questions),
+            # More career paths
+            section("careers", self.create_additional_careers),
+            # More activity suggestions
+            section("activities", self.create_additional_activities),
+            # More motivation tips
+            section("motivation_tips", self.create_additional_motivation_tips),
+            # More skill paths
+            section("skill_paths", self.create_additional_skill_paths),
+        ]
+
+    def lookups(self):
+        """Existing stages and streams plus the skill difficulties, read once per run."""
+        if getattr(self, "_lookups", None) is not None:
+            return self._lookups
+
         # Get existing stages
         stages = {}
         for code in [
@@ -46,26 +84,9 @@ class Command(BaseCommand):
         easy, _ = SkillDifficulty.objects.get_or_create(code=SkillDifficulty.EASY, defaults={"label": "Easy"})
         medium, _ = SkillDifficulty.objects.get_or_create(code=SkillDifficulty.MEDIUM, defaults={"label": "Medium"})
         hard, _ = SkillDifficulty.objects.get_or_create(code=SkillDifficulty.HARD, defaults={"label": "Hard"})
-        
-        # Create comprehensive learning resources
-        self.create_comprehensive_learning_resources(stages, streams, easy, medium, hard)
-        
-        # Create additional questions for better profiling
-        self.create_additional_questions(stages)
-        
-        # Create more career paths
-        self.create_additional_careers(streams)
-        
-        # Create more activity suggestions
-        self.create_additional_activities(stages)
-        
-        # Create more motivation tips
-        self.create_additional_motivation_tips(stages)
-        
-        # Create more skill paths
-        self.create_additional_skill_paths(stages, streams, easy, medium, hard)
-        
-        self.stdout.write(self.style.SUCCESS("Comprehensive data import completed."))
+
+        self._lookups = {"stages": stages, "streams": streams, "easy": easy, "medium": medium, "hard": hard}
+        return self._lookups
 
     def create_comprehensive_learning_resources(self, stages, streams, easy, medium, hard):
         """Create a comprehensive set of learning resources."""
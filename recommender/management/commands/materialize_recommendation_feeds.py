@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils import timezone
+
+from recommender import services
+from recommender.models import UserProfile
+
+
+class Command(BaseCommand):
+    help = "Precompute recommendation feeds for recently active users (intended to run nightly)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=30,
+            help="Users with progress or sessions in this many days count as active (default: 30)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Materialize feeds for every user profile",
+        )
+
+    def handle(self, *args, **options):
+        users = UserProfile.objects.select_related("education_stage").order_by("id")
+        if not options["all"]:
+            since = timezone.now() - timedelta(days=options["days"])
+            users = users.filter(
+                Q(userskillprogress__updated_at__gte=since)
+                | Q(progressevent__created_at__gte=since)
+                | Q(recommendationhistory__created_at__gte=since)
+            ).distinct()
+
+        count = 0
+        for user in users:
+            stream, profile = services.latest_session_inputs(user)
+            services.materialize_recommendation_feed(user, user.education_stage, stream, profile)
+            count += 1
+
+        self.stdout.write(self.style.SUCCESS(f"Materialized {count} recommendation feeds."))
@@ -0,0 +1,48 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from recommender import speech, tts_cache
+
+
+class Command(BaseCommand):
+    help = "Render catalog read-aloud texts into the on-disk TTS audio cache"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--rate", type=int, default=None, help="Speech rate to render with (default: app default)")
+        parser.add_argument("--volume", type=float, default=None, help="Volume to render with (default: app default)")
+        parser.add_argument("--voice", default=None, help="Voice id to render with (default: app default)")
+        parser.add_argument("--clear", action="store_true", help="Empty the cache before rendering")
+
+    def handle(self, *args, **options):
+        try:
+            engine = speech.create_pyttsx3_engine()
+        except Exception as e:
+            raise CommandError(f"Text-to-speech engine unavailable: {e}")
+        for name in ("rate", "volume", "voice"):
+            if options[name] is not None:
+                engine.setProperty(name, options[name])
+        voice, rate, volume = (engine.getProperty(name) for name in ("voice", "rate", "volume"))
+
+        cache = tts_cache.TTSCache.from_settings()
+        if options["clear"]:
+            cache.clear()
+
+        rendered = cached = failed = 0
+        seen = set()
+        for text in tts_cache.catalog_texts():
+            for sentence in speech.split_sentences(text):
+                if sentence in seen:
+                    continue
+                seen.add(sentence)
+                if cache.get(sentence, voice, rate, volume) is not None:
+                    cached += 1
+                elif cache.render(engine, sentence, voice, rate, volume) is not None:
+                    rendered += 1
+                else:
+                    failed += 1
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rendered {rendered} sentences ({cached} already cached, {failed} failed); "
+                f"cache is {cache.size_bytes() / (1024 * 1024):.1f} MB under {cache.directory}."
+            )
+        )
@@ -0,0 +1,30 @@
+from django.core.management.base import BaseCommand
+
+from recommender import services
+
+
+class Command(BaseCommand):
+    help = "Recount analytics counters from the source tables and report (or repair) drift"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--repair",
+            action="store_true",
+            help="Overwrite drifted counters with the recounted values",
+        )
+
+    def handle(self, *args, **options):
+        drift = services.reconcile_analytics_counters(repair=options["repair"])
+        if not drift:
+            self.stdout.write(self.style.SUCCESS("Analytics counters are in sync."))
+            return
+
+        for item in drift:
+            self.stdout.write(
+                f"{item['kind']} {item['key']} ({item['label']}): "
+                f"counter={item['actual']} expected={item['expected']}"
+            )
+        if options["repair"]:
+            self.stdout.write(self.style.SUCCESS(f"Repaired {len(drift)} analytics counters."))
+        else:
+            self.stdout.write(self.style.WARNING(f"{len(drift)} counters drifted; rerun with --repair to fix them."))
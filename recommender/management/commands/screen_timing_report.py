@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from recommender import instrumentation
+from recommender.models import ScreenTiming
+
+
+class Command(BaseCommand):
+    help = "Print p50/p95/p99 display time, queries and service time per GUI screen"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--app",
+            choices=[ScreenTiming.TK, ScreenTiming.KIVY],
+            help="Only report one GUI",
+        )
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=None,
+            help="Only include samples from the last N days",
+        )
+
+    def handle(self, *args, **options):
+        since = timezone.now() - timedelta(days=options["days"]) if options["days"] else None
+        report = instrumentation.timing_report(app=options["app"], since=since)
+        if not report:
+            self.stdout.write("No screen timings recorded yet.")
+            return
+
+        self.stdout.write(
+            f"{'App':<5} {'Screen':<32} {'n':>6} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} "
+            f"{'queries':>8} {'query ms':>9} {'service ms':>11}"
+        )
+        for row in report:
+            self.stdout.write(
+                f"{row['app']:<5} {row['screen'][:32]:<32} {row['samples']:>6} {row['p50']:>8.1f} "
+                f"{row['p95']:>8.1f} {row['p99']:>8.1f} {row['queries']:>8.1f} {row['query_ms']:>9.1f} "
+                f"{row['service_ms']:>11.1f}"
+            )
+        self.stdout.write(self.style.SUCCESS(f"Reported {len(report)} screens."))
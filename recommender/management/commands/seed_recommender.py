@@ -1,5 +1,6 @@
 from django.core.management.base import BaseCommand
 
+from recommender import fingerprints
 from recommender.models import (
     ActivitySuggestion,
     Career,
@@ -19,7 +20,28 @@ from recommender.models import (
 class Command(BaseCommand):
     help = "Seed sample data for the Edu & Skill Path Recommender"
 
+    def add_arguments(self, parser):
+        parser.add_argument("--force", action="store_true", help="Apply every section even if it is unchanged")
+
     def handle(self, *args, **options):
+        applied = fingerprints.apply_seed_sections(self.seed_sections(), force=options["force"])
+        if applied:
+            self.stdout.write(self.style.SUCCESS(f"Seeding completed ({', '.join(applied)})."))
+        else:
+            self.stdout.write(self.style.SUCCESS("Seed data unchanged since the last run; nothing to do."))
+
+    def seed_sections(self):
+        return [
+            fingerprints.SeedSection("seed_recommender.catalog", self.seed_catalog, [self.seed_catalog]),
+            fingerprints.SeedSection(
+                "seed_recommender.learning_resources",
+                self.seed_learning_resources,
+                [self.seed_learning_resources, self.create_learning_resources],
+            ),
+        ]
+
+    def seed_catalog(self):
+        """Stages, streams, careers, difficulties, skill paths, questions, activities and tips."""
         self.stdout.write("Seeding data...")
 
         # Education stages
@@ -183,9 +205,6 @@ class Command(BaseCommand):
         medium, _ = SkillDifficulty.objects.get_or_create(code=SkillDifficulty.MEDIUM, defaults={"label": "Medium"})
         hard, _ = SkillDifficulty.objects.get_or_create(code=SkillDifficulty.HARD, defaults={"label": "Hard"})
 
-        # Create learning resources (YouTube videos, articles, etc.)
-        self.create_learning_resources(stages, science, commerce, arts, vocational)
-
         # Skills and paths (example: Cloud Support Engineer)
         linux, _ = Skill.objects.get_or_create(name="Linux Basics")
         networking, _ = Skill.objects.get_or_create(name="Computer Networking")
@@ -673,7 +692,13 @@ class Command(BaseCommand):
             text="Encourage your child to explore different fields through activities and discussions about their interests.",
         )
 
-        self.stdout.write(self.style.SUCCESS("Seeding completed."))
+    def seed_learning_resources(self):
+        """Learning resources (YouTube videos, articles, etc.), milestones and sample feedback."""
+        stages = {stage.code: stage for stage in EducationStage.objects.all()}
+        streams = {stream.code: stream for stream in Stream.objects.all()}
+        self.create_learning_resources(
+            stages, streams[Stream.SCIENCE], streams[Stream.COMMERCE], streams[Stream.ARTS], streams[Stream.VOCATIONAL]
+        )
 
     def create_learning_resources(self, stages, science, commerce, arts, vocational):
         """Create sample learning resources including YouTube videos for different streams."""
@@ -0,0 +1,20 @@
+from django.core.management.base import BaseCommand
+
+from recommender import rollups
+
+
+class Command(BaseCommand):
+    help = "Refresh the daily/weekly analytics rollups touched since the last run"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--backfill",
+            action="store_true",
+            help="Rebuild every bucket from the raw tables instead of only the touched ones",
+        )
+
+    def handle(self, *args, **options):
+        stats = rollups.update_rollups(backfill=options["backfill"])
+        self.stdout.write(
+            self.style.SUCCESS(f"Recomputed {stats['buckets']} buckets ({stats['rows']} rollup rows).")
+        )
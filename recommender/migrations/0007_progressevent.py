@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:48
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0006_alter_feedback_user_profile'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProgressEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(blank=True, max_length=16)),
+                ('progress_percent', models.PositiveIntegerField(blank=True, null=True)),
+                ('milestone_achieved', models.BooleanField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('compacted', models.BooleanField(default=False)),
+                ('resource', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='recommender.learningresource')),
+                ('step', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, to='recommender.skillpathstep')),
+                ('user_profile', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='recommender.userprofile')),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['compacted', 'id'], name='recommender_compact_d9be75_idx')],
+            },
+        ),
+    ]
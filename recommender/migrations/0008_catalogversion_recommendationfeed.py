@@ -0,0 +1,34 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:51
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0007_progressevent'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogVersion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('version', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.CreateModel(
+            name='RecommendationFeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('inputs_key', models.CharField(blank=True, max_length=255)),
+                ('catalog_version', models.PositiveIntegerField(default=0)),
+                ('payload', models.TextField(blank=True)),
+                ('generated_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('user_profile', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='recommendation_feed', to='recommender.userprofile')),
+            ],
+        ),
+    ]
@@ -0,0 +1,29 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:54
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0008_catalogversion_recommendationfeed'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recommendationhistory',
+            name='top_career',
+            field=models.CharField(blank=True, db_index=True, max_length=128),
+        ),
+        migrations.AddField(
+            model_name='recommendationhistory',
+            name='top_skill_path',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='recommender.skillpath'),
+        ),
+        migrations.AddField(
+            model_name='recommendationhistory',
+            name='top_stream_code',
+            field=models.CharField(blank=True, db_index=True, max_length=32),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:55
+
+from django.db import migrations, models
+
+
+def count_existing_rows(apps, schema_editor):
+    """Start the counters from the existing rows, as ``reconcile_analytics_counters --repair`` would."""
+    AnalyticsCounter = apps.get_model("recommender", "AnalyticsCounter")
+    RecommendationHistory = apps.get_model("recommender", "RecommendationHistory")
+    Stream = apps.get_model("recommender", "Stream")
+    UserSkillProgress = apps.get_model("recommender", "UserSkillProgress")
+
+    # Rows saved before 0009 have no top_stream_code yet; backfill_history_columns counts them as it fills it in
+    stream_labels = dict(Stream._meta.get_field("code").choices)
+    streams = (
+        RecommendationHistory.objects.exclude(top_stream_code="")
+        .values_list("top_stream_code")
+        .annotate(count=models.Count("id"))
+    )
+    paths = UserSkillProgress.objects.values_list("skill_path_id", "skill_path__name").annotate(count=models.Count("id"))
+    AnalyticsCounter.objects.bulk_create(
+        [AnalyticsCounter(kind="PLAN_A_STREAM", key=code, label=stream_labels.get(code, ""), count=count) for code, count in streams]
+        + [AnalyticsCounter(kind="SKILL_PATH_PROGRESS", key=str(path_id), label=name, count=count) for path_id, name, count in paths]
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0009_recommendationhistory_top_columns'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AnalyticsCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.CharField(choices=[('PLAN_A_STREAM', 'Plan A stream in saved sessions'), ('SKILL_PATH_PROGRESS', 'Tracked steps per skill path')], max_length=32)),
+                ('key', models.CharField(max_length=64)),
+                ('label', models.CharField(blank=True, max_length=128)),
+                ('count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['kind', '-count'], name='recommender_kind_e1b490_idx')],
+                'unique_together': {('kind', 'key')},
+            },
+        ),
+        migrations.RunPython(count_existing_rows, migrations.RunPython.noop),
+    ]
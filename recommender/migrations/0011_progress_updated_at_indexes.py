@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0010_analyticscounter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='userlearningprogress',
+            index=models.Index(fields=['updated_at', 'id'], name='recommender_updated_0ef741_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='userskillprogress',
+            index=models.Index(fields=['updated_at', 'id'], name='recommender_updated_770437_idx'),
+        ),
+    ]
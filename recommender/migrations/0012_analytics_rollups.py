@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 15:58
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def copy_progress_timestamps(apps, schema_editor):
+    """Existing rows have no creation/completion time; updated_at is the closest we have."""
+    UserSkillProgress = apps.get_model("recommender", "UserSkillProgress")
+    UserSkillProgress.objects.update(created_at=models.F("updated_at"))
+    UserSkillProgress.objects.filter(status="COMPLETED").update(completed_at=models.F("updated_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0011_progress_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobState',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('key', models.CharField(max_length=64, unique=True)),
+                ('value', models.TextField(blank=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='userskillprogress',
+            name='completed_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='userskillprogress',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+        migrations.CreateModel(
+            name='AnalyticsRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period', models.CharField(choices=[('DAY', 'Daily'), ('WEEK', 'Weekly')], max_length=8)),
+                ('bucket_start', models.DateField()),
+                ('stage_code', models.CharField(blank=True, max_length=32)),
+                ('stream_code', models.CharField(blank=True, max_length=32)),
+                ('resource_type', models.CharField(blank=True, max_length=16)),
+                ('recommendations', models.PositiveIntegerField(default=0)),
+                ('enrollments', models.PositiveIntegerField(default=0)),
+                ('completions', models.PositiveIntegerField(default=0)),
+                ('feedback_count', models.PositiveIntegerField(default=0)),
+                ('rating_count', models.PositiveIntegerField(default=0)),
+                ('rating_sum', models.PositiveIntegerField(default=0)),
+                ('skill_path', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='+', to='recommender.skillpath')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['period', 'bucket_start'], name='recommender_period_b3ad33_idx')],
+            },
+        ),
+        migrations.RunPython(copy_progress_timestamps, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0012_analytics_rollups'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='recommendationhistory',
+            name='payload',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.18 on 2026-10-19 16:05
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recommender', '0013_recommendationhistory_payload'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ScreenTiming',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('app', models.CharField(choices=[('TK', 'Tkinter'), ('KIVY', 'Kivy')], max_length=8)),
+                ('screen', models.CharField(max_length=64)),
+                ('duration_ms', models.FloatField()),
+                ('query_count', models.PositiveIntegerField(default=0)),
+                ('query_ms', models.FloatField(default=0)),
+                ('service_ms', models.FloatField(default=0)),
+                ('created_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['app', 'screen', 'created_at'], name='recommender_app_2964ef_idx')],
+            },
+        ),
+    ]
@@ -1,4 +1,7 @@
+from typing import Dict
+
 from django.db import models
+from django.utils import timezone
 
 
 class EducationStage(models.Model):
@@ -216,9 +219,161 @@ class RecommendationHistory(models.Model):
     output_skill_paths = models.TextField(blank=True)
     notes = models.TextField(blank=True)
 
+    # Plan A of each output, extracted at write time so analytics can group on indexed columns
+    top_stream_code = models.CharField(max_length=32, blank=True, db_index=True)
+    top_career = models.CharField(max_length=128, blank=True, db_index=True)
+    top_skill_path = models.ForeignKey(
+        SkillPath, on_delete=models.SET_NULL, null=True, blank=True, related_name="+"
+    )
+
+    # Compact rows store all four payloads here (see history_codec.py) and leave the text columns empty
+    payload = models.BinaryField(null=True, blank=True, editable=False)
+
     def __str__(self) -> str:
         return f"Session {self.id} - {self.created_at:%Y-%m-%d}" if self.id else "Unsaved session"
 
+    @property
+    def is_compact(self) -> bool:
+        return self.payload is not None
+
+    def decoded(self) -> Dict[str, object]:
+        """The four payloads as JSON-style structures, whichever format the row is stored in."""
+        from . import history_codec
+
+        if getattr(self, "_decoded", None) is None:
+            if self.is_compact:
+                self._decoded = history_codec.decode_history(self.payload)
+            else:
+                self._decoded = dict(zip(history_codec.PARTS, history_codec.legacy_parts(self)))
+        return self._decoded
+
+    @property
+    def inputs(self) -> object:
+        return self.decoded()["inputs"]
+
+    @property
+    def streams(self) -> object:
+        return self.decoded()["streams"]
+
+    @property
+    def careers(self) -> object:
+        return self.decoded()["careers"]
+
+    @property
+    def skill_paths(self) -> object:
+        return self.decoded()["skill_paths"]
+
+
+class CatalogVersion(models.Model):
+    """Single-row counter bumped whenever catalog content (streams, careers, paths, resources) changes."""
+
+    SINGLETON_ID = 1
+
+    version = models.PositiveIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    @classmethod
+    def current(cls) -> int:
+        row = cls.objects.filter(pk=cls.SINGLETON_ID).values_list("version", flat=True).first()
+        return row or 0
+
+    @classmethod
+    def bump(cls) -> None:
+        updated = cls.objects.filter(pk=cls.SINGLETON_ID).update(
+            version=models.F("version") + 1, updated_at=timezone.now()
+        )
+        if not updated:
+            cls.objects.get_or_create(pk=cls.SINGLETON_ID, defaults={"version": 1})
+
+    def __str__(self) -> str:
+        return f"Catalog v{self.version}"
+
+
+class RecommendationFeed(models.Model):
+    """Precomputed per-user recommendations, rebuilt nightly or when stale."""
+
+    user_profile = models.OneToOneField(UserProfile, on_delete=models.CASCADE, related_name="recommendation_feed")
+    inputs_key = models.CharField(max_length=255, blank=True)
+    catalog_version = models.PositiveIntegerField(default=0)
+    payload = models.TextField(blank=True)
+    generated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self) -> str:
+        return f"Feed for {self.user_profile} (catalog v{self.catalog_version})"
+
+
+class AnalyticsCounter(models.Model):
+    """Running totals behind the offline analytics, incremented alongside the rows they count."""
+
+    PLAN_A_STREAM = "PLAN_A_STREAM"
+    SKILL_PATH_PROGRESS = "SKILL_PATH_PROGRESS"
+
+    KIND_CHOICES = [
+        (PLAN_A_STREAM, "Plan A stream in saved sessions"),
+        (SKILL_PATH_PROGRESS, "Tracked steps per skill path"),
+    ]
+
+    kind = models.CharField(max_length=32, choices=KIND_CHOICES)
+    key = models.CharField(max_length=64)
+    label = models.CharField(max_length=128, blank=True)
+    count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        unique_together = ("kind", "key")
+        indexes = [models.Index(fields=["kind", "-count"])]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()}: {self.label or self.key} = {self.count}"
+
+
+class JobState(models.Model):
+    """Small key/value store for background job state, such as the last run time of the rollups.
+
+    Set-up fingerprints for migrations and seed data live in :class:`SetupFingerprint`.
+    """
+
+    key = models.CharField(max_length=64, unique=True)
+    value = models.TextField(blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.key} = {self.value[:40]}"
+
+
+class AnalyticsRollup(models.Model):
+    """Pre-aggregated daily/weekly activity counts for dashboard trend charts."""
+
+    DAY = "DAY"
+    WEEK = "WEEK"
+
+    PERIOD_CHOICES = [
+        (DAY, "Daily"),
+        (WEEK, "Weekly"),
+    ]
+
+    period = models.CharField(max_length=8, choices=PERIOD_CHOICES)
+    bucket_start = models.DateField()
+
+    # Dimensions; blank / null when a source row has no value for them
+    stage_code = models.CharField(max_length=32, blank=True)
+    stream_code = models.CharField(max_length=32, blank=True)
+    skill_path = models.ForeignKey(SkillPath, on_delete=models.SET_NULL, null=True, blank=True, related_name="+")
+    resource_type = models.CharField(max_length=16, blank=True)
+
+    recommendations = models.PositiveIntegerField(default=0)
+    enrollments = models.PositiveIntegerField(default=0)
+    completions = models.PositiveIntegerField(default=0)
+    feedback_count = models.PositiveIntegerField(default=0)
+    rating_count = models.PositiveIntegerField(default=0)
+    rating_sum = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        indexes = [models.Index(fields=["period", "bucket_start"])]
+
+    def __str__(self) -> str:
+        return f"{self.get_period_display()} {self.bucket_start}"
+
 
 class UserSkillProgress(models.Model):
     NOT_STARTED = "NOT_STARTED"
@@ -237,6 +392,10 @@ class UserSkillProgress(models.Model):
     status = models.CharField(max_length=16, choices=STATUS_CHOICES, default=NOT_STARTED)
     updated_at = models.DateTimeField(auto_now=True)
     
+    # Stable event times used by the analytics rollups (updated_at moves on every save)
+    created_at = models.DateTimeField(default=timezone.now)
+    completed_at = models.DateTimeField(null=True, blank=True)
+    
     # Milestone tracking
     milestone_achieved = models.BooleanField(default=False)
     milestone_date = models.DateTimeField(null=True, blank=True)
@@ -246,11 +405,78 @@ class UserSkillProgress(models.Model):
 
     class Meta:
         unique_together = ("user_profile", "step")
+        # High-water mark for incremental analytics exports
+        indexes = [models.Index(fields=["updated_at", "id"])]
 
     def __str__(self) -> str:
         return f"{self.user_profile} - {self.step} - {self.status}"
 
 
+class ProgressEvent(models.Model):
+    """Append-only log of progress interactions.
+
+    GUI clicks only append rows here; ``services.compact_progress_events`` later
+    folds them into ``UserSkillProgress`` / ``UserLearningProgress``. The rows are
+    kept after compaction as an audit trail for analytics.
+    """
+    user_profile = models.ForeignKey(UserProfile, on_delete=models.CASCADE)
+    step = models.ForeignKey(SkillPathStep, on_delete=models.CASCADE, null=True, blank=True)
+    resource = models.ForeignKey("LearningResource", on_delete=models.CASCADE, null=True, blank=True)
+    status = models.CharField(max_length=16, blank=True)
+    progress_percent = models.PositiveIntegerField(null=True, blank=True)
+    milestone_achieved = models.BooleanField(null=True, blank=True)
+    notes = models.TextField(blank=True)
+    created_at = models.DateTimeField(default=timezone.now)
+    compacted = models.BooleanField(default=False)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [models.Index(fields=["compacted", "id"])]
+
+    def __str__(self) -> str:
+        target = self.step or self.resource
+        return f"{self.user_profile} - {target} - {self.status or self.progress_percent}"
+
+
+class ScreenTiming(models.Model):
+    """One measured screen display (Tk ``on_show`` / Kivy ``on_enter``), written in batches."""
+
+    TK = "TK"
+    KIVY = "KIVY"
+
+    APP_CHOICES = [
+        (TK, "Tkinter"),
+        (KIVY, "Kivy"),
+    ]
+
+    app = models.CharField(max_length=8, choices=APP_CHOICES)
+    screen = models.CharField(max_length=64)
+    duration_ms = models.FloatField()
+    query_count = models.PositiveIntegerField(default=0)
+    query_ms = models.FloatField(default=0)
+    service_ms = models.FloatField(default=0)
+    created_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [models.Index(fields=["app", "screen", "created_at"])]
+
+    def __str__(self) -> str:
+        return f"{self.app} {self.screen} {self.duration_ms:.0f} ms"
+
+
+class SetupFingerprint(models.Model):
+    """Hash of what set-up last applied: the migrations on disk or one seed data section."""
+
+    MIGRATIONS = "migrations"
+
+    key = models.CharField(max_length=128, unique=True)
+    digest = models.CharField(max_length=64)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.key} {self.digest[:12]}"
+
+
 class MotivationTip(models.Model):
     AUDIENCE_SCHOOL = "SCHOOL"
     AUDIENCE_UG_PG = "UG_PG"
@@ -332,6 +558,8 @@ class UserLearningProgress(models.Model):
     
     class Meta:
         unique_together = ("user_profile", "resource")
+        # High-water mark for incremental analytics exports
+        indexes = [models.Index(fields=["updated_at", "id"])]
     
     def __str__(self) -> str:
         return f"{self.user_profile} - {self.resource} - {self.status}"
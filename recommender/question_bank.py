@@ -0,0 +1,91 @@
+"""Per-stage question bank kept in process memory.
+
+Every questionnaire session asks for the same few questions of a stage.
+:func:`load` reads all active questions of one stage with their answer options
+and option scores in two queries, and freezes them into tuples of frozen
+dataclasses. A single copy can then be shared by screens and worker threads and
+rendered directly. ``services.get_question_bank`` caches one bank per stage
+until an admin edits a question or option (see ``signals.py``).
+"""
+
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .catalog_snapshot import SCORE_FIELDS, CatalogSnapshot
+from .models import Question
+
+
+@dataclass(frozen=True)
+class Option:
+    id: int
+    text: str
+    scores: Tuple[int, ...]  # in SCORE_FIELDS order
+
+
+@dataclass(frozen=True)
+class BankQuestion:
+    id: int
+    text: str
+    options: Tuple[Option, ...]
+
+
+@dataclass(frozen=True)
+class QuestionBank:
+    stage_id: Optional[int]
+    questions: Tuple[BankQuestion, ...]
+    options: Mapping[int, Option]
+
+    def first(self, limit: Optional[int] = None) -> Tuple[BankQuestion, ...]:
+        return self.questions[:limit] if limit is not None else self.questions
+
+    def option_scores(self, option_ids: Iterable[int]) -> List[Dict[str, int]]:
+        """Scores of the chosen options, ready for ``InterestProfile.from_option_scores``."""
+        return [
+            dict(zip(SCORE_FIELDS, self.options[opt_id].scores))
+            for opt_id in option_ids
+            if opt_id in self.options
+        ]
+
+
+def _freeze(stage_id: Optional[int], questions: List[BankQuestion]) -> QuestionBank:
+    options = {opt.id: opt for q in questions for opt in q.options}
+    return QuestionBank(stage_id, tuple(questions), MappingProxyType(options))
+
+
+def load(stage_id: Optional[int]) -> QuestionBank:
+    """Active questions of a stage in id order, with options prefetched in one extra query."""
+    score_columns = [f"{field}_score" for field in SCORE_FIELDS]
+    questions = Question.objects.filter(stage_id=stage_id, is_active=True).order_by("id").prefetch_related("options")
+    return _freeze(
+        stage_id,
+        [
+            BankQuestion(
+                q.id,
+                q.text,
+                tuple(
+                    Option(opt.id, opt.option_text, tuple(getattr(opt, column) for column in score_columns))
+                    for opt in q.options.all()
+                ),
+            )
+            for q in questions
+        ],
+    )
+
+
+def from_snapshot(snapshot: CatalogSnapshot, stage_id: Optional[int]) -> QuestionBank:
+    """The same bank built from a kiosk catalog snapshot instead of the database."""
+    return _freeze(
+        stage_id,
+        [
+            BankQuestion(
+                q["id"],
+                q["text"],
+                tuple(
+                    Option(opt["id"], opt["text"], tuple(snapshot.option_score_row(opt["id"]) or ()))
+                    for opt in q.get("options", [])
+                ),
+            )
+            for q in snapshot.questions_for_stage(stage_id)
+        ],
+    )
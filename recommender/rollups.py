@@ -0,0 +1,226 @@
+"""Daily and weekly activity rollups behind the dashboard trend views.
+
+Each source below contributes one metric, bucketed by a timestamp that does
+not change once set (creation, start or completion time), so a row never moves
+between buckets. An incremental run finds the buckets of rows written since
+the previous run (via each source's ``changed`` column), deletes those buckets
+and re-aggregates them from the raw tables. Backfill rebuilds every bucket.
+"""
+
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from django.db import models, transaction
+from django.db.models.functions import TruncDate, TruncDay, TruncWeek
+from django.utils import timezone
+
+from .models import (
+    AnalyticsRollup,
+    Feedback,
+    JobState,
+    RecommendationHistory,
+    UserLearningProgress,
+    UserSkillProgress,
+)
+
+STATE_KEY = "analytics_rollup.last_run"
+
+PERIODS = (AnalyticsRollup.DAY, AnalyticsRollup.WEEK)
+_TRUNC = {AnalyticsRollup.DAY: TruncDay, AnalyticsRollup.WEEK: TruncWeek}
+
+# Dimension name -> AnalyticsRollup field
+DIMENSIONS = ("stage_code", "stream_code", "skill_path_id", "resource_type")
+
+
+@dataclass(frozen=True)
+class RollupSource:
+    model: type
+    # Timestamp the row is bucketed by
+    time_field: str
+    # Column that moves whenever the row is written; used to find touched buckets
+    changed_field: str
+    # AnalyticsRollup metric field -> aggregate expression
+    metrics: Dict[str, models.Aggregate]
+    # Dimension -> lookup on the source model
+    dimensions: Dict[str, str] = field(default_factory=dict)
+
+
+SOURCES = (
+    RollupSource(
+        model=RecommendationHistory,
+        time_field="created_at",
+        changed_field="created_at",
+        metrics={"recommendations": models.Count("id")},
+        dimensions={
+            "stage_code": "user_profile__education_stage__code",
+            "stream_code": "top_stream_code",
+            "skill_path_id": "top_skill_path_id",
+        },
+    ),
+    RollupSource(
+        model=UserSkillProgress,
+        time_field="created_at",
+        changed_field="updated_at",
+        # Starting a path creates one row per step; count learners, not steps
+        metrics={"enrollments": models.Count("user_profile", distinct=True)},
+        dimensions={
+            "stage_code": "user_profile__education_stage__code",
+            "stream_code": "skill_path__primary_stream__code",
+            "skill_path_id": "skill_path_id",
+        },
+    ),
+    RollupSource(
+        model=UserSkillProgress,
+        time_field="completed_at",
+        changed_field="updated_at",
+        metrics={"completions": models.Count("id")},
+        dimensions={
+            "stage_code": "user_profile__education_stage__code",
+            "stream_code": "skill_path__primary_stream__code",
+            "skill_path_id": "skill_path_id",
+        },
+    ),
+    RollupSource(
+        model=UserLearningProgress,
+        time_field="started_at",
+        changed_field="updated_at",
+        metrics={"enrollments": models.Count("id")},
+        dimensions={
+            "stage_code": "user_profile__education_stage__code",
+            "stream_code": "resource__stream__code",
+            "resource_type": "resource__resource_type",
+        },
+    ),
+    RollupSource(
+        model=UserLearningProgress,
+        time_field="completed_at",
+        changed_field="updated_at",
+        metrics={"completions": models.Count("id")},
+        dimensions={
+            "stage_code": "user_profile__education_stage__code",
+            "stream_code": "resource__stream__code",
+            "resource_type": "resource__resource_type",
+        },
+    ),
+    RollupSource(
+        model=Feedback,
+        time_field="created_at",
+        changed_field="created_at",
+        metrics={
+            "feedback_count": models.Count("id"),
+            "rating_count": models.Count("rating"),
+            "rating_sum": models.Sum("rating"),
+        },
+        dimensions={"stage_code": "user_profile__education_stage__code"},
+    ),
+)
+
+
+def bucket_start(day: date, period: str) -> date:
+    if period == AnalyticsRollup.WEEK:
+        return day - timedelta(days=day.weekday())
+    return day
+
+
+def _bucket_bounds(start: date, period: str) -> Tuple[datetime, datetime]:
+    length = timedelta(days=7 if period == AnalyticsRollup.WEEK else 1)
+    begin = timezone.make_aware(datetime.combine(start, time.min))
+    return begin, begin + length
+
+
+def _touched_days(since: datetime) -> Set[date]:
+    """Calendar days holding rows written after ``since``, across all sources."""
+    days: Set[date] = set()
+    for source in SOURCES:
+        days.update(
+            source.model.objects.filter(**{f"{source.changed_field}__gt": since})
+            .exclude(**{source.time_field: None})
+            .annotate(day=TruncDate(source.time_field))
+            .values_list("day", flat=True)
+            .distinct()
+        )
+    return days
+
+
+def _aggregate(period: str, buckets: Optional[Iterable[date]]) -> List[AnalyticsRollup]:
+    """Aggregate every source into rollup rows for ``buckets`` (all buckets when None)."""
+    rows: Dict[tuple, AnalyticsRollup] = {}
+    for source in SOURCES:
+        qs = source.model.objects.exclude(**{source.time_field: None})
+        if buckets is not None:
+            ranges = models.Q()
+            for start in buckets:
+                begin, end = _bucket_bounds(start, period)
+                ranges |= models.Q(**{f"{source.time_field}__gte": begin, f"{source.time_field}__lt": end})
+            qs = qs.filter(ranges)
+
+        lookups = {dim: source.dimensions[dim] for dim in DIMENSIONS if dim in source.dimensions}
+        grouped = (
+            qs.annotate(bucket=_TRUNC[period](source.time_field))
+            .values("bucket", *lookups.values())
+            .annotate(**{f"m_{metric}": agg for metric, agg in source.metrics.items()})
+            .order_by()
+        )
+        for item in grouped:
+            dims = {dim: item[lookup] for dim, lookup in lookups.items()}
+            key = (
+                item["bucket"].date() if isinstance(item["bucket"], datetime) else item["bucket"],
+                dims.get("stage_code") or "",
+                dims.get("stream_code") or "",
+                dims.get("skill_path_id"),
+                dims.get("resource_type") or "",
+            )
+            row = rows.get(key)
+            if row is None:
+                row = rows[key] = AnalyticsRollup(
+                    period=period,
+                    bucket_start=key[0],
+                    stage_code=key[1],
+                    stream_code=key[2],
+                    skill_path_id=key[3],
+                    resource_type=key[4],
+                )
+            for metric in source.metrics:
+                setattr(row, metric, getattr(row, metric) + (item[f"m_{metric}"] or 0))
+    return list(rows.values())
+
+
+def update_rollups(backfill: bool = False) -> Dict[str, int]:
+    """Refresh the buckets touched since the last run, or every bucket with ``backfill=True``.
+
+    Returns how many buckets were recomputed and how many rollup rows were written.
+    """
+    started = timezone.now()
+    state = JobState.objects.filter(key=STATE_KEY).first()
+    last_run = datetime.fromisoformat(state.value) if state and state.value and not backfill else None
+
+    if last_run is None:
+        buckets_by_period: Dict[str, Optional[Set[date]]] = {period: None for period in PERIODS}
+    else:
+        days = _touched_days(last_run)
+        buckets_by_period = {period: {bucket_start(day, period) for day in days} for period in PERIODS}
+
+    written = 0
+    bucket_count = 0
+    with transaction.atomic():
+        for period, buckets in buckets_by_period.items():
+            if buckets is not None and not buckets:
+                continue
+            rows = _aggregate(period, buckets)
+            existing = AnalyticsRollup.objects.filter(period=period)
+            if buckets is not None:
+                existing = existing.filter(bucket_start__in=buckets)
+            existing.delete()
+            AnalyticsRollup.objects.bulk_create(rows, batch_size=500)
+            written += len(rows)
+            bucket_count += len(buckets) if buckets is not None else len({row.bucket_start for row in rows})
+
+        # Rows written while this run was aggregating are picked up next time
+        JobState.objects.update_or_create(key=STATE_KEY, defaults={"value": started.isoformat()})
+
+    # bulk_create skips post_save, so tell the analytics cache directly
+    from . import services
+
+    services.invalidate_analytics_snapshot()
+    return {"buckets": bucket_count, "rows": written}
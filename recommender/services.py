@@ -1,17 +1,29 @@
+import hashlib
 import json
 from dataclasses import dataclass
-from typing import Dict, List, Tuple, Optional
-from datetime import datetime
+from typing import Dict, List, Tuple, Optional, Union
+from datetime import datetime, timedelta
 
-from django.db import connection, models
+from django.db import IntegrityError, connection, models, transaction
+from django.db.models.functions import TruncMonth, TruncWeek
 from django.utils import timezone
 
+from . import caching, catalog_snapshot, history_archive, history_codec, question_bank, rollups
+from .buffering import BufferedWriter, BufferFull, is_database_locked
 from .models import (
     ActivitySuggestion,
+    AnalyticsCounter,
+    AnalyticsRollup,
     Career,
+    CatalogVersion,
     EducationStage,
+    Feedback,
     LearningResource,
     MotivationTip,
+    OptionScore,
+    Question,
+    ProgressEvent,
+    RecommendationFeed,
     RecommendationHistory,
     RecommendationRule,
     SkillPath,
@@ -269,17 +281,21 @@ def get_skill_paths_for_target(
 
 def initialize_progress_for_path(user: UserProfile, path: SkillPath) -> None:
     steps = list(path.steps.all())
-    for step in steps:
-        UserSkillProgress.objects.get_or_create(
-            user_profile=user,
-            skill_path=path,
-            step=step,
-            defaults={
-                'status': UserSkillProgress.NOT_STARTED,
-                'step_progress': 0,
-                'milestone_achieved': False
-            }
-        )
+    with transaction.atomic():
+        created_count = 0
+        for step in steps:
+            _, created = UserSkillProgress.objects.get_or_create(
+                user_profile=user,
+                skill_path=path,
+                step=step,
+                defaults={
+                    'status': UserSkillProgress.NOT_STARTED,
+                    'step_progress': 0,
+                    'milestone_achieved': False
+                }
+            )
+            created_count += created
+        increment_analytics_counter(AnalyticsCounter.SKILL_PATH_PROGRESS, str(path.id), path.name, created_count)
 
 
 def compute_progress_summary(user: UserProfile, path: SkillPath) -> Dict[str, object]:
@@ -288,7 +304,7 @@ def compute_progress_summary(user: UserProfile, path: SkillPath) -> Dict[str, ob
     completed = qs.filter(status=UserSkillProgress.COMPLETED).count()
     in_progress = qs.filter(status=UserSkillProgress.IN_PROGRESS).count()
 
-    percent = int(round((completed / total) * 100)) if total else 0
+    percent = _percent_done(completed, total)
 
     difficulty_counts: Dict[str, int] = {"Easy": 0, "Medium": 0, "Hard": 0}
     for prog in qs.select_related("step__difficulty"):
@@ -330,9 +346,36 @@ def calculate_streak(user: UserProfile, path: SkillPath) -> int:
         status=UserSkillProgress.COMPLETED
     ).count()
     
+    return _streak_from_completed(completed_steps)
+
+
+def _percent_done(completed: int, total: int) -> int:
+    return int(round((completed / total) * 100)) if total else 0
+
+
+def _streak_from_completed(completed: int) -> int:
     # Simulate streak: 1 day for every 2 completed steps, up to 7 days
-    streak = min(completed_steps // 2, 7)
-    return streak
+    return min(completed // 2, 7)
+
+
+def progress_summary_delta(old_status: str, new_status: str) -> Dict[str, int]:
+    """How the counts of :func:`compute_progress_summary` change when one step changes status."""
+    completed = UserSkillProgress.COMPLETED
+    in_progress = UserSkillProgress.IN_PROGRESS
+    return {
+        "completed": (new_status == completed) - (old_status == completed),
+        "in_progress": (new_status == in_progress) - (old_status == in_progress),
+    }
+
+
+def apply_progress_summary_delta(summary: Dict[str, object], delta: Dict[str, int]) -> Dict[str, object]:
+    """Return ``summary`` with ``delta`` applied, deriving percent and streak as a full recompute would."""
+    updated = dict(summary)
+    updated["completed"] = summary["completed"] + delta.get("completed", 0)
+    updated["in_progress"] = summary["in_progress"] + delta.get("in_progress", 0)
+    updated["percent"] = _percent_done(updated["completed"], updated["total"])
+    updated["streak"] = _streak_from_completed(updated["completed"])
+    return updated
 
 
 def check_and_award_milestones(user: UserProfile, path: SkillPath) -> List[Dict[str, str]]:
@@ -392,18 +435,163 @@ def save_recommendation_history(
     skill_paths_payload: Dict,
     notes: str = "",
 ) -> RecommendationHistory:
-    history = RecommendationHistory.objects.create(
-        user_profile=user,
-        stage_snapshot=stage_label,
-        input_data=json.dumps(input_payload),
-        output_streams=json.dumps(streams_payload, default=str),
-        output_careers=json.dumps(careers_payload, default=str),
-        output_skill_paths=json.dumps(skill_paths_payload, default=str),
-        notes=notes,
-    )
+    with transaction.atomic():
+        history = RecommendationHistory.objects.create(
+            user_profile=user,
+            stage_snapshot=stage_label,
+            payload=history_codec.encode_history(input_payload, streams_payload, careers_payload, skill_paths_payload),
+            notes=notes,
+            **history_top_fields(streams_payload, careers_payload, skill_paths_payload),
+        )
+        increment_analytics_counter(
+            AnalyticsCounter.PLAN_A_STREAM,
+            history.top_stream_code,
+            dict(Stream.STREAM_CHOICES).get(history.top_stream_code, ""),
+        )
     return history
 
 
+def get_user_history(
+    user: UserProfile, limit: int = 20, before: Optional[Tuple[datetime, int]] = None
+) -> List[RecommendationHistory]:
+    """The user's saved sessions newest first, after the ``(created_at, id)`` of ``before``.
+
+    Older pages are read from the monthly archives.
+    """
+    return history_archive.user_history(user, limit=limit, before=before)
+
+
+def _plan_a(payload: object) -> object:
+    """Return the Plan A entry of a history payload (or its first entry)."""
+    if isinstance(payload, dict):
+        if "Plan A" in payload:
+            return payload["Plan A"]
+        return next(iter(payload.values()), None)
+    if isinstance(payload, (list, tuple)):
+        return payload[0] if payload else None
+    return None
+
+
+# Older rows stored streams by display name ("Science"); newer ones as {"code": ...}
+_STREAM_CODES_BY_LABEL = {key.lower(): code for code, label in Stream.STREAM_CHOICES for key in (code, label)}
+
+
+def history_top_fields(streams_payload: object, careers_payload: object, skill_paths_payload: object) -> Dict[str, object]:
+    """Extract the indexed Plan A columns of RecommendationHistory from its output payloads.
+
+    Accepts the live payloads (model instances) as well as decoded JSON from
+    older rows, where models were stored as their display names.
+    """
+    top_stream = _plan_a(streams_payload)
+    if isinstance(top_stream, dict) and "stream" in top_stream:
+        top_stream = top_stream["stream"]
+    if isinstance(top_stream, Stream):
+        stream_code = top_stream.code
+    elif isinstance(top_stream, dict):
+        stream_code = top_stream.get("code") or _STREAM_CODES_BY_LABEL.get(str(top_stream.get("name", "")).lower(), "")
+    elif isinstance(top_stream, str):
+        stream_code = _STREAM_CODES_BY_LABEL.get(top_stream.lower(), "")
+    else:
+        stream_code = ""
+
+    top_career = _plan_a(careers_payload)
+    if isinstance(top_career, (list, tuple)):
+        top_career = _plan_a(top_career)
+    if isinstance(top_career, dict):
+        top_career = top_career.get("name", "")
+    elif isinstance(top_career, Career):
+        top_career = top_career.name
+    top_career = top_career if isinstance(top_career, str) else ""
+
+    top_path = _plan_a(skill_paths_payload)
+    if isinstance(top_path, SkillPath):
+        top_path_id = top_path.pk
+    elif isinstance(top_path, dict):
+        top_path_id = top_path.get("id")
+    elif isinstance(top_path, str):
+        top_path_id = SkillPath.objects.filter(name=top_path).values_list("id", flat=True).first()
+    else:
+        top_path_id = None
+
+    return {
+        "top_stream_code": stream_code,
+        "top_career": top_career[:128],
+        "top_skill_path_id": top_path_id,
+    }
+
+
+def backfill_history_top_fields(batch_size: int = 500, only_missing: bool = True) -> int:
+    """Fill the Plan A columns of existing history rows from their stored JSON; returns rows updated."""
+    fields = ["top_stream_code", "top_career", "top_skill_path_id"]
+    update_fields = ["top_stream_code", "top_career", "top_skill_path"]
+    qs = RecommendationHistory.objects.order_by("id").only(
+        "id", "input_data", "output_streams", "output_careers", "output_skill_paths", "payload", *fields
+    )
+    if only_missing:
+        qs = qs.filter(top_stream_code="", top_career="", top_skill_path__isnull=True)
+
+    stream_labels = dict(Stream.STREAM_CHOICES)
+    updated = 0
+    last_id = 0
+    # Keyset pages rather than iterator(): the loop rewrites the very columns only_missing filters on
+    while True:
+        page = list(qs.filter(id__gt=last_id)[:batch_size])
+        if not page:
+            break
+        last_id = page[-1].id
+
+        batch: List[RecommendationHistory] = []
+        stream_deltas: Dict[str, int] = {}
+        for history in page:
+            top = history_top_fields(history.streams, history.careers, history.skill_paths)
+            if all(getattr(history, field) == top[field] for field in fields):
+                continue
+            if history.top_stream_code != top["top_stream_code"]:
+                stream_deltas[history.top_stream_code] = stream_deltas.get(history.top_stream_code, 0) - 1
+                stream_deltas[top["top_stream_code"]] = stream_deltas.get(top["top_stream_code"], 0) + 1
+            for field in fields:
+                setattr(history, field, top[field])
+            batch.append(history)
+        if not batch:
+            continue
+
+        # Keep the Plan A stream counters in step with the rewritten rows
+        with transaction.atomic():
+            RecommendationHistory.objects.bulk_update(batch, update_fields)
+            for code, delta in stream_deltas.items():
+                increment_analytics_counter(AnalyticsCounter.PLAN_A_STREAM, code, stream_labels.get(code, ""), delta)
+        updated += len(batch)
+    return updated
+
+
+def compact_history_rows(batch_size: int = 200) -> Dict[str, int]:
+    """Convert history rows still stored as JSON text columns to the compact payload format.
+
+    Returns the number of rows converted and the payload bytes before and after.
+    """
+    qs = RecommendationHistory.objects.filter(payload__isnull=True).order_by("id").only(
+        "id", "input_data", "output_streams", "output_careers", "output_skill_paths"
+    )
+    stats = {"rows": 0, "bytes_before": 0, "bytes_after": 0}
+    update_fields = ["payload", "input_data", "output_streams", "output_careers", "output_skill_paths"]
+    last_id = 0
+    # Keyset pages rather than iterator(): each page sets the payload the queryset filters on
+    while True:
+        batch = list(qs.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            break
+        last_id = batch[-1].id
+        for history in batch:
+            texts = (history.input_data, history.output_streams, history.output_careers, history.output_skill_paths)
+            history.payload = history_codec.encode_history(*history_codec.legacy_parts(history))
+            history.input_data = history.output_streams = history.output_careers = history.output_skill_paths = ""
+            stats["rows"] += 1
+            stats["bytes_before"] += sum(len(text.encode("utf-8")) for text in texts)
+            stats["bytes_after"] += len(history.payload)
+        RecommendationHistory.objects.bulk_update(batch, update_fields)
+    return stats
+
+
 def get_motivation_tips(stage: EducationStage, audience: str) -> List[MotivationTip]:
     return list(
         MotivationTip.objects.filter(audience=audience).filter(
@@ -416,6 +604,20 @@ def get_activity_suggestions(stage: EducationStage) -> List[ActivitySuggestion]:
     return list(ActivitySuggestion.objects.filter(stage=stage))
 
 
+def read_aloud_activity(activity: ActivitySuggestion) -> str:
+    """Text the read-aloud buttons speak for one activity (pre-rendered by ``prewarm_tts_cache``)."""
+    return f"{activity.title}. {activity.description}"
+
+
+def read_aloud_step(index: int, step: SkillPathStep) -> str:
+    """Text the read-aloud buttons speak for one roadmap step (pre-rendered by ``prewarm_tts_cache``)."""
+    level_text = dict(step.LEVEL_CHOICES).get(step.level, step.level)
+    return (
+        f"Step {index}: {step.skill.name}, {level_text}, {step.difficulty.label} difficulty, "
+        f"estimated time: {step.estimated_weeks} weeks."
+    )
+
+
 def get_learning_resources_for_user(
     user: UserProfile, 
     stage: Optional[EducationStage] = None,
@@ -459,6 +661,53 @@ def get_learning_resources_for_user(
     return list(queryset[:limit])
 
 
+PAGE_SIZE = 50
+
+
+def page_learning_resources(
+    stage: Optional[EducationStage] = None,
+    stream: Optional[Stream] = None,
+    after_id: int = 0,
+    limit: int = PAGE_SIZE,
+    exclude_ids: Tuple[int, ...] = (),
+    resource_type: Optional[str] = None,
+) -> Tuple[List[Dict[str, object]], Optional[int]]:
+    """One keyset page of active resources for a stage and stream, as flat dicts.
+
+    Rows have the same keys as the feed's ``resources``. Returns the rows and
+    the ``after_id`` for the next page (None on the last page).
+    """
+    queryset = LearningResource.objects.filter(is_active=True, id__gt=after_id)
+    if resource_type:
+        queryset = queryset.filter(resource_type=resource_type)
+    if stage:
+        queryset = queryset.filter(models.Q(stage=stage) | models.Q(stage__isnull=True))
+    if stream:
+        queryset = queryset.filter(models.Q(stream=stream) | models.Q(stream__isnull=True))
+    if exclude_ids:
+        queryset = queryset.exclude(id__in=exclude_ids)
+    rows = list(
+        queryset.order_by("id").values("id", "title", "description", "url", "duration_minutes")[: limit + 1]
+    )
+    next_after = rows[limit - 1]["id"] if len(rows) > limit else None
+    return rows[:limit], next_after
+
+
+def page_user_skill_progress(
+    user: UserProfile, after_id: int = 0, limit: int = PAGE_SIZE
+) -> Tuple[List[Dict[str, object]], Optional[int]]:
+    """One keyset page of a user's skill step progress as flat dicts, plus the next ``after_id``."""
+    rows = list(
+        UserSkillProgress.objects.filter(user_profile=user, id__gt=after_id)
+        .order_by("id")
+        .values("id", "step_id", "skill_path_id", "status", "milestone_achieved", skill_name=models.F("step__skill__name"))[
+            : limit + 1
+        ]
+    )
+    next_after = rows[limit - 1]["id"] if len(rows) > limit else None
+    return rows[:limit], next_after
+
+
 def get_user_learning_progress(user: UserProfile, resource: LearningResource) -> UserLearningProgress:
     """Get or create learning progress record for a user and resource."""
     progress, created = UserLearningProgress.objects.get_or_create(
@@ -489,13 +738,26 @@ def update_learning_progress(
         }
     )
     
-    # Update fields if provided
+    _apply_learning_update(progress, status, progress_percent, notes, timezone.now())
+    progress.save()
+    
+    return progress
+
+
+def _apply_learning_update(
+    progress: UserLearningProgress,
+    status: Optional[str],
+    progress_percent: Optional[int],
+    notes: Optional[str],
+    when: datetime,
+) -> None:
+    """Apply one learning progress change in memory; shared by direct writes and compaction."""
     if status:
         progress.status = status
         if status == UserLearningProgress.IN_PROGRESS and not progress.started_at:
-            progress.started_at = timezone.now()
+            progress.started_at = when
         elif status == UserLearningProgress.COMPLETED and not progress.completed_at:
-            progress.completed_at = timezone.now()
+            progress.completed_at = when
     
     if progress_percent is not None:
         progress.progress_percent = progress_percent
@@ -503,10 +765,7 @@ def update_learning_progress(
     if notes:
         progress.notes = notes
     
-    progress.updated_at = timezone.now()
-    progress.save()
-    
-    return progress
+    progress.updated_at = when
 
 
 def update_skill_step_progress(
@@ -517,18 +776,37 @@ def update_skill_step_progress(
     milestone_achieved: Optional[bool] = None
 ) -> UserSkillProgress:
     """Update user's progress for a specific skill step."""
-    progress, created = UserSkillProgress.objects.get_or_create(
-        user_profile=user,
-        step=step,
-        skill_path=step.skill_path,
-        defaults={
-            'status': UserSkillProgress.NOT_STARTED,
-            'step_progress': 0,
-            'milestone_achieved': False
-        }
-    )
+    with transaction.atomic():
+        progress, created = UserSkillProgress.objects.get_or_create(
+            user_profile=user,
+            step=step,
+            skill_path=step.skill_path,
+            defaults={
+                'status': UserSkillProgress.NOT_STARTED,
+                'step_progress': 0,
+                'milestone_achieved': False
+            }
+        )
+        
+        if created:
+            increment_analytics_counter(
+                AnalyticsCounter.SKILL_PATH_PROGRESS, str(step.skill_path_id), step.skill_path.name
+            )
+        
+        _apply_skill_step_update(progress, status, progress_percent, milestone_achieved, timezone.now())
+        progress.save()
     
-    # Update fields if provided
+    return progress
+
+
+def _apply_skill_step_update(
+    progress: UserSkillProgress,
+    status: Optional[str],
+    progress_percent: Optional[int],
+    milestone_achieved: Optional[bool],
+    when: datetime,
+) -> None:
+    """Apply one skill step change in memory; shared by direct writes and compaction."""
     if status:
         progress.status = status
     
@@ -546,13 +824,187 @@ def update_skill_step_progress(
     if milestone_achieved is not None:
         progress.milestone_achieved = milestone_achieved
         if milestone_achieved and not progress.milestone_date:
-            from django.utils import timezone
-            progress.milestone_date = timezone.now()
+            progress.milestone_date = when
     
-    progress.updated_at = timezone.now()
-    progress.save()
+    if progress.status == UserSkillProgress.COMPLETED and not progress.completed_at:
+        progress.completed_at = when
     
-    return progress
+    progress.updated_at = when
+
+
+def _write_progress_events(events: List[ProgressEvent]) -> None:
+    """Persist a batch of buffered events and fold them into the progress tables.
+
+    Both steps share one transaction so a failed batch can simply be retried.
+    Events for a step, resource or user deleted since they were queued (for
+    example a stale row id from a progress list) are dropped first, since
+    they would fail the whole batch.
+    """
+    with transaction.atomic():
+        ProgressEvent.objects.bulk_create(_without_dangling_events(events))
+        compact_progress_events()
+
+
+def _without_dangling_events(events: List[ProgressEvent]) -> List[ProgressEvent]:
+    def existing(model, ids) -> set:
+        ids = {i for i in ids if i}
+        return set(model.objects.filter(id__in=ids).values_list("id", flat=True)) if ids else set()
+
+    users = existing(UserProfile, (e.user_profile_id for e in events))
+    steps = existing(SkillPathStep, (e.step_id for e in events))
+    resources = existing(LearningResource, (e.resource_id for e in events))
+    kept = [
+        e for e in events
+        if e.user_profile_id in users
+        and (not e.step_id or e.step_id in steps)
+        and (not e.resource_id or e.resource_id in resources)
+    ]
+    if len(kept) < len(events):
+        print(f"progress-event-writer: dropped {len(events) - len(kept)} events for deleted rows")
+    return kept
+
+
+_progress_event_writer = BufferedWriter(
+    _write_progress_events, name="progress-event-writer", retryable=is_database_locked, flush_at_exit=True
+)
+
+
+def record_skill_step_event(
+    user: UserProfile,
+    step: Union[SkillPathStep, int],
+    status: Optional[str] = None,
+    progress_percent: Optional[int] = None,
+    milestone_achieved: Optional[bool] = None,
+) -> ProgressEvent:
+    """Queue a skill step change without touching the database on the caller's thread.
+
+    The event is written by the background writer and applied to
+    ``UserSkillProgress`` by :func:`compact_progress_events`. Call
+    :func:`flush_progress_events` before reading progress back. ``step`` may
+    also be a step id, as in the rows of :func:`page_user_skill_progress`.
+    """
+    event = ProgressEvent(
+        user_profile=user,
+        status=status or "",
+        progress_percent=progress_percent,
+        milestone_achieved=milestone_achieved,
+    )
+    if isinstance(step, SkillPathStep):
+        event.step = step
+    else:
+        event.step_id = step
+    _progress_event_writer.append(event)
+    return event
+
+
+def record_skill_step_status(
+    user: UserProfile, step: Union[SkillPathStep, int], old_status: str, status: str
+) -> Dict[str, int]:
+    """Queue a status change and return its :func:`progress_summary_delta`.
+
+    Lets a progress view patch the changed row and its summary in place
+    instead of reloading everything after each click.
+    """
+    record_skill_step_event(user, step, status=status)
+    return progress_summary_delta(old_status, status)
+
+
+def record_learning_event(
+    user: UserProfile,
+    resource: LearningResource,
+    status: Optional[str] = None,
+    progress_percent: Optional[int] = None,
+    notes: Optional[str] = None,
+) -> ProgressEvent:
+    """Queue a learning resource change; see :func:`record_skill_step_event`."""
+    event = ProgressEvent(
+        user_profile=user,
+        resource=resource,
+        status=status or "",
+        progress_percent=progress_percent,
+        notes=notes or "",
+    )
+    _progress_event_writer.append(event)
+    return event
+
+
+def flush_progress_events() -> int:
+    """Write and compact any queued progress events now; returns how many were queued."""
+    return _progress_event_writer.flush()
+
+
+def compact_progress_events(batch_size: int = 500) -> int:
+    """Fold uncompacted ProgressEvent rows into UserSkillProgress / UserLearningProgress.
+
+    Events are applied in insertion order with the same rules as
+    :func:`update_skill_step_progress` and :func:`update_learning_progress`.
+    Each progress row is saved once per batch however many events touched it.
+    Events whose step or resource no longer exists are marked compacted
+    without being applied. Returns the number of events compacted.
+    """
+    total = 0
+    while True:
+        with transaction.atomic():
+            events = list(
+                ProgressEvent.objects.filter(compacted=False)
+                .select_related("step__skill_path", "resource")
+                .order_by("id")[:batch_size]
+            )
+            if not events:
+                break
+
+            skill_rows: Dict[Tuple[int, int], UserSkillProgress] = {}
+            learning_rows: Dict[Tuple[int, int], UserLearningProgress] = {}
+            new_rows_by_path: Dict[SkillPath, int] = {}
+            for event in events:
+                if (event.step_id and event.step is None) or (event.resource_id and event.resource is None):
+                    # The step or resource is gone; the event is marked compacted below and never applied
+                    continue
+                if event.step_id:
+                    key = (event.user_profile_id, event.step_id)
+                    progress = skill_rows.get(key)
+                    if progress is None:
+                        progress, created = UserSkillProgress.objects.get_or_create(
+                            user_profile_id=event.user_profile_id,
+                            step_id=event.step_id,
+                            skill_path_id=event.step.skill_path_id,
+                            defaults={
+                                'status': UserSkillProgress.NOT_STARTED,
+                                'step_progress': 0,
+                                'milestone_achieved': False
+                            }
+                        )
+                        skill_rows[key] = progress
+                        if created:
+                            path = event.step.skill_path
+                            new_rows_by_path[path] = new_rows_by_path.get(path, 0) + 1
+                    _apply_skill_step_update(
+                        progress, event.status, event.progress_percent, event.milestone_achieved, event.created_at
+                    )
+                elif event.resource_id:
+                    key = (event.user_profile_id, event.resource_id)
+                    progress = learning_rows.get(key)
+                    if progress is None:
+                        progress, _ = UserLearningProgress.objects.get_or_create(
+                            user_profile_id=event.user_profile_id,
+                            resource_id=event.resource_id,
+                            defaults={
+                                'status': UserLearningProgress.NOT_STARTED,
+                                'progress_percent': 0,
+                            }
+                        )
+                        learning_rows[key] = progress
+                    _apply_learning_update(
+                        progress, event.status, event.progress_percent, event.notes, event.created_at
+                    )
+
+            for progress in list(skill_rows.values()) + list(learning_rows.values()):
+                progress.save()
+            for path, created_count in new_rows_by_path.items():
+                increment_analytics_counter(AnalyticsCounter.SKILL_PATH_PROGRESS, str(path.id), path.name, created_count)
+            ProgressEvent.objects.filter(id__in=[event.id for event in events]).update(compacted=True)
+        total += len(events)
+    return total
 
 
 def get_personalized_youtube_recommendations(
@@ -570,6 +1022,246 @@ def get_personalized_youtube_recommendations(
     )
 
 
+# Feeds older than this are rebuilt even if the catalog has not changed
+FEED_MAX_AGE = timedelta(hours=26)
+FEED_SIZE = 15
+
+
+def _feed_inputs_key(
+    stage: Optional[EducationStage], stream: Optional[Stream], target_role: str, interest_profile: InterestProfile
+) -> str:
+    """Hash the inputs a feed was computed from, so a session with other answers does not reuse it."""
+    inputs = json.dumps(
+        [
+            stage.id if stage else None,
+            stream.code if stream else None,
+            (target_role or "").strip().lower(),
+            interest_profile.to_dict(),
+        ],
+        sort_keys=True,
+    )
+    # A fixed-length digest of the whole description; a long target role must not cut off the answers
+    return hashlib.sha256(inputs.encode("utf-8")).hexdigest()
+
+
+def build_recommendation_feed_payload(
+    user: UserProfile,
+    stage: Optional[EducationStage],
+    stream: Optional[Stream],
+    interest_profile: InterestProfile,
+) -> Dict[str, object]:
+    """Compute the live recommendations a feed stores, as plain JSON-ready data."""
+    resources = get_learning_resources_for_user(
+        user=user, stage=stage, stream=stream, resource_type='VIDEO', limit=FEED_SIZE
+    )
+    careers = get_career_recommendations_for_stream(stream, interest_profile) if stream else []
+    paths = get_skill_paths_for_target(stage, stream, getattr(user, "target_role", ""), interest_profile)
+
+    return {
+        "stream_code": stream.code if stream else None,
+        "resources": [
+            {
+                "id": r.id,
+                "title": r.title,
+                "description": r.description,
+                "url": r.url,
+                "duration_minutes": r.duration_minutes,
+            }
+            for r in resources
+        ],
+        "careers": careers[:FEED_SIZE],
+        "skill_paths": [
+            {"label": label, "id": path.id, "name": path.name} for label, path in paths.items()
+        ],
+    }
+
+
+def materialize_recommendation_feed(
+    user: UserProfile,
+    stage: Optional[EducationStage] = None,
+    stream: Optional[Stream] = None,
+    interest_profile: Optional[InterestProfile] = None,
+) -> Dict[str, object]:
+    """Recompute and store the feed for one user; returns the payload."""
+    stage = stage or user.education_stage
+    interest_profile = interest_profile or InterestProfile()
+
+    # Read the version first so a catalog edit made mid-build marks this feed stale
+    version = CatalogVersion.current()
+    payload = build_recommendation_feed_payload(user, stage, stream, interest_profile)
+    RecommendationFeed.objects.update_or_create(
+        user_profile=user,
+        defaults={
+            "inputs_key": _feed_inputs_key(stage, stream, getattr(user, "target_role", ""), interest_profile),
+            "catalog_version": version,
+            "payload": json.dumps(payload),
+            "generated_at": timezone.now(),
+        },
+    )
+    return payload
+
+
+def get_recommendation_feed(
+    user: UserProfile,
+    stage: Optional[EducationStage] = None,
+    stream: Optional[Stream] = None,
+    interest_profile: Optional[InterestProfile] = None,
+) -> Dict[str, object]:
+    """Return the user's feed with a single query, rebuilding it live only when it is stale.
+
+    A feed is stale when the catalog version moved on, it is older than
+    ``FEED_MAX_AGE``, or it was computed for different session inputs.
+    """
+    stage = stage or user.education_stage
+    interest_profile = interest_profile or InterestProfile()
+
+    current_version = CatalogVersion.objects.filter(pk=CatalogVersion.SINGLETON_ID).values("version")[:1]
+    feed = (
+        RecommendationFeed.objects.filter(user_profile=user)
+        .annotate(current_version=models.Subquery(current_version))
+        .first()
+    )
+    if (
+        feed is not None
+        and feed.catalog_version == (feed.current_version or 0)
+        and feed.generated_at >= timezone.now() - FEED_MAX_AGE
+        and feed.inputs_key == _feed_inputs_key(stage, stream, getattr(user, "target_role", ""), interest_profile)
+    ):
+        return json.loads(feed.payload)
+
+    return materialize_recommendation_feed(user, stage, stream, interest_profile)
+
+
+def latest_session_inputs(user: UserProfile) -> Tuple[Optional[Stream], InterestProfile]:
+    """Recover the Plan A stream and interest profile from the user's last saved session.
+
+    Used by the nightly job, which has no live questionnaire answers to work from.
+    """
+    history = (
+        RecommendationHistory.objects.filter(user_profile=user)
+        .order_by("-created_at")
+        .only("input_data", "payload")
+        .first()
+    )
+    inputs = history.inputs if history else {}
+    if not isinstance(inputs, dict):
+        inputs = {}
+
+    interest_profile = InterestProfile(**{
+        key: int(value) for key, value in (inputs.get("interest_profile") or {}).items()
+        if key in InterestProfile().to_dict()
+    })
+
+    stream = None
+    stage = user.education_stage
+    if stage and stage.code in (EducationStage.HIGH_SCHOOL, EducationStage.HIGHER_SECONDARY):
+        ranked = rank_streams(compute_stream_scores(interest_profile, inputs.get("subject_levels") or {}))
+        if ranked:
+            stream = Stream.objects.filter(code=ranked[0][0]).first()
+    return stream, interest_profile
+
+
+def skill_paths_from_feed(payload: Dict[str, object]) -> Dict[str, SkillPath]:
+    """Load the Plan A/B/C skill paths named in a feed, with their steps prefetched."""
+    entries = payload.get("skill_paths") or []
+    paths = SkillPath.objects.filter(id__in=[e["id"] for e in entries]).prefetch_related(
+        "steps__skill", "steps__difficulty"
+    )
+    by_id = {p.id: p for p in paths}
+    return {e["label"]: by_id[e["id"]] for e in entries if e["id"] in by_id}
+
+
+def export_catalog_snapshot(path: str) -> Dict[str, int]:
+    """Write the read-only catalog to a memory-mapped snapshot file for kiosk clients."""
+    version = CatalogVersion.current()
+
+    option_scores: List[Tuple[int, ...]] = []
+    questions = []
+    options_by_question: Dict[int, List[Dict[str, object]]] = {}
+    for opt in OptionScore.objects.filter(question__is_active=True).order_by("question_id", "id"):
+        options_by_question.setdefault(opt.question_id, []).append(
+            {"id": opt.id, "text": opt.option_text, "row": len(option_scores)}
+        )
+        option_scores.append(tuple(getattr(opt, f"{field}_score") for field in catalog_snapshot.SCORE_FIELDS))
+    for q in Question.objects.filter(is_active=True).order_by("id").values("id", "text", "stage_id", "question_type"):
+        q["options"] = options_by_question.get(q["id"], [])
+        questions.append(q)
+
+    skill_paths = list(SkillPath.objects.order_by("id").values("id", "name", "description", "stage_id", "primary_stream_id"))
+    steps_by_path: Dict[int, List[Dict[str, object]]] = {}
+    for step in SkillPathStep.objects.order_by("skill_path_id", "order_index").values(
+        "id", "skill_path_id", "skill__name", "order_index", "level", "difficulty__label", "estimated_weeks"
+    ):
+        steps_by_path.setdefault(step["skill_path_id"], []).append(step)
+    for skill_path in skill_paths:
+        skill_path["steps"] = steps_by_path.get(skill_path["id"], [])
+
+    catalog = {
+        "stages": list(EducationStage.objects.order_by("id").values("id", "code", "name", "min_class", "max_class")),
+        "streams": list(Stream.objects.order_by("id").values(
+            "id", "code", "name", "pros", "cons", "required_strengths", "key_subjects", "early_preparation_ideas"
+        )),
+        "careers": list(Career.objects.order_by("id").values(
+            "id", "stream_id", "name", "description", "why_it_fits_template", "suggested_exams_text"
+        )),
+        "skill_paths": skill_paths,
+        "questions": questions,
+        "resources": list(LearningResource.objects.filter(is_active=True).order_by("id").values(
+            "id", "title", "description", "url", "resource_type", "stage_id", "stream_id", "duration_minutes"
+        )),
+    }
+    size = catalog_snapshot.write_snapshot(path, catalog, option_scores, catalog_version=version)
+    return {"catalog_version": version, "options": len(option_scores), "questions": len(questions), "bytes": size}
+
+
+# Question banks only change when an admin edits questions or options (see signals.py)
+_question_bank_cache = caching.TTLCache(ttl=None, name="question-bank")
+
+
+def get_question_bank(stage: EducationStage) -> question_bank.QuestionBank:
+    """The stage's frozen :class:`~recommender.question_bank.QuestionBank`, loaded once per process.
+
+    Built from the kiosk catalog snapshot when ``$EDU_CATALOG_SNAPSHOT`` is set,
+    else from the database. Either way it is kept until :func:`invalidate_question_bank`.
+    """
+    snapshot = catalog_snapshot.get_default_snapshot()
+    if snapshot is not None:
+        bank, _ = _question_bank_cache.get(("snapshot", stage.id), lambda: question_bank.from_snapshot(snapshot, stage.id))
+        return bank
+    bank, _ = _question_bank_cache.get(stage.id, lambda: question_bank.load(stage.id))
+    return bank
+
+
+def invalidate_question_bank() -> None:
+    _question_bank_cache.invalidate()
+
+
+def get_questionnaire(stage: EducationStage, limit: int = 5) -> Tuple[question_bank.BankQuestion, ...]:
+    """The first ``limit`` active questions for a stage, each with its ``options``; read-only."""
+    return get_question_bank(stage).first(limit)
+
+
+def get_option_scores(option_ids: List[int], stage: Optional[EducationStage] = None) -> List[Dict[str, int]]:
+    """Interest scores for the chosen options, ready for ``InterestProfile.from_option_scores``.
+
+    With ``stage`` the scores come from that stage's question bank without a query.
+    """
+    if stage is not None:
+        return get_question_bank(stage).option_scores(option_ids)
+
+    snapshot = catalog_snapshot.get_default_snapshot()
+    if snapshot is not None:
+        scores = (snapshot.option_scores_dict(opt_id) for opt_id in option_ids)
+        return [row for row in scores if row is not None]
+
+    by_id = OptionScore.objects.in_bulk(option_ids)
+    return [
+        {field: getattr(by_id[opt_id], f"{field}_score") for field in catalog_snapshot.SCORE_FIELDS}
+        for opt_id in option_ids
+        if opt_id in by_id
+    ]
+
+
 def get_user_milestones(user: UserProfile) -> List[Dict[str, str]]:
     """Get all milestones earned by a user."""
     from .models import UserMilestone
@@ -588,6 +1280,58 @@ def get_user_milestones(user: UserProfile) -> List[Dict[str, str]]:
     return milestones
 
 
+# Dashboard figures change only through progress and milestone writes (see signals.py)
+DASHBOARD_TTL = 300
+DIFFICULTY_LABELS = ("Easy", "Medium", "Hard")
+_dashboard_cache = caching.TTLCache(ttl=DASHBOARD_TTL, name="dashboard")
+
+
+def _compute_dashboard(user: UserProfile) -> Dict[str, object]:
+    counts = {
+        UserSkillProgress.COMPLETED: 0,
+        UserSkillProgress.IN_PROGRESS: 0,
+        UserSkillProgress.NOT_STARTED: 0,
+    }
+    difficulty = dict.fromkeys(DIFFICULTY_LABELS, 0)
+    # Status and difficulty counts both come out of one GROUP BY
+    for status, label, n in (
+        UserSkillProgress.objects.filter(user_profile=user)
+        .values_list("status", "step__difficulty__label")
+        .annotate(n=models.Count("id"))
+        .order_by()
+    ):
+        counts[status] = counts.get(status, 0) + n
+        difficulty[label] = difficulty.get(label, 0) + n
+
+    total = sum(counts.values())
+    completed = counts[UserSkillProgress.COMPLETED]
+    return {
+        "total": total,
+        "completed": completed,
+        "in_progress": counts[UserSkillProgress.IN_PROGRESS],
+        "not_started": counts[UserSkillProgress.NOT_STARTED],
+        "completion_rate": _percent_done(completed, total),
+        "difficulty": difficulty,
+        "milestones": get_user_milestones(user) if total else [],
+    }
+
+
+def get_dashboard(user: UserProfile) -> Dict[str, object]:
+    """Every Dashboard screen figure for ``user`` from at most two queries, cached per user.
+
+    Progress and milestone writes invalidate the user's entry (see
+    ``signals.py``), so the cache never has to wait out ``DASHBOARD_TTL``
+    after a click.
+    """
+    dashboard, _ = _dashboard_cache.get(user.pk, lambda: _compute_dashboard(user))
+    return dict(dashboard)
+
+
+def invalidate_dashboard(user_id: Optional[int] = None) -> None:
+    """Drop the cached dashboard of one user, or of everyone."""
+    _dashboard_cache.invalidate(user_id)
+
+
 def career_switch_roadmap(current_role: str, target_role: str) -> str:
     """Return a text roadmap for professionals switching careers using fixed rules."""
     
@@ -835,53 +1579,149 @@ def get_career_transition_resources(current_role: str, target_role: str) -> List
     return []
 
 
+def increment_analytics_counter(kind: str, key: str, label: str = "", amount: int = 1) -> None:
+    """Atomically add ``amount`` to one analytics counter, creating it on first use."""
+    if not key or not amount:
+        return
+
+    counters = AnalyticsCounter.objects.filter(kind=kind, key=key)
+    if counters.update(count=models.F("count") + amount, updated_at=timezone.now()):
+        return
+    try:
+        with transaction.atomic():
+            AnalyticsCounter.objects.create(kind=kind, key=key, label=label, count=amount)
+    except IntegrityError:
+        # Another writer created it first
+        counters.update(count=models.F("count") + amount, updated_at=timezone.now())
+
+
+def _top_counter(kind: str) -> Optional[AnalyticsCounter]:
+    return AnalyticsCounter.objects.filter(kind=kind, count__gt=0).order_by("-count", "key").first()
+
+
 def offline_analytics_most_chosen_stream() -> Optional[str]:
-    """Use raw SQL over RecommendationHistory.output_streams JSON to get a rough most-chosen stream.
+    """Most frequent Plan A stream code across saved sessions, read from its counter."""
+    counter = _top_counter(AnalyticsCounter.PLAN_A_STREAM)
+    return counter.key if counter else None
+
+
+def offline_analytics_most_popular_skill_path() -> Optional[str]:
+    """Skill path with the most tracked steps, read from its counter."""
+    counter = _top_counter(AnalyticsCounter.SKILL_PATH_PROGRESS)
+    return counter.label if counter else None
+
 
-    This implementation is intentionally simple and may be approximate, but satisfies the
-    "offline analytics via raw SQL" requirement.
+def get_activity_trend(period: str = AnalyticsRollup.WEEK, buckets: int = 8) -> List[Dict[str, object]]:
+    """Per-bucket totals for the last ``buckets`` days/weeks from the rollup table, oldest first."""
+    length = 7 if period == AnalyticsRollup.WEEK else 1
+    since = rollups.bucket_start(timezone.localdate(), period) - timedelta(days=length * (buckets - 1))
+    return list(
+        AnalyticsRollup.objects.filter(period=period, bucket_start__gte=since)
+        .values("bucket_start")
+        .annotate(
+            recommendations=models.Sum("recommendations"),
+            enrollments=models.Sum("enrollments"),
+            completions=models.Sum("completions"),
+            feedback_count=models.Sum("feedback_count"),
+            rating_count=models.Sum("rating_count"),
+            rating_sum=models.Sum("rating_sum"),
+        )
+        .order_by("bucket_start")
+    )
+
+
+# Dashboard figures are cheap to keep and change only when history, progress or feedback is written
+ANALYTICS_SNAPSHOT_TTL = 300
+_analytics_cache = caching.TTLCache(ttl=ANALYTICS_SNAPSHOT_TTL, name="analytics-snapshot")
+
+
+def _compute_analytics_snapshot() -> Dict[str, object]:
+    feedback = get_user_feedback_stats()
+    return {
+        "most_chosen_stream": offline_analytics_most_chosen_stream(),
+        "most_popular_skill_path": offline_analytics_most_popular_skill_path(),
+        "total_users": UserProfile.objects.count(),
+        "total_sessions": RecommendationHistory.objects.count(),
+        "total_feedback": feedback["total_feedback"],
+        "average_rating": feedback["average_rating"],
+        "weekly_trend": get_activity_trend(AnalyticsRollup.WEEK, buckets=8),
+    }
+
+
+def get_analytics_snapshot() -> Dict[str, object]:
+    """All Analytics screen figures in one call, cached for ``ANALYTICS_SNAPSHOT_TTL`` seconds.
+
+    Writes to the underlying tables invalidate the cache (see ``signals.py``);
+    concurrent callers share one computation. ``age_seconds`` tells the screen
+    how old the figures are.
     """
+    snapshot, computed_at = _analytics_cache.get("snapshot", _compute_analytics_snapshot)
+    return dict(snapshot, age_seconds=caching.age_seconds(computed_at))
+
+
+def invalidate_analytics_snapshot() -> None:
+    _analytics_cache.invalidate()
 
+
+def _expected_analytics_counts() -> Dict[Tuple[str, str], Tuple[str, int]]:
+    """Recount every analytics counter from the source tables with raw SQL GROUP BY scans."""
+    stream_labels = dict(Stream.STREAM_CHOICES)
+    expected: Dict[Tuple[str, str], Tuple[str, int]] = {}
     with connection.cursor() as cursor:
         cursor.execute(
             """
-            SELECT
-                CASE
-                    WHEN output_streams LIKE '%SCIENCE%' THEN 'SCIENCE'
-                    WHEN output_streams LIKE '%COMMERCE%' THEN 'COMMERCE'
-                    WHEN output_streams LIKE '%ARTS%' THEN 'ARTS'
-                    WHEN output_streams LIKE '%VOCATIONAL%' THEN 'VOCATIONAL'
-                    ELSE NULL
-                END AS stream_code,
-                COUNT(*) AS cnt
+            SELECT top_stream_code, COUNT(*)
             FROM recommender_recommendationhistory
-            GROUP BY stream_code
-            ORDER BY cnt DESC
-            LIMIT 1
+            WHERE top_stream_code != ''
+            GROUP BY top_stream_code
             """
         )
-        row = cursor.fetchone()
-    if not row or row[0] is None:
-        return None
-    return str(row[0])
-
+        for code, cnt in cursor.fetchall():
+            expected[(AnalyticsCounter.PLAN_A_STREAM, code)] = (stream_labels.get(code, ""), cnt)
+        # Archived sessions were counted when they were saved and still are
+        for code, cnt in history_archive.archived_stream_counts().items():
+            label, hot = expected.get((AnalyticsCounter.PLAN_A_STREAM, code), (stream_labels.get(code, ""), 0))
+            expected[(AnalyticsCounter.PLAN_A_STREAM, code)] = (label, hot + cnt)
 
-def offline_analytics_most_popular_skill_path() -> Optional[str]:
-    with connection.cursor() as cursor:
         cursor.execute(
             """
-            SELECT sp.name, COUNT(*) AS cnt
+            SELECT sp.id, sp.name, COUNT(*)
             FROM recommender_userskillprogress usp
             JOIN recommender_skillpath sp ON usp.skill_path_id = sp.id
-            GROUP BY sp.name
-            ORDER BY cnt DESC
-            LIMIT 1
+            GROUP BY sp.id, sp.name
             """
         )
-        row = cursor.fetchone()
-    if not row:
-        return None
-    return str(row[0])
+        for path_id, name, cnt in cursor.fetchall():
+            expected[(AnalyticsCounter.SKILL_PATH_PROGRESS, str(path_id))] = (name, cnt)
+    return expected
+
+
+def reconcile_analytics_counters(repair: bool = False) -> List[Dict[str, object]]:
+    """Compare counters with a fresh recount and list the ones that drifted.
+
+    With ``repair=True`` drifted counters are overwritten with the recounted
+    values. Run it while the apps are idle so in-flight increments are not lost.
+    """
+    with transaction.atomic():
+        expected = _expected_analytics_counts()
+        actual = {(c.kind, c.key): c for c in AnalyticsCounter.objects.select_for_update()}
+
+        drift: List[Dict[str, object]] = []
+        for kind, key in sorted(set(expected) | set(actual)):
+            label, want = expected.get((kind, key), ("", 0))
+            counter = actual.get((kind, key))
+            have = counter.count if counter else 0
+            if want != have or (counter and label and counter.label != label):
+                drift.append({"kind": kind, "key": key, "label": label, "expected": want, "actual": have})
+
+        if repair:
+            for item in drift:
+                AnalyticsCounter.objects.update_or_create(
+                    kind=item["kind"],
+                    key=item["key"],
+                    defaults={"label": item["label"], "count": item["expected"]},
+                )
+    return drift
 
 
 def submit_user_feedback(
@@ -890,10 +1730,8 @@ def submit_user_feedback(
     rating: Optional[int] = None,
     comment: str = "",
     suggestion: str = ""
-) -> "Feedback":
+) -> Feedback:
     """Submit user feedback and return the created feedback object."""
-    from .models import Feedback
-    
     feedback = Feedback.objects.create(
         user_profile=user_profile,
         feedback_type=feedback_type,
@@ -901,32 +1739,125 @@ def submit_user_feedback(
         comment=comment,
         suggestion=suggestion
     )
+    invalidate_feedback_stats()
     return feedback
 
 
-def get_user_feedback_stats() -> Dict[str, object]:
-    """Get statistics about user feedback for analytics dashboard."""
-    from .models import Feedback
-    
-    total_feedback = Feedback.objects.count()
-    resolved_feedback = Feedback.objects.filter(is_resolved=True).count()
-    avg_rating = Feedback.objects.exclude(rating__isnull=True).aggregate(
-        avg=models.Avg('rating')
-    )['avg']
-    
-    # Feedback by type
-    feedback_by_type = {}
-    for feedback_type, _ in Feedback.FEEDBACK_TYPES:
-        count = Feedback.objects.filter(feedback_type=feedback_type).count()
-        feedback_by_type[feedback_type] = count
-    
-    # Recent feedback
-    recent_feedback = Feedback.objects.select_related('user_profile').order_by('-created_at')[:5]
-    
+def _write_feedback(batch: List[Feedback]) -> None:
+    with transaction.atomic():
+        Feedback.objects.bulk_create(batch)
+    # bulk_create sends no post_save, so drop the cached figures here
+    invalidate_feedback_stats()
+    invalidate_analytics_snapshot()
+
+
+# Shared lab machines write to one SQLite file; batching and lock retries keep submissions off the GUI thread
+_feedback_writer = BufferedWriter(
+    _write_feedback,
+    max_pending=20,
+    flush_interval=2.0,
+    name="feedback-writer",
+    max_buffer=1000,
+    retryable=is_database_locked,
+    flush_at_exit=True,
+)
+
+
+def queue_user_feedback(
+    user_profile: Optional[UserProfile],
+    feedback_type: str,
+    rating: Optional[int] = None,
+    comment: str = "",
+    suggestion: str = ""
+) -> Feedback:
+    """Queue feedback for the background writer and return the unsaved object.
+
+    Falls back to a synchronous :func:`submit_user_feedback` if the queue stays
+    full (the writer cannot keep up or the database is locked for long).
+    """
+    feedback = Feedback(
+        user_profile=user_profile,
+        feedback_type=feedback_type,
+        rating=rating,
+        comment=comment,
+        suggestion=suggestion,
+    )
+    try:
+        _feedback_writer.append(feedback)
+    except BufferFull:
+        return submit_user_feedback(user_profile, feedback_type, rating, comment, suggestion)
+    return feedback
+
+
+def flush_feedback() -> int:
+    """Write any queued feedback now; returns how many rows were written."""
+    return _feedback_writer.flush()
+
+
+FEEDBACK_STATS_TTL = 300
+_feedback_stats_cache = caching.TTLCache(ttl=FEEDBACK_STATS_TTL, name="feedback-stats")
+_FEEDBACK_PERIODS = {"week": TruncWeek, "month": TruncMonth}
+
+
+def _compute_feedback_stats(period: str) -> Dict[str, object]:
+    # One GROUP BY pass; every figure below is derived from the (period, type, resolved, rating) groups
+    groups = (
+        Feedback.objects.annotate(period=_FEEDBACK_PERIODS[period]("created_at"))
+        .values("period", "feedback_type", "is_resolved", "rating")
+        .annotate(n=models.Count("id"))
+        .order_by()
+    )
+
+    total = resolved = rating_count = rating_sum = 0
+    feedback_by_type = {feedback_type: 0 for feedback_type, _ in Feedback.FEEDBACK_TYPES}
+    histograms: Dict[object, Dict[str, object]] = {}
+    for group in groups:
+        n = group["n"]
+        total += n
+        if group["is_resolved"]:
+            resolved += n
+        feedback_by_type[group["feedback_type"]] = feedback_by_type.get(group["feedback_type"], 0) + n
+
+        start = group["period"].date() if isinstance(group["period"], datetime) else group["period"]
+        bucket = histograms.get(start)
+        if bucket is None:
+            bucket = histograms[start] = {
+                "period_start": start,
+                "count": 0,
+                "unrated": 0,
+                "ratings": {rating: 0 for rating in range(1, 6)},
+            }
+        bucket["count"] += n
+        if group["rating"] is None:
+            bucket["unrated"] += n
+            continue
+        rating_count += n
+        rating_sum += group["rating"] * n
+        bucket["ratings"][group["rating"]] = bucket["ratings"].get(group["rating"], 0) + n
+
+    average = rating_sum / rating_count if rating_count else None
     return {
-        'total_feedback': total_feedback,
-        'resolved_feedback': resolved_feedback,
-        'average_rating': round(avg_rating, 1) if avg_rating else None,
-        'feedback_by_type': feedback_by_type,
-        'recent_feedback': recent_feedback
+        "total_feedback": total,
+        "resolved_feedback": resolved,
+        "average_rating": round(average, 1) if average else None,
+        "feedback_by_type": feedback_by_type,
+        "rating_histograms": [histograms[start] for start in sorted(histograms)],
+        "recent_feedback": list(Feedback.objects.select_related("user_profile").order_by("-created_at")[:5]),
     }
+
+
+def get_user_feedback_stats(period: str = "week") -> Dict[str, object]:
+    """Get statistics about user feedback for analytics dashboard.
+
+    Totals, per-type counts, the average rating and per-``period`` ("week" or
+    "month") rating histograms come from one grouped query. The result is
+    cached until feedback is submitted or edited, or for ``FEEDBACK_STATS_TTL``
+    seconds.
+    """
+    stats, _computed_at = _feedback_stats_cache.get(period, lambda: _compute_feedback_stats(period))
+    return stats
+
+
+def invalidate_feedback_stats() -> None:
+    _feedback_stats_cache.invalidate()
+
@@ -0,0 +1,180 @@
+"""Session-scoped recommendation view model shared by both GUIs.
+
+A :class:`RecommendationSession` holds everything the Results and Skill Roadmap
+screens show for one set of answers. That covers the interest profile, the
+stream plans with Plan A careers, the activities and tips, the career switch
+roadmap and the skill paths. Each part is computed the first time it is asked
+for. Rendering, read-aloud and :meth:`RecommendationSession.save_history` then
+reuse it. :func:`current` keeps the session on the GUI's screen manager and
+replaces it only when the user, stage or answers change.
+"""
+
+import threading
+from typing import Dict, List, Optional, Tuple
+
+from . import services
+from .models import EducationStage, RecommendationHistory, SkillPath, SkillPathStep, Stream, UserProfile
+
+STREAM_STAGES = (EducationStage.HIGH_SCHOOL, EducationStage.HIGHER_SECONDARY)
+SCHOOL_STAGES = (EducationStage.PRIMARY, EducationStage.MIDDLE)
+PLAN_LABELS = ("Plan A", "Plan B", "Plan C")
+
+COUNSELOR_NOTE = (
+    "Counselor mode: focus on the student's curiosities, comfort with subjects, and wellbeing. "
+    "Use this tool as a guide, and combine it with your own observations."
+)
+SKILL_PATHS_NOTE = (
+    "We will suggest skill paths based on your interests and education level. "
+    "You can then track progress step by step."
+)
+
+
+class RecommendationSession:
+    def __init__(
+        self,
+        user: UserProfile,
+        stage: EducationStage,
+        interest_answers: List[Dict[str, int]],
+        subject_levels: Dict[str, int],
+    ):
+        self.user = user
+        self.stage = stage
+        self.subject_levels = dict(subject_levels or {})
+        self.profile = services.InterestProfile.from_option_scores(list(interest_answers or []))
+        self.key = session_key(user, stage, self.profile, self.subject_levels)
+        self.history: Optional[RecommendationHistory] = None
+        # Screens ask from the UI thread and from loader threads
+        self._lock = threading.RLock()
+        self._results: Optional[Dict[str, object]] = None
+        self._feeds: Dict[Optional[int], Dict[str, object]] = {}
+        self._skill_paths: Optional[List[Tuple[str, SkillPath, List[SkillPathStep]]]] = None
+
+    def _feed(self, stream: Optional[Stream]) -> Dict[str, object]:
+        key = stream.pk if stream else None
+        if key not in self._feeds:
+            self._feeds[key] = services.get_recommendation_feed(self.user, self.stage, stream, self.profile)
+        return self._feeds[key]
+
+    def results(self) -> Dict[str, object]:
+        """``streams`` with Plan A ``careers``, ``activities`` and ``tips``, or ``roadmap``, by stage."""
+        with self._lock:
+            if self._results is None:
+                data = {"streams": {}, "careers": [], "activities": [], "tips": [], "roadmap": ""}
+                code = self.stage.code
+                if code in STREAM_STAGES:
+                    streams = services.recommend_streams_with_explanations(self.profile, self.subject_levels)
+                    data["streams"] = streams
+                    if "Plan A" in streams:
+                        data["careers"] = self._feed(streams["Plan A"]["stream"])["careers"]
+                elif code in SCHOOL_STAGES:
+                    data["activities"] = list(services.get_activity_suggestions(self.stage))
+                    data["tips"] = list(services.get_motivation_tips(self.stage, audience="SCHOOL"))
+                elif code == EducationStage.PROFESSIONAL:
+                    data["roadmap"] = services.career_switch_roadmap(self.user.current_role, self.user.target_role)
+                self._results = data
+            return self._results
+
+    def plan_a_stream(self) -> Optional[Stream]:
+        if self.stage.code not in STREAM_STAGES:
+            return None
+        plan_a = self.results()["streams"].get("Plan A")
+        return plan_a["stream"] if plan_a else None
+
+    def skill_paths(self) -> List[Tuple[str, SkillPath, List[SkillPathStep]]]:
+        """``(label, path, steps)`` for each plan, steps with skill and difficulty loaded."""
+        with self._lock:
+            if self._skill_paths is None:
+                paths = services.skill_paths_from_feed(self._feed(self.plan_a_stream()))
+                self._skill_paths = [
+                    (label, path, list(path.steps.select_related("skill", "difficulty")))
+                    for label, path in paths.items()
+                ]
+            return self._skill_paths
+
+    def results_read_aloud(self) -> str:
+        """What the Results screen's read-aloud button speaks, one item per line."""
+        data = self.results()
+        code = self.stage.code
+        lines = []
+        if code in STREAM_STAGES:
+            lines.append("Here are your stream recommendations:")
+            for label in PLAN_LABELS:
+                plan = data["streams"].get(label)
+                if not plan:
+                    continue
+                lines.append(f"{label}: {plan['stream'].name} stream.")
+                lines.append(plan["explanation"])
+                if label == "Plan A" and data["careers"]:
+                    lines.append("Career directions for this stream:")
+                    lines.extend(f"{c['name']}. {c['why_fit']}" for c in data["careers"])
+        elif code in SCHOOL_STAGES:
+            lines.append("Here are growth activities for your stage:")
+            lines.extend(services.read_aloud_activity(act) for act in data["activities"])
+            if data["tips"]:
+                lines.append("Here are some motivation tips:")
+                lines.extend(t.text for t in data["tips"])
+        elif code in (EducationStage.UG, EducationStage.PG):
+            lines.append(SKILL_PATHS_NOTE)
+        elif code == EducationStage.PROFESSIONAL:
+            lines.append("Here is your career switch roadmap:")
+            lines.append(data["roadmap"])
+        else:
+            lines.append(COUNSELOR_NOTE)
+        # One item per line so each is split into the same sentences the TTS cache pre-renders
+        return "\n".join(lines)
+
+    def skill_paths_read_aloud(self) -> str:
+        """What the Skill Roadmap screen's read-aloud button speaks, one item per line."""
+        lines = ["Here are your skill path roadmaps:"]
+        plans = self.skill_paths()
+        if not plans:
+            lines.append("No skill paths are currently defined.")
+        for label, path, steps in plans:
+            lines.append(f"{label}: {path.name}.")
+            if path.description:
+                lines.append(path.description)
+            if steps:
+                lines.append("Steps for this path:")
+                lines.extend(services.read_aloud_step(i, step) for i, step in enumerate(steps, 1))
+        return "\n".join(lines)
+
+    def save_history(self) -> RecommendationHistory:
+        """Save this session to the user's history once; later calls return the same row."""
+        with self._lock:
+            if self.history is None:
+                data = self.results()
+                self.history = services.save_recommendation_history(
+                    self.user,
+                    self.stage.name,
+                    {"interest_profile": self.profile.to_dict(), "subject_levels": self.subject_levels},
+                    data["streams"],
+                    data["careers"],
+                    {label: path for label, path, _ in self.skill_paths()},
+                )
+            return self.history
+
+
+def session_key(user, stage, profile: services.InterestProfile, subject_levels: Dict[str, int]) -> tuple:
+    return (
+        user.pk if user else None,
+        stage.pk if stage else None,
+        tuple(profile.to_dict().values()),
+        tuple(sorted(subject_levels.items())),
+    )
+
+
+def current(holder) -> RecommendationSession:
+    """The session for ``holder``'s current inputs, reused while they stay the same.
+
+    ``holder`` is either GUI's screen manager: it carries ``current_user``,
+    ``current_stage``, ``interest_answers`` and ``subject_levels`` and keeps
+    the session in its ``session`` attribute.
+    """
+    session = getattr(holder, "session", None)
+    profile = services.InterestProfile.from_option_scores(list(holder.interest_answers or []))
+    key = session_key(holder.current_user, holder.current_stage, profile, dict(holder.subject_levels or {}))
+    if session is None or session.key != key:
+        session = holder.session = RecommendationSession(
+            holder.current_user, holder.current_stage, holder.interest_answers, holder.subject_levels
+        )
+    return session
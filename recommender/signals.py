@@ -0,0 +1,98 @@
+"""Model signal handlers for the recommender app."""
+
+from django.apps import apps
+from django.db.models.signals import post_delete, post_migrate, post_save
+
+from . import fingerprints, services
+from .models import (
+    AnalyticsRollup,
+    CatalogVersion,
+    Career,
+    Feedback,
+    LearningResource,
+    OptionScore,
+    Question,
+    RecommendationHistory,
+    RecommendationRule,
+    Skill,
+    SkillPath,
+    SkillPathStep,
+    Stream,
+    UserLearningProgress,
+    UserMilestone,
+    UserProfile,
+    UserSkillProgress,
+)
+
+# Edits to any of these invalidate materialized recommendation feeds
+CATALOG_MODELS = (Stream, Career, Skill, SkillPath, SkillPathStep, LearningResource, RecommendationRule)
+
+
+def bump_catalog_version(sender, **kwargs) -> None:
+    CatalogVersion.bump()
+
+
+for _model in CATALOG_MODELS:
+    post_save.connect(bump_catalog_version, sender=_model, dispatch_uid=f"catalog-save-{_model.__name__}")
+    post_delete.connect(bump_catalog_version, sender=_model, dispatch_uid=f"catalog-delete-{_model.__name__}")
+
+
+# Writes to any of these change the figures on the Analytics screen
+ANALYTICS_MODELS = (
+    UserProfile,
+    RecommendationHistory,
+    UserSkillProgress,
+    UserLearningProgress,
+    Feedback,
+    AnalyticsRollup,
+)
+
+
+def invalidate_analytics(sender, **kwargs) -> None:
+    services.invalidate_analytics_snapshot()
+
+
+for _model in ANALYTICS_MODELS:
+    post_save.connect(invalidate_analytics, sender=_model, dispatch_uid=f"analytics-save-{_model.__name__}")
+    post_delete.connect(invalidate_analytics, sender=_model, dispatch_uid=f"analytics-delete-{_model.__name__}")
+
+
+def invalidate_feedback_stats(sender, **kwargs) -> None:
+    # submit_user_feedback invalidates too; this covers admin edits such as marking feedback resolved
+    services.invalidate_feedback_stats()
+
+
+post_save.connect(invalidate_feedback_stats, sender=Feedback, dispatch_uid="feedback-stats-save")
+post_delete.connect(invalidate_feedback_stats, sender=Feedback, dispatch_uid="feedback-stats-delete")
+
+
+def invalidate_dashboard(sender, instance, **kwargs) -> None:
+    # Covers direct updates, event compaction and milestone awards alike
+    services.invalidate_dashboard(instance.user_profile_id)
+
+
+for _model in (UserSkillProgress, UserMilestone):
+    post_save.connect(invalidate_dashboard, sender=_model, dispatch_uid=f"dashboard-save-{_model.__name__}")
+    post_delete.connect(invalidate_dashboard, sender=_model, dispatch_uid=f"dashboard-delete-{_model.__name__}")
+
+
+def invalidate_question_bank(sender, **kwargs) -> None:
+    # Admin edits are rare, and a question can move between stages, so drop every stage
+    services.invalidate_question_bank()
+
+
+for _model in (Question, OptionScore):
+    post_save.connect(invalidate_question_bank, sender=_model, dispatch_uid=f"question-bank-save-{_model.__name__}")
+    post_delete.connect(invalidate_question_bank, sender=_model, dispatch_uid=f"question-bank-delete-{_model.__name__}")
+
+
+def record_migrations_fingerprint(sender, **kwargs) -> None:
+    # Lets the launcher skip the next migrate; skipped while any migration is left unapplied
+    fingerprints.record_migrations()
+
+
+post_migrate.connect(
+    record_migrations_fingerprint,
+    sender=apps.get_app_config("recommender"),
+    dispatch_uid="migrations-fingerprint",
+)
@@ -0,0 +1,335 @@
+"""Text-to-speech on a dedicated worker thread.
+
+``pyttsx3`` engines block in ``runAndWait()`` and must be driven from the
+thread that created them, so :class:`SpeechWorker` owns the engine on its own
+thread. Text is split into sentences and spoken one at a time, which lets
+:meth:`SpeechWorker.cancel` and higher-priority requests cut in between
+sentences (and between words, through the engine's ``started-word`` callback).
+Progress and completion callbacks are handed to ``dispatch`` so a GUI can run
+them on its own thread, as with :class:`recommender.background.TaskPool`.
+
+With a :class:`recommender.tts_cache.TTSCache` each sentence is rendered to a
+WAV once and played from disk afterwards, instead of being synthesised again.
+"""
+
+import heapq
+import itertools
+import re
+import shutil
+import subprocess
+import sys
+import threading
+import wave
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+Dispatch = Callable[[Callable[[], None]], None]
+
+NORMAL = 0
+HIGH = 10
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+|\n+")
+MAX_SENTENCE_CHARS = 300
+
+
+def split_sentences(text: str, max_chars: int = MAX_SENTENCE_CHARS) -> List[str]:
+    """Split text at sentence ends and line breaks; over-long sentences are split at commas."""
+    sentences = []
+    for sentence in _SENTENCE_END.split(text or ""):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            cut = sentence.rfind(", ", 0, max_chars)
+            if cut <= 0:
+                cut = sentence.rfind(" ", 0, max_chars)
+            if cut <= 0:
+                cut = max_chars
+            sentences.append(sentence[: cut + 1].strip())
+            sentence = sentence[cut + 1 :].strip()
+        if sentence:
+            sentences.append(sentence)
+    return sentences
+
+
+def create_pyttsx3_engine():
+    """Create the pyttsx3 engine with the app's default voice settings."""
+    import pyttsx3
+
+    engine = pyttsx3.init()
+    engine.setProperty('rate', 150)  # Speed of speech
+    engine.setProperty('volume', 0.9)  # Volume level (0.0 to 1.0)
+
+    # Try to select a female voice if available (often clearer for instructions)
+    for voice in engine.getProperty('voices'):
+        if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
+            engine.setProperty('voice', voice.id)
+            break
+    return engine
+
+
+def _external_player() -> Optional[List[str]]:
+    for command in ("afplay", "aplay", "paplay"):
+        if shutil.which(command):
+            return [command, "-q"] if command == "aplay" else [command]
+    return None
+
+
+def can_play_wav() -> bool:
+    return sys.platform == "win32" or _external_player() is not None
+
+
+def play_wav(path: Path, cancelled: threading.Event) -> bool:
+    """Play a WAV file, returning early if ``cancelled`` is set; False if no player exists."""
+    if sys.platform == "win32":
+        import winsound
+
+        with wave.open(str(path), "rb") as wav:
+            duration = wav.getnframes() / float(wav.getframerate() or 1)
+        winsound.PlaySound(str(path), winsound.SND_FILENAME | winsound.SND_ASYNC)
+        if cancelled.wait(duration):
+            winsound.PlaySound(None, 0)
+        return True
+
+    player = _external_player()
+    if player is None:
+        return False
+    process = subprocess.Popen(player + [str(path)], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    while process.poll() is None:
+        if cancelled.wait(0.05):
+            process.terminate()
+            process.wait()
+            break
+    return True
+
+
+@dataclass
+class Utterance:
+    sentences: List[str]
+    priority: int = NORMAL
+    properties: Dict[str, object] = field(default_factory=dict)
+    on_progress: Optional[Callable[[int, int, str], None]] = None
+    on_done: Optional[Callable[[bool], None]] = None
+    cancelled: threading.Event = field(default_factory=threading.Event)
+
+    def cancel(self) -> None:
+        self.cancelled.set()
+
+
+class SpeechWorker:
+    """Queue of utterances spoken one sentence at a time on a daemon thread.
+
+    ``engine_factory`` is called on the worker thread and must return a
+    ``pyttsx3``-style engine (``say``, ``runAndWait``, ``stop``,
+    ``getProperty``, ``setProperty`` and optionally ``connect``). If it
+    raises, the worker stays up but speaks nothing and :attr:`available` is
+    false.
+
+    With ``cache`` set, sentences are played through ``player`` from
+    pre-rendered WAV files (rendered with ``save_to_file`` on a miss); the
+    engine speaks directly only when that fails.
+    """
+
+    def __init__(
+        self,
+        engine_factory: Callable[[], object],
+        dispatch: Optional[Dispatch] = None,
+        name: str = "speech",
+        cache=None,
+        player: Callable[[Path, threading.Event], bool] = play_wav,
+    ):
+        self.engine_factory = engine_factory
+        self.dispatch = dispatch or (lambda callback: callback())
+        self.name = name
+        self.cache = cache
+        self.player = player
+        self.available = False
+        self.voices: List[object] = []
+
+        self._engine = None
+        self._queue: List[tuple] = []
+        self._seq = itertools.count()
+        self._properties: Dict[str, object] = {}
+        self._pending_properties: Dict[str, object] = {}
+        self._current: Optional[Utterance] = None
+        self._cond = threading.Condition()
+        self._ready = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(target=self._run, name=name, daemon=True)
+        self._thread.start()
+
+    # --- called from the GUI thread -------------------------------------------------
+
+    def speak(
+        self,
+        text: str,
+        priority: int = NORMAL,
+        interrupt: bool = False,
+        properties: Optional[Dict[str, object]] = None,
+        on_progress: Optional[Callable[[int, int, str], None]] = None,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ) -> Utterance:
+        """Queue ``text`` and return its :class:`Utterance` handle.
+
+        Utterances are spoken highest ``priority`` first. One with a higher
+        priority than the utterance being spoken interrupts it (the
+        interrupted one is dropped); ``interrupt=True`` also drops everything
+        still queued. ``properties`` (``rate``, ``volume``, ``voice``) apply
+        to this utterance only. ``on_progress(index, total, sentence)`` runs
+        before each sentence and ``on_done(completed)`` once at the end.
+        """
+        utterance = Utterance(
+            sentences=split_sentences(text),
+            priority=priority,
+            properties=dict(properties or {}),
+            on_progress=on_progress,
+            on_done=on_done,
+        )
+        with self._cond:
+            if interrupt:
+                self._drop_queued()
+            current = self._current
+            if current is not None and (interrupt or priority > current.priority):
+                self._stop_current()
+            heapq.heappush(self._queue, (-priority, next(self._seq), utterance))
+            self._cond.notify()
+        return utterance
+
+    def cancel(self) -> None:
+        """Stop the sentence being spoken and drop everything queued."""
+        with self._cond:
+            self._drop_queued()
+            self._stop_current()
+
+    def set_property(self, name: str, value: object) -> None:
+        """Change ``rate``, ``volume`` or ``voice``; applied before the next sentence."""
+        with self._cond:
+            self._properties[name] = value
+            self._pending_properties[name] = value
+            self._cond.notify()
+
+    def get_property(self, name: str, default: object = None) -> object:
+        """Last known value of an engine property, without touching the engine."""
+        with self._cond:
+            return self._properties.get(name, default)
+
+    def is_speaking(self) -> bool:
+        with self._cond:
+            return self._current is not None or bool(self._queue)
+
+    def wait_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the engine to initialise; true if it is usable."""
+        self._ready.wait(timeout)
+        return self.available
+
+    def close(self, timeout: float = 2.0) -> None:
+        with self._cond:
+            self._stopped = True
+            self._drop_queued()
+            self._stop_current()
+            self._cond.notify()
+        self._thread.join(timeout)
+
+    # --- internals --------------------------------------------------------------------
+
+    def _drop_queued(self) -> None:
+        for _, _, utterance in self._queue:
+            utterance.cancel()
+            self._finish(utterance, False)
+        self._queue.clear()
+
+    def _stop_current(self) -> None:
+        # The engine itself is stopped from its own thread, in _on_word
+        if self._current is not None:
+            self._current.cancel()
+
+    def _finish(self, utterance: Utterance, completed: bool) -> None:
+        if utterance.on_done is not None:
+            self.dispatch(lambda: utterance.on_done(completed))
+
+    def _on_word(self, *args) -> None:
+        current = self._current
+        if current is not None and current.cancelled.is_set():
+            self._engine.stop()
+
+    def _init_engine(self) -> None:
+        try:
+            self._engine = self.engine_factory()
+            try:
+                self._engine.connect("started-word", self._on_word)
+            except AttributeError:
+                pass
+            with self._cond:
+                for name in ("rate", "volume", "voice"):
+                    self._properties.setdefault(name, self._engine.getProperty(name))
+                self.voices = list(self._engine.getProperty("voices") or [])
+            self.available = True
+        except Exception as e:
+            print(f"Text-to-speech initialization failed: {e}")
+            self._engine = None
+        finally:
+            self._ready.set()
+
+    def _apply(self, properties: Dict[str, object]) -> None:
+        for name, value in properties.items():
+            self._engine.setProperty(name, value)
+
+    def _run(self) -> None:
+        self._init_engine()
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopped:
+                    self._cond.wait()
+                if self._stopped:
+                    return
+                _, _, utterance = heapq.heappop(self._queue)
+                self._current = utterance
+                pending, self._pending_properties = self._pending_properties, {}
+            if self._engine is None:
+                completed = False
+            else:
+                completed = self._speak(utterance, pending)
+            with self._cond:
+                self._current = None
+            self._finish(utterance, completed)
+
+    def _speak(self, utterance: Utterance, pending: Dict[str, object]) -> bool:
+        total = len(utterance.sentences)
+        try:
+            self._apply(pending)
+            self._apply(utterance.properties)
+            for index, sentence in enumerate(utterance.sentences):
+                if utterance.cancelled.is_set():
+                    return False
+                with self._cond:
+                    pending, self._pending_properties = self._pending_properties, {}
+                self._apply(pending)
+                if utterance.on_progress is not None:
+                    self.dispatch(lambda i=index, s=sentence: utterance.on_progress(i, total, s))
+                if not self._play_cached(sentence, utterance):
+                    self._engine.say(sentence)
+                    self._engine.runAndWait()
+            return not utterance.cancelled.is_set()
+        except Exception as e:
+            print(f"Text-to-speech failed: {e}")
+            return False
+        finally:
+            # Per-utterance overrides end here; fall back to the worker-wide settings
+            with self._cond:
+                restore = {name: self._properties.get(name) for name in utterance.properties}
+            try:
+                self._apply({name: value for name, value in restore.items() if value is not None})
+            except Exception as e:
+                print(f"Text-to-speech failed to restore settings: {e}")
+
+    def _play_cached(self, sentence: str, utterance: Utterance) -> bool:
+        if self.cache is None:
+            return False
+        voice, rate, volume = (self._engine.getProperty(name) for name in ("voice", "rate", "volume"))
+        try:
+            path = self.cache.get(sentence, voice, rate, volume)
+            if path is None:
+                path = self.cache.render(self._engine, sentence, voice, rate, volume)
+            return path is not None and self.player(path, utterance.cancelled)
+        except Exception as e:
+            print(f"Cached speech playback failed, speaking directly: {e}")
+            return False
@@ -2,15 +2,55 @@
 Tests for the Edu & Skill Path Recommender application.
 """
 
+import importlib
+import importlib.util
+import io
+import json
+import mmap
+import os
+import subprocess
+import sys
+import tempfile
+import threading
+import time
 import unittest
-from django.test import TestCase
+from unittest import mock
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from django.utils import timezone
+from datetime import timedelta
+from recommender import analytics_export, background, buffering, caching, catalog_snapshot, fingerprints, history_archive, instrumentation, rollups, speech, tts_cache
+from recommender.buffering import BufferedWriter
 from recommender.models import (
     EducationStage, 
     UserProfile, 
-    Feedback
+    Feedback,
+    Skill,
+    SkillDifficulty,
+    SkillPath,
+    SkillPathStep,
+    UserSkillProgress,
+    LearningResource,
+    UserLearningProgress,
+    ProgressEvent,
+    RecommendationFeed,
+    Question,
+    OptionScore,
+    Stream,
+    Career,
+    RecommendationHistory,
+    AnalyticsCounter,
+    AnalyticsRollup,
+    ScreenTiming,
+    ActivitySuggestion,
+    MotivationTip,
+    Milestone,
+    UserMilestone,
+    SetupFingerprint
 )
 from recommender import services
+from recommender import session as sessions
 
 
 class FeedbackTestCase(TestCase):
@@ -120,6 +160,95 @@ class FeedbackTestCase(TestCase):
         self.assertIn('UI_EXPERIENCE', stats['feedback_by_type'])
         self.assertIn('GENERAL', stats['feedback_by_type'])
         self.assertEqual(len(stats['recent_feedback']), 3)
+    
+    def test_feedback_stats_single_query_and_cache(self):
+        """Aggregates come from one grouped query, are cached, and refresh after a submission."""
+        services.invalidate_feedback_stats()
+        Feedback.objects.create(feedback_type="RECOMMENDATION", rating=5)
+        Feedback.objects.create(feedback_type="RECOMMENDATION", rating=3, is_resolved=True)
+        old = Feedback.objects.create(feedback_type="GENERAL")
+        Feedback.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=14))
+        services.invalidate_feedback_stats()
+        
+        with self.assertNumQueries(2):  # grouped aggregate + recent rows
+            stats = services.get_user_feedback_stats()
+        with self.assertNumQueries(0):
+            services.get_user_feedback_stats()
+        
+        self.assertEqual((stats["total_feedback"], stats["resolved_feedback"], stats["average_rating"]), (3, 1, 4.0))
+        self.assertEqual(stats["feedback_by_type"]["RECOMMENDATION"], 2)
+        self.assertEqual(len(stats["rating_histograms"]), 2)
+        latest = stats["rating_histograms"][-1]
+        self.assertEqual((latest["count"], latest["ratings"][5], latest["ratings"][3]), (2, 1, 1))
+        self.assertEqual(stats["rating_histograms"][0]["unrated"], 1)
+        
+        services.submit_user_feedback(self.user, "GENERAL", rating=1)
+        self.assertEqual(services.get_user_feedback_stats()["total_feedback"], 4)
+    
+    def test_queued_feedback_is_written_in_batches(self):
+        """Queued feedback reaches the database on flush and refreshes the cached stats."""
+        services.invalidate_feedback_stats()
+        writer = BufferedWriter(services._write_feedback, flush_interval=None, max_buffer=2, block_timeout=0)
+        with mock.patch.object(services, "_feedback_writer", writer):
+            services.queue_user_feedback(self.user, "GENERAL", rating=4)
+            services.queue_user_feedback(None, "BUG_REPORT")
+            self.assertEqual(services.get_user_feedback_stats()["total_feedback"], 0)
+            
+            # Queue full and no writer thread: falls back to a direct insert
+            services.queue_user_feedback(self.user, "GENERAL", rating=2)
+            self.assertEqual(Feedback.objects.count(), 1)
+            
+            with self.assertNumQueries(3):  # savepoint, one INSERT for the batch, release
+                self.assertEqual(services.flush_feedback(), 2)
+        
+        self.assertEqual(services.get_user_feedback_stats()["total_feedback"], 3)
+    
+    def test_writer_retries_locked_database(self):
+        """A 'database is locked' error is retried, then the batch is put back."""
+        from django.db import OperationalError
+        
+        calls = []
+        
+        def flaky(batch):
+            calls.append(list(batch))
+            if len(calls) < 3:
+                raise OperationalError("database is locked")
+        
+        writer = BufferedWriter(flaky, flush_interval=None, retryable=buffering.is_database_locked, retry_delay=0)
+        writer.append("a")
+        self.assertEqual(writer.flush(), 1)
+        self.assertEqual(len(calls), 3)
+        
+        def locked(batch):
+            raise OperationalError("database is locked")
+        
+        writer = BufferedWriter(locked, flush_interval=None, retryable=buffering.is_database_locked, retries=1, retry_delay=0)
+        writer.append("b")
+        with self.assertRaises(OperationalError):
+            writer.flush()
+        self.assertEqual(writer.pending_count(), 1)
+    
+    def test_writer_drops_only_items_that_cannot_be_written(self):
+        """Any other error drops the failing item and writes the rest of the batch."""
+        from django.db import IntegrityError
+        
+        written = []
+        
+        def write(batch):
+            if "bad" in batch:
+                raise IntegrityError("FOREIGN KEY constraint failed")
+            written.extend(batch)
+        
+        writer = BufferedWriter(write, flush_interval=None, retryable=buffering.is_database_locked, retry_delay=0)
+        for item in ("a", "bad", "c"):
+            writer.append(item)
+        with mock.patch("builtins.print"):
+            self.assertEqual(writer.flush(), 2)
+        
+        self.assertEqual(written, ["a", "c"])
+        self.assertEqual((writer.pending_count(), writer.failed), (0, 1))
+        writer.append("d")
+        self.assertEqual(writer.flush(), 1)
 
 
 class ModelTestCase(TestCase):
@@ -148,5 +277,1244 @@ class ModelTestCase(TestCase):
         self.assertEqual(str(user), "John Doe")
 
 
+class ProgressEventTestCase(TestCase):
+    """Test cases for the buffered progress event log and its compaction."""
+    
+    def setUp(self):
+        """Set up test data and a writer that only flushes on demand."""
+        self.stage = EducationStage.objects.create(
+            code=EducationStage.UG,
+            name="Undergraduate",
+            description="Undergraduate education stage"
+        )
+        self.user = UserProfile.objects.create(
+            name="Test User",
+            education_stage=self.stage,
+            age=20
+        )
+        difficulty = SkillDifficulty.objects.create(code=SkillDifficulty.EASY, label="Easy")
+        self.path = SkillPath.objects.create(name="Python Basics", stage=self.stage)
+        self.step = SkillPathStep.objects.create(
+            skill_path=self.path,
+            skill=Skill.objects.create(name="Python"),
+            order_index=1,
+            difficulty=difficulty,
+            level=1
+        )
+        self.resource = LearningResource.objects.create(
+            title="Intro video",
+            url="https://example.com/intro"
+        )
+        
+        writer = BufferedWriter(services._write_progress_events, flush_interval=None)
+        patcher = mock.patch.object(services, "_progress_event_writer", writer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_events_are_buffered_until_flush(self):
+        """Recording an event does not touch the progress tables until a flush."""
+        services.record_skill_step_event(self.user, self.step, status=UserSkillProgress.IN_PROGRESS)
+        
+        self.assertEqual(ProgressEvent.objects.count(), 0)
+        self.assertEqual(services.flush_progress_events(), 1)
+        self.assertEqual(ProgressEvent.objects.count(), 1)
+    
+    def test_last_event_wins_per_step(self):
+        """Several events for one step fold into a single progress row."""
+        services.record_skill_step_event(self.user, self.step, status=UserSkillProgress.IN_PROGRESS)
+        services.record_skill_step_event(self.user, self.step, status=UserSkillProgress.COMPLETED)
+        services.flush_progress_events()
+        
+        progress = UserSkillProgress.objects.get(user_profile=self.user, step=self.step)
+        self.assertEqual(progress.status, UserSkillProgress.COMPLETED)
+        self.assertFalse(ProgressEvent.objects.filter(compacted=False).exists())
+    
+    def test_summary_delta_matches_full_recompute(self):
+        """Applying the returned delta gives the same summary as recomputing after the write."""
+        UserSkillProgress.objects.create(user_profile=self.user, skill_path=self.path, step=self.step)
+        before = services.compute_progress_summary(self.user, self.path)
+        
+        for old, new in ((UserSkillProgress.NOT_STARTED, UserSkillProgress.IN_PROGRESS),
+                         (UserSkillProgress.IN_PROGRESS, UserSkillProgress.COMPLETED)):
+            delta = services.record_skill_step_status(self.user, self.step, old, new)
+            before = services.apply_progress_summary_delta(before, delta)
+            services.flush_progress_events()
+            self.assertEqual(before, services.compute_progress_summary(self.user, self.path))
+    
+    def test_step_id_is_accepted(self):
+        """Flat list rows only carry the step id; that is enough to queue an event."""
+        services.record_skill_step_event(self.user, self.step.id, status=UserSkillProgress.COMPLETED)
+        services.flush_progress_events()
+        
+        progress = UserSkillProgress.objects.get(user_profile=self.user, step=self.step)
+        self.assertEqual(progress.status, UserSkillProgress.COMPLETED)
+    
+    def test_learning_events_set_timestamps(self):
+        """Learning events fill in started_at and completed_at like the direct update does."""
+        services.record_learning_event(self.user, self.resource, status=UserLearningProgress.IN_PROGRESS)
+        services.record_learning_event(self.user, self.resource, status=UserLearningProgress.COMPLETED, progress_percent=100)
+        services.flush_progress_events()
+        
+        progress = UserLearningProgress.objects.get(user_profile=self.user, resource=self.resource)
+        self.assertEqual(progress.status, UserLearningProgress.COMPLETED)
+        self.assertIsNotNone(progress.started_at)
+        self.assertIsNotNone(progress.completed_at)
+    
+    def test_compaction_is_idempotent(self):
+        """Running compaction again does not re-apply events already folded in."""
+        services.record_skill_step_event(self.user, self.step, status=UserSkillProgress.IN_PROGRESS)
+        services.flush_progress_events()
+        
+        self.assertEqual(services.compact_progress_events(), 0)
+    
+    def test_events_for_deleted_rows_do_not_block_the_queue(self):
+        """An event for a missing step is dropped and later events are still written."""
+        services.record_skill_step_event(self.user, 987654, status=UserSkillProgress.COMPLETED)
+        services.record_skill_step_event(self.user, self.step, status=UserSkillProgress.IN_PROGRESS)
+        with mock.patch("builtins.print"):
+            services.flush_progress_events()
+        
+        self.assertEqual(ProgressEvent.objects.count(), 1)
+        self.assertEqual(UserSkillProgress.objects.get(user_profile=self.user).status, UserSkillProgress.IN_PROGRESS)
+        
+        services.record_skill_step_event(self.user, self.step, status=UserSkillProgress.COMPLETED)
+        self.assertEqual(services.flush_progress_events(), 1)
+        self.assertEqual(UserSkillProgress.objects.get(user_profile=self.user).status, UserSkillProgress.COMPLETED)
+    
+    def test_compaction_skips_events_for_deleted_rows(self):
+        """Events already logged for a step or resource that is gone are marked compacted, not applied."""
+        ProgressEvent.objects.create(user_profile=self.user, step_id=987654, status=UserSkillProgress.COMPLETED)
+        ProgressEvent.objects.create(user_profile=self.user, resource_id=987654, status=UserLearningProgress.COMPLETED)
+        
+        self.assertEqual(services.compact_progress_events(), 2)
+        self.assertFalse(ProgressEvent.objects.filter(compacted=False).exists())
+        self.assertFalse(UserSkillProgress.objects.exists())
+        self.assertFalse(UserLearningProgress.objects.exists())
+        # TestCase checks foreign keys on teardown
+        ProgressEvent.objects.all().delete()
+
+    def test_dashboard_cached_until_progress_or_milestone_write(self):
+        """The dashboard takes one query (two with progress), then stays cached until a write."""
+        services.invalidate_dashboard()
+        with self.assertNumQueries(1):
+            self.assertEqual(services.get_dashboard(self.user)["total"], 0)
+    
+        services.record_skill_step_event(self.user, self.step, status=UserSkillProgress.COMPLETED)
+        services.flush_progress_events()
+        with self.assertNumQueries(2):  # grouped counts + milestones
+            dashboard = services.get_dashboard(self.user)
+        with self.assertNumQueries(0):
+            services.get_dashboard(self.user)
+        self.assertEqual((dashboard["total"], dashboard["completed"], dashboard["completion_rate"]), (1, 1, 100))
+        self.assertEqual(dashboard["difficulty"], {"Easy": 1, "Medium": 0, "Hard": 0})
+    
+        services.check_and_award_milestones(self.user, self.path)
+        self.assertEqual(services.get_dashboard(self.user)["milestones"], [])  # no milestones defined
+        UserMilestone.objects.create(user_profile=self.user, milestone=Milestone.objects.create(name="First step"))
+        self.assertEqual([m["name"] for m in services.get_dashboard(self.user)["milestones"]], ["First step"])
+
+
+class RecommendationFeedTestCase(TestCase):
+    """Test cases for the materialized per-user recommendation feed."""
+    
+    def setUp(self):
+        """Set up test data."""
+        self.stage = EducationStage.objects.create(
+            code=EducationStage.UG,
+            name="Undergraduate",
+            description="Undergraduate education stage"
+        )
+        self.user = UserProfile.objects.create(
+            name="Test User",
+            education_stage=self.stage,
+            age=20
+        )
+        LearningResource.objects.create(title="Intro video", url="https://example.com/intro")
+    
+    def test_fresh_feed_is_read_in_one_query(self):
+        """A fresh feed is served from the feed table without recomputing."""
+        services.materialize_recommendation_feed(self.user)
+        
+        with self.assertNumQueries(1):
+            feed = services.get_recommendation_feed(self.user)
+        self.assertEqual([r["title"] for r in feed["resources"]], ["Intro video"])
+    
+    def test_catalog_change_makes_feed_stale(self):
+        """Adding a resource bumps the catalog version and the next read rebuilds the feed."""
+        services.materialize_recommendation_feed(self.user)
+        LearningResource.objects.create(title="Second video", url="https://example.com/second")
+        
+        feed = services.get_recommendation_feed(self.user)
+        
+        self.assertEqual(len(feed["resources"]), 2)
+        self.assertEqual(RecommendationFeed.objects.count(), 1)
+    
+    def test_different_session_inputs_rebuild_feed(self):
+        """A feed computed for other questionnaire answers is not reused."""
+        services.materialize_recommendation_feed(self.user)
+        old_key = RecommendationFeed.objects.get().inputs_key
+        
+        services.get_recommendation_feed(self.user, interest_profile=services.InterestProfile(creative=9))
+        
+        self.assertNotEqual(RecommendationFeed.objects.get().inputs_key, old_key)
+    
+    def test_inputs_key_covers_answers_after_long_target_role(self):
+        """The key is a fixed-length hash, so a 128-character target role cannot hide the answers."""
+        role = "r" * 128
+        keys = {
+            services._feed_inputs_key(None, None, role, services.InterestProfile(creative=creative))
+            for creative in (1, 9)
+        }
+        
+        self.assertEqual(len(keys), 2)
+        self.assertEqual({len(key) for key in keys}, {64})
+
+
+class RecommendationSessionTestCase(TestCase):
+    """Test cases for the session recommendation view model shared by both GUIs."""
+    
+    def setUp(self):
+        """Set up a high school student with one stream, career and skill path."""
+        self.stage = EducationStage.objects.create(
+            code=EducationStage.HIGH_SCHOOL,
+            name="High School",
+            description="High school education stage"
+        )
+        self.user = UserProfile.objects.create(name="Test User", education_stage=self.stage, age=15)
+        science = Stream.objects.create(code=Stream.SCIENCE, name="Science")
+        Career.objects.create(stream=science, name="Engineer", description="Builds things")
+        SkillPath.objects.create(name="Python Basics", stage=self.stage, primary_stream=science)
+        self.holder = mock.Mock(
+            current_user=self.user,
+            current_stage=self.stage,
+            interest_answers=[{"logical": 3, "analytical": 2}],
+            subject_levels={"maths": 9, "science": 8},
+            session=None,
+        )
+    
+    def test_results_computed_once_per_inputs(self):
+        """Rendering, read-aloud and the roadmap reuse one session until the answers change."""
+        session = sessions.current(self.holder)
+        results = session.results()
+        
+        with self.assertNumQueries(0):
+            self.assertIs(sessions.current(self.holder), session)
+            self.assertIs(session.results(), results)
+            text = session.results_read_aloud()
+        self.assertIn("Plan A: Science stream.", text.splitlines())
+        self.assertIn("Engineer", text)
+        self.assertEqual([label for label, _, _ in session.skill_paths()], ["Plan A"])
+        
+        self.holder.subject_levels = {"maths": 2, "science": 2}
+        self.assertIsNot(sessions.current(self.holder), session)
+    
+    def test_history_saved_once(self):
+        """The session saves its own results and paths to history exactly once."""
+        session = sessions.current(self.holder)
+        
+        history = session.save_history()
+        self.assertIs(session.save_history(), history)
+        self.assertEqual(RecommendationHistory.objects.count(), 1)
+        self.assertEqual((history.top_stream_code, history.top_career), (Stream.SCIENCE, "Engineer"))
+        self.assertEqual(history.top_skill_path_id, session.skill_paths()[0][1].id)
+
+
+class CatalogSnapshotTestCase(TestCase):
+    """Test cases for the memory-mapped kiosk catalog snapshot."""
+    
+    def setUp(self):
+        """Set up a small questionnaire and a temporary snapshot path."""
+        self.stage = EducationStage.objects.create(
+            code=EducationStage.HIGH_SCHOOL,
+            name="High School",
+            description="High school education stage"
+        )
+        question = Question.objects.create(text="Do you enjoy puzzles?", stage=self.stage)
+        self.option = OptionScore.objects.create(
+            question=question, option_text="A lot", logical_score=3, analytical_score=2, design_score=1
+        )
+        OptionScore.objects.create(question=question, option_text="Not really", creative_score=2)
+        
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, "catalog.snapshot")
+        services.export_catalog_snapshot(self.path)
+        services.invalidate_question_bank()
+    
+    def test_option_scores_are_zero_copy(self):
+        """Option score rows are views over the mapped file, not copies."""
+        with catalog_snapshot.CatalogSnapshot(self.path) as snapshot:
+            self.assertIsInstance(snapshot.option_scores.obj, mmap.mmap)
+            self.assertEqual(snapshot.option_count, 2)
+            self.assertEqual(list(snapshot.option_score_row(self.option.id)), [3, 2, 0, 0, 0, 0, 1])
+    
+    def test_snapshot_matches_database(self):
+        """Questionnaire and option score lookups give the same answers with and without the snapshot."""
+        from_db = (services.get_questionnaire(self.stage), services.get_option_scores([self.option.id]))
+        
+        with catalog_snapshot.CatalogSnapshot(self.path) as snapshot:
+            with mock.patch.object(catalog_snapshot, "get_default_snapshot", return_value=snapshot):
+                from_snapshot = (services.get_questionnaire(self.stage), services.get_option_scores([self.option.id]))
+        
+        self.assertEqual(from_db[1], from_snapshot[1])
+        self.assertEqual(from_db[0], from_snapshot[0])
+        self.assertEqual([o.text for o in from_db[0][0].options], ["A lot", "Not really"])
+    
+    def test_snapshot_question_bank_is_cached(self):
+        """The bank built from the snapshot is kept per stage until invalidated, like the database one."""
+        with catalog_snapshot.CatalogSnapshot(self.path) as snapshot:
+            with mock.patch.object(catalog_snapshot, "get_default_snapshot", return_value=snapshot):
+                bank = services.get_question_bank(self.stage)
+                with self.assertNumQueries(0):
+                    self.assertIs(services.get_question_bank(self.stage), bank)
+                
+                services.invalidate_question_bank()
+                self.assertIsNot(services.get_question_bank(self.stage), bank)
+            services.invalidate_question_bank()
+    
+    def test_question_bank_cached_until_admin_edit(self):
+        """Questions and options load in two queries once per stage; an edit reloads them."""
+        services.invalidate_question_bank()
+        with self.assertNumQueries(2):  # questions + prefetched options
+            questions = services.get_questionnaire(self.stage)
+        with self.assertNumQueries(0):
+            services.get_questionnaire(self.stage)
+            scores = services.get_option_scores([self.option.id], self.stage)
+        self.assertEqual(scores, services.get_option_scores([self.option.id]))
+        with self.assertRaises(AttributeError):
+            questions[0].text = "Changed"
+        
+        question = Question.objects.get()
+        question.text = "Do you enjoy logic puzzles?"
+        question.save()
+        self.assertEqual(services.get_questionnaire(self.stage)[0].text, "Do you enjoy logic puzzles?")
+    
+    def test_rejects_unknown_file(self):
+        """Files that are not snapshots raise SnapshotError instead of returning garbage."""
+        with open(self.path, "wb") as fh:
+            fh.write(b"not a snapshot" * 10)
+        
+        with self.assertRaises(catalog_snapshot.SnapshotError):
+            catalog_snapshot.CatalogSnapshot(self.path)
+
+
+class RecommendationHistoryTestCase(TestCase):
+    """Test cases for the structured Plan A columns on RecommendationHistory."""
+    
+    def setUp(self):
+        """Set up streams and a skill path."""
+        self.science = Stream.objects.create(code=Stream.SCIENCE, name="Science")
+        self.arts = Stream.objects.create(code=Stream.ARTS, name="Arts")
+        self.path = SkillPath.objects.create(name="Python Basics")
+    
+    def save_session(self, plan_a, plan_b):
+        return services.save_recommendation_history(
+            user=None,
+            stage_label="High School",
+            input_payload={},
+            streams_payload={"Plan A": {"stream": plan_a}, "Plan B": {"stream": plan_b}},
+            careers_payload=[{"name": "Engineer"}],
+            skill_paths_payload={"Plan A": self.path},
+        )
+    
+    def test_top_columns_filled_at_write_time(self):
+        """Saving a session stores Plan A values and JSON objects instead of str() of models."""
+        history = self.save_session(self.science, self.arts)
+        
+        self.assertEqual(history.top_stream_code, Stream.SCIENCE)
+        self.assertEqual(history.top_career, "Engineer")
+        self.assertEqual(history.top_skill_path_id, self.path.id)
+        self.assertEqual(history.streams["Plan A"]["stream"], {"id": self.science.id, "code": "SCIENCE", "name": "Science"})
+    
+    def test_most_chosen_stream_uses_plan_a(self):
+        """Analytics count the Plan A stream, not whichever stream name appears first."""
+        self.save_session(self.arts, self.science)
+        self.save_session(self.arts, self.science)
+        self.save_session(self.science, self.arts)
+        
+        self.assertEqual(services.offline_analytics_most_chosen_stream(), Stream.ARTS)
+    
+    def test_backfill_legacy_rows(self):
+        """The backfill reads rows written with str() model names."""
+        history = RecommendationHistory.objects.create(
+            output_streams='{"Plan A": {"stream": "Arts"}, "Plan B": {"stream": "Science"}}',
+            output_careers='[{"name": "Writer"}]',
+            output_skill_paths='{"Plan A": "Python Basics"}',
+        )
+        
+        self.assertEqual(services.backfill_history_top_fields(), 1)
+        history.refresh_from_db()
+        self.assertEqual(history.top_stream_code, Stream.ARTS)
+        self.assertEqual(history.top_career, "Writer")
+        self.assertEqual(history.top_skill_path_id, self.path.id)
+        self.assertEqual(services.backfill_history_top_fields(), 0)
+    
+    def test_backfill_pages_count_each_row_once(self):
+        """Rows updated in one page are neither revisited nor counted twice by later pages."""
+        for _ in range(5):
+            RecommendationHistory.objects.create(output_streams='{"Plan A": {"stream": "Arts"}}')
+        
+        self.assertEqual(services.backfill_history_top_fields(batch_size=2), 5)
+        counter = AnalyticsCounter.objects.get(kind=AnalyticsCounter.PLAN_A_STREAM, key=Stream.ARTS)
+        self.assertEqual(counter.count, 5)
+        self.assertEqual(services.reconcile_analytics_counters(), [])
+    
+    def test_compact_payload_keeps_what_was_shown(self):
+        """Compact rows keep the copied catalog text, so later catalog edits and deletions leave them alone."""
+        self.science.pros = "Many career options in research and technology. " * 20
+        self.science.save()
+        streams = {"Plan A": {"stream": self.science, "score": 9, "pros": self.science.pros, "cons": ""}}
+        careers = [{"name": "Engineer", "description": "Builds things", "why_fit": "You like maths", "exams": "JEE"}]
+        career = Career.objects.create(stream=self.science, name="Engineer", description="Builds things", suggested_exams_text="JEE")
+        shown_pros = self.science.pros
+        
+        history = services.save_recommendation_history(None, "UG", {"interest_profile": {"logical": 5}}, streams, careers, {})
+        self.science.pros = "Edited later"
+        self.science.name = "Sciences"
+        self.science.save()
+        career.delete()
+        
+        history = RecommendationHistory.objects.get(pk=history.pk)
+        self.assertEqual(history.output_streams, "")
+        self.assertLess(len(history.payload), len(shown_pros))
+        with self.assertNumQueries(0):
+            decoded = history.decoded()
+        self.assertEqual(decoded["streams"]["Plan A"]["pros"], shown_pros)
+        self.assertEqual(decoded["streams"]["Plan A"]["stream"], {"id": self.science.id, "code": "SCIENCE", "name": "Science"})
+        self.assertEqual(decoded["careers"], careers)
+        self.assertEqual(decoded["inputs"], {"interest_profile": {"logical": 5}})
+    
+    def test_compact_history_rows_keeps_every_value(self):
+        """Converting text-column rows keeps every decoded value and shrinks the row."""
+        legacy = RecommendationHistory.objects.create(
+            input_data='{"subject_levels": {"maths": 4}}',
+            output_streams=json.dumps({
+                "Plan A": {"stream": {"id": self.arts.id, "code": "ARTS", "name": "Arts"}, "score": 7, "pros": self.arts.pros},
+                "Plan B": {"stream": "Science"},
+            }),
+            output_careers='[{"name": "Writer"}]',
+            output_skill_paths="not json",
+        )
+        before = legacy.decoded()
+        
+        stats = services.compact_history_rows()
+        self.arts.delete()
+        
+        converted = RecommendationHistory.objects.get(pk=legacy.pk)
+        self.assertEqual(stats["rows"], 1)
+        self.assertTrue(converted.is_compact)
+        self.assertEqual(converted.decoded(), before)
+        self.assertEqual(services.compact_history_rows()["rows"], 0)
+    
+    def test_compact_history_rows_in_pages(self):
+        """Every text-column row is converted exactly once across several pages."""
+        for index in range(5):
+            RecommendationHistory.objects.create(input_data=json.dumps({"index": index}))
+        
+        self.assertEqual(services.compact_history_rows(batch_size=2)["rows"], 5)
+        self.assertEqual(
+            sorted(h.inputs["index"] for h in RecommendationHistory.objects.all()), list(range(5))
+        )
+        self.assertFalse(RecommendationHistory.objects.filter(payload__isnull=True).exists())
+
+
+class AnalyticsCounterTestCase(TestCase):
+    """Test cases for the incrementally maintained analytics counters."""
+    
+    def setUp(self):
+        """Set up a user, a stream and a two-step skill path."""
+        stage = EducationStage.objects.create(code=EducationStage.UG, name="Undergraduate")
+        self.user = UserProfile.objects.create(name="Test User", education_stage=stage)
+        self.science = Stream.objects.create(code=Stream.SCIENCE, name="Science")
+        difficulty = SkillDifficulty.objects.create(code=SkillDifficulty.EASY, label="Easy")
+        self.path = SkillPath.objects.create(name="Python Basics")
+        for index in (1, 2):
+            SkillPathStep.objects.create(
+                skill_path=self.path,
+                skill=Skill.objects.create(name=f"Skill {index}"),
+                order_index=index,
+                difficulty=difficulty,
+                level=1
+            )
+    
+    def test_writes_increment_counters(self):
+        """Saving sessions and tracking a path update the counters the analytics read."""
+        services.save_recommendation_history(
+            user=self.user, stage_label="UG", input_payload={},
+            streams_payload={"Plan A": {"stream": self.science}}, careers_payload=[], skill_paths_payload={}
+        )
+        services.initialize_progress_for_path(self.user, self.path)
+        services.initialize_progress_for_path(self.user, self.path)
+        
+        self.assertEqual(services.offline_analytics_most_chosen_stream(), Stream.SCIENCE)
+        self.assertEqual(services.offline_analytics_most_popular_skill_path(), "Python Basics")
+        counter = AnalyticsCounter.objects.get(kind=AnalyticsCounter.SKILL_PATH_PROGRESS)
+        self.assertEqual(counter.count, 2)
+        self.assertEqual(services.reconcile_analytics_counters(), [])
+    
+    def test_reconcile_repairs_drift(self):
+        """Drifted counters are reported and, with repair, reset to the recounted values."""
+        services.initialize_progress_for_path(self.user, self.path)
+        AnalyticsCounter.objects.update(count=7)
+        AnalyticsCounter.objects.create(kind=AnalyticsCounter.PLAN_A_STREAM, key=Stream.ARTS, count=3)
+        
+        drift = services.reconcile_analytics_counters(repair=True)
+        
+        self.assertEqual(len(drift), 2)
+        self.assertEqual(AnalyticsCounter.objects.get(kind=AnalyticsCounter.SKILL_PATH_PROGRESS).count, 2)
+        self.assertIsNone(services.offline_analytics_most_chosen_stream())
+        self.assertEqual(services.reconcile_analytics_counters(), [])
+    
+    def test_migration_counts_existing_rows(self):
+        """The migration that adds the counters starts them from the rows already in the database."""
+        from django.apps import apps
+        migration = importlib.import_module("recommender.migrations.0010_analyticscounter")
+        services.save_recommendation_history(
+            user=self.user, stage_label="UG", input_payload={},
+            streams_payload={"Plan A": {"stream": self.science}}, careers_payload=[], skill_paths_payload={}
+        )
+        services.initialize_progress_for_path(self.user, self.path)
+        AnalyticsCounter.objects.all().delete()
+        
+        migration.count_existing_rows(apps, None)
+        
+        self.assertEqual(services.offline_analytics_most_chosen_stream(), Stream.SCIENCE)
+        self.assertEqual(services.offline_analytics_most_popular_skill_path(), "Python Basics")
+        self.assertEqual(services.reconcile_analytics_counters(), [])
+
+
+class AnalyticsExportTestCase(TestCase):
+    """Test cases for the incremental columnar analytics export."""
+    
+    def setUp(self):
+        """Set up a temporary export directory."""
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.output = tmp_dir.name
+    
+    def test_incremental_export_uses_high_water_mark(self):
+        """A second run only writes rows added since the first, as a new part."""
+        RecommendationHistory.objects.create(stage_snapshot="UG", top_stream_code=Stream.SCIENCE)
+        RecommendationHistory.objects.create(stage_snapshot="UG", top_stream_code="")
+        first = analytics_export.export_analytics(self.output, tables=["recommendation_history"], chunk_size=1)
+        
+        latest = RecommendationHistory.objects.create(stage_snapshot="PG", top_stream_code=Stream.ARTS)
+        second = analytics_export.export_analytics(self.output, tables=["recommendation_history"], chunk_size=1)
+        
+        self.assertEqual(first["recommendation_history"], 2)
+        self.assertEqual(second["recommendation_history"], 1)
+        part = os.path.join(self.output, "recommendation_history", "part-00001")
+        self.assertEqual(analytics_export.read_column(part, "id"), [latest.id])
+        self.assertEqual(analytics_export.read_column(part, "top_stream_code"), [Stream.ARTS])
+        self.assertEqual(analytics_export.read_column(part, "top_skill_path_id"), [None])
+    
+    def test_string_columns_are_dictionary_encoded(self):
+        """Repeated strings are stored once in the dictionary and as int32 codes in the column."""
+        for code in (Stream.SCIENCE, Stream.SCIENCE, Stream.ARTS):
+            RecommendationHistory.objects.create(top_stream_code=code)
+        analytics_export.export_analytics(self.output, tables=["recommendation_history"])
+        
+        part = os.path.join(self.output, "recommendation_history", "part-00000")
+        with open(os.path.join(part, "top_stream_code.dict.json")) as fh:
+            self.assertEqual(json.load(fh), [Stream.SCIENCE, Stream.ARTS])
+        self.assertEqual(os.path.getsize(os.path.join(part, "top_stream_code.bin")), 3 * 4)
+    
+    def test_partial_full_export_keeps_other_tables(self):
+        """A full re-export of one table leaves the other tables' state alone for the next run."""
+        RecommendationHistory.objects.create(stage_snapshot="UG", top_stream_code=Stream.SCIENCE)
+        analytics_export.export_analytics(self.output)
+        
+        analytics_export.export_analytics(self.output, tables=["user_skill_progress"], full=True)
+        latest = RecommendationHistory.objects.create(stage_snapshot="PG", top_stream_code=Stream.ARTS)
+        counts = analytics_export.export_analytics(self.output)
+        
+        self.assertEqual(counts["recommendation_history"], 1)
+        part = os.path.join(self.output, "recommendation_history", "part-00001")
+        self.assertEqual(analytics_export.read_column(part, "id"), [latest.id])
+    
+    def test_existing_part_is_never_overwritten(self):
+        """A state file that lags the directory fails clearly instead of colliding with a part."""
+        RecommendationHistory.objects.create(stage_snapshot="UG")
+        analytics_export.export_analytics(self.output, tables=["recommendation_history"])
+        os.remove(os.path.join(self.output, analytics_export.STATE_FILE))
+        
+        with self.assertRaises(FileExistsError):
+            analytics_export.export_analytics(self.output, tables=["recommendation_history"])
+
+
+class AnalyticsRollupTestCase(TestCase):
+    """Test cases for the daily/weekly analytics rollups."""
+    
+    def setUp(self):
+        """Set up a user with one rated feedback entry from two weeks ago."""
+        stage = EducationStage.objects.create(code=EducationStage.UG, name="Undergraduate")
+        self.user = UserProfile.objects.create(name="Test User", education_stage=stage)
+        old = Feedback.objects.create(user_profile=self.user, rating=4)
+        self.old_day = (timezone.now() - timedelta(days=14)).date()
+        Feedback.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=14))
+    
+    def test_incremental_run_only_touches_new_buckets(self):
+        """Later runs recompute the buckets of new rows and leave older buckets alone."""
+        rollups.update_rollups()
+        old_row = AnalyticsRollup.objects.get(period=AnalyticsRollup.DAY, bucket_start=self.old_day)
+        
+        Feedback.objects.create(user_profile=self.user, rating=2)
+        stats = rollups.update_rollups()
+        
+        self.assertEqual(stats["buckets"], 2)  # today and this week
+        self.assertTrue(AnalyticsRollup.objects.filter(pk=old_row.pk).exists())
+        today = AnalyticsRollup.objects.get(period=AnalyticsRollup.DAY, bucket_start=timezone.localdate())
+        self.assertEqual((today.feedback_count, today.rating_sum, today.stage_code), (1, 2, EducationStage.UG))
+    
+    def test_backfill_matches_incremental(self):
+        """A full rebuild gives the same totals as the incremental runs."""
+        rollups.update_rollups()
+        Feedback.objects.create(user_profile=self.user, rating=2)
+        rollups.update_rollups()
+        incremental = services.get_activity_trend(buckets=4)
+        
+        rollups.update_rollups(backfill=True)
+        
+        self.assertEqual(services.get_activity_trend(buckets=4), incremental)
+        self.assertEqual(sum(week["rating_sum"] for week in incremental), 6)
+
+
+class AnalyticsSnapshotTestCase(TestCase):
+    """Test the cached analytics snapshot behind the Analytics screen"""
+    
+    def setUp(self):
+        services.invalidate_analytics_snapshot()
+        stage = EducationStage.objects.create(code=EducationStage.UG, name="Undergraduate")
+        self.user = UserProfile.objects.create(name="Snapshot User", education_stage=stage)
+        Feedback.objects.create(user_profile=self.user, rating=4)
+    
+    def test_second_call_is_served_from_cache(self):
+        """Repeated calls within the TTL do not touch the database."""
+        first = services.get_analytics_snapshot()
+        with self.assertNumQueries(0):
+            second = services.get_analytics_snapshot()
+        
+        self.assertEqual(second["total_feedback"], 1)
+        self.assertEqual(second["average_rating"], 4)
+        self.assertGreaterEqual(second["age_seconds"], first["age_seconds"])
+    
+    def test_writes_invalidate_snapshot(self):
+        """Saving feedback or history drops the cached figures."""
+        services.get_analytics_snapshot()
+        Feedback.objects.create(user_profile=self.user, rating=2)
+        
+        snapshot = services.get_analytics_snapshot()
+        
+        self.assertEqual(snapshot["total_feedback"], 2)
+        self.assertEqual(snapshot["average_rating"], 3)
+    
+    def test_concurrent_misses_share_one_computation(self):
+        """Callers arriving while a value is being computed wait for it instead of recomputing."""
+        cache = caching.TTLCache(ttl=60)
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+        
+        def compute():
+            calls.append(1)
+            started.set()
+            release.wait(5)
+            return "figures"
+        
+        results = []
+        owner = threading.Thread(target=lambda: results.append(cache.get("k", compute)[0]))
+        owner.start()
+        started.wait(5)
+        waiters = [threading.Thread(target=lambda: results.append(cache.get("k", compute)[0])) for _ in range(3)]
+        for thread in waiters:
+            thread.start()
+        release.set()
+        for thread in [owner, *waiters]:
+            thread.join(5)
+        
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(results, ["figures"] * 4)
+    
+    def test_invalidation_during_compute_is_not_stored(self):
+        """A value computed from data that changed mid-flight is not cached."""
+        cache = caching.TTLCache(ttl=60)
+        
+        def compute():
+            cache.invalidate()
+            return "stale"
+        
+        self.assertEqual(cache.get("k", compute)[0], "stale")
+        self.assertIsNone(cache.peek("k"))
+
+
+class HistoryArchiveTestCase(TestCase):
+    """Test moving old history rows to monthly archive files and reading them back."""
+    
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        settings_override = override_settings(HISTORY_ARCHIVE_DIR=self.tmp.name)
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        
+        stage = EducationStage.objects.create(code=EducationStage.UG, name="Undergraduate")
+        self.user = UserProfile.objects.create(name="Archive User", education_stage=stage)
+        self.science = Stream.objects.create(code=Stream.SCIENCE, name="Science")
+        now = timezone.now()
+        self.ages = [1, 40, 400, 430]
+        for days in self.ages:
+            history = services.save_recommendation_history(
+                self.user, "UG", {"days": days}, {"Plan A": {"stream": self.science}}, [], {}
+            )
+            RecommendationHistory.objects.filter(pk=history.pk).update(created_at=now - timedelta(days=days))
+    
+    def test_old_rows_move_to_monthly_files(self):
+        """Rows past the retention period leave the main database, one file per month."""
+        stats = history_archive.archive_history(older_than_days=365)
+        
+        self.assertEqual(stats["rows"], 2)
+        self.assertEqual(RecommendationHistory.objects.count(), 2)
+        self.assertEqual(len(history_archive.archive_files()), stats["files"])
+        self.assertEqual(history_archive.archive_history(older_than_days=365)["rows"], 0)
+    
+    def test_user_history_federates_hot_and_archived_rows(self):
+        """Paging past the main database continues into the archives, newest first."""
+        history_archive.archive_history(older_than_days=365)
+        
+        first = services.get_user_history(self.user, limit=2)
+        with self.assertNumQueries(1):
+            older = services.get_user_history(self.user, limit=5, before=(first[-1].created_at, first[-1].id))
+        
+        self.assertEqual([h.inputs["days"] for h in first + older], self.ages)
+        self.assertEqual([getattr(h, "archived", False) for h in older], [True, True])
+        self.assertEqual(older[0].streams["Plan A"]["stream"]["code"], Stream.SCIENCE)
+    
+    def test_paging_keeps_rows_with_equal_timestamps(self):
+        """Sessions saved in the same instant are split across pages, not skipped, here and in the archives."""
+        instant = timezone.now() - timedelta(days=2)
+        for _ in range(3):
+            history = services.save_recommendation_history(self.user, "UG", {"days": 2}, {}, [], {})
+            RecommendationHistory.objects.filter(pk=history.pk).update(created_at=instant)
+        # The two rows that get archived share a timestamp as well
+        RecommendationHistory.objects.filter(created_at__lt=timezone.now() - timedelta(days=365)).update(
+            created_at=instant - timedelta(days=420)
+        )
+        history_archive.archive_history(older_than_days=365)
+        
+        pages, before = [], None
+        while True:
+            page = services.get_user_history(self.user, limit=2, before=before)
+            if not page:
+                break
+            pages.extend(page)
+            before = (page[-1].created_at, page[-1].id)
+        
+        self.assertEqual(len(pages), 7)
+        self.assertEqual(len({h.id for h in pages}), 7)
+    
+    def test_archived_rows_still_count_in_reconcile(self):
+        """Archiving does not make the Plan A stream counters look drifted."""
+        history_archive.archive_history(older_than_days=365)
+        
+        self.assertEqual(services.reconcile_analytics_counters(), [])
+
+
+class ScreenTimingTestCase(TestCase):
+    """Test per-screen timing samples and the percentile report."""
+    
+    def setUp(self):
+        self.writer = BufferedWriter(instrumentation._write_samples, flush_interval=None, ring_size=5)
+        patcher = mock.patch.object(instrumentation, "_writer", self.writer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+    
+    def test_sample_counts_queries_and_service_time(self):
+        """A measured display records its ORM queries and time spent in wrapped service calls."""
+        timed = instrumentation.timed_module(services)
+        with instrumentation.measure_screen(ScreenTiming.TK, "HistoryScreen") as sample:
+            timed.offline_analytics_most_chosen_stream()
+            list(Stream.objects.all())
+        
+        self.assertEqual(sample.query_count, 2)
+        self.assertGreater(sample.service_ms, 0)
+        self.assertGreaterEqual(sample.duration_ms, sample.service_ms)
+        self.assertEqual(ScreenTiming.objects.count(), 0)  # nothing written until the flush
+        self.assertEqual(instrumentation.flush(), 1)
+        self.assertEqual(ScreenTiming.objects.get().query_count, 2)
+    
+    def test_ring_buffer_drops_oldest_samples(self):
+        """Only the newest ``ring_size`` samples are kept while nothing flushes."""
+        for index in range(8):
+            with instrumentation.measure_screen(ScreenTiming.KIVY, f"screen-{index}"):
+                pass
+        
+        self.assertEqual(self.writer.pending_count(), 5)
+        self.assertEqual(self.writer.dropped, 3)
+        instrumentation.flush()
+        self.assertEqual(sorted(ScreenTiming.objects.values_list("screen", flat=True))[0], "screen-3")
+
+    def test_startup_sample_counts_from_given_start(self):
+        """A time-to-first-window sample covers everything since the recorded start."""
+        started = time.perf_counter() - 0.25
+        elapsed = instrumentation.record_startup(ScreenTiming.TK, "startup.login_window", started)
+    
+        self.assertGreaterEqual(elapsed, 250)
+        instrumentation.flush()
+        sample = ScreenTiming.objects.get()
+        self.assertEqual(sample.screen, "startup.login_window")
+        self.assertAlmostEqual(sample.duration_ms, elapsed)
+        self.assertEqual(sample.query_count, 0)
+    
+    def test_report_percentiles(self):
+        """The report gives nearest-rank percentiles per screen, slowest p95 first."""
+        ScreenTiming.objects.bulk_create(
+            [ScreenTiming(app=ScreenTiming.TK, screen="ResultsScreen", duration_ms=ms) for ms in range(1, 101)]
+            + [ScreenTiming(app=ScreenTiming.TK, screen="HomeScreen", duration_ms=5)]
+        )
+        
+        report = instrumentation.timing_report()
+        
+        self.assertEqual([row["screen"] for row in report], ["ResultsScreen", "HomeScreen"])
+        self.assertEqual((report[0]["p50"], report[0]["p95"], report[0]["p99"]), (50, 95, 99))
+        self.assertEqual(report[0]["samples"], 100)
+
+
+class TaskPoolTestCase(TestCase):
+    """Test the worker pool that keeps ORM calls off the GUI thread."""
+    
+    def setUp(self):
+        self.dispatched = []
+        self.pool = background.TaskPool(self.dispatched.append, max_workers=2)
+        self.addCleanup(self.pool.shutdown)
+    
+    def test_results_are_handed_to_dispatch(self):
+        """Callbacks are not run on the worker; they are passed to the GUI's dispatch."""
+        results, errors = [], []
+        self.pool.submit(lambda a, b: a + b, 2, 3, on_done=results.append).result(5)
+        self.pool.submit(lambda: 1 / 0, on_error=errors.append).result(5)
+        
+        self.assertEqual((results, errors), ([], []))
+        for callback in self.dispatched:
+            callback()
+        self.assertEqual(results, [5])
+        self.assertIsInstance(errors[0], ZeroDivisionError)
+    
+    def test_shutdown_rejects_new_work(self):
+        """After shutdown nothing new is queued."""
+        self.pool.shutdown()
+        
+        self.assertIsNone(self.pool.submit(lambda: 1))
+
+
+class PagedListTestCase(TestCase):
+    """Test the keyset-paginated flat rows behind the Kivy RecycleView lists."""
+    
+    def setUp(self):
+        self.stage = EducationStage.objects.create(code=EducationStage.UG, name="Undergraduate")
+        self.user = UserProfile.objects.create(name="Pager", education_stage=self.stage)
+        LearningResource.objects.bulk_create(
+            [LearningResource(title=f"Video {i}", url=f"https://example.com/{i}") for i in range(7)]
+        )
+    
+    def test_resource_pages_cover_the_catalog_once(self):
+        """Following next_after visits every row once, skipping excluded ids."""
+        first_id = LearningResource.objects.order_by("id").values_list("id", flat=True)[0]
+        seen, after, pages = [], 0, 0
+        while after is not None:
+            rows, after = services.page_learning_resources(self.stage, after_id=after, limit=3, exclude_ids=(first_id,))
+            seen.extend(r["title"] for r in rows)
+            pages += 1
+        
+        self.assertEqual(pages, 2)
+        self.assertEqual(seen, [f"Video {i}" for i in range(1, 7)])
+        self.assertEqual(set(rows[0]), {"id", "title", "description", "url", "duration_minutes"})
+    
+    def test_resource_pages_filter_by_type(self):
+        """The Kivy list asks for videos only, so every row can link to YouTube."""
+        LearningResource.objects.create(title="Reading list", url="https://example.com/read", resource_type="ARTICLE")
+        
+        rows, after = services.page_learning_resources(self.stage, resource_type="VIDEO")
+        
+        self.assertIsNone(after)
+        self.assertEqual(len(rows), 7)
+        self.assertNotIn("Reading list", [r["title"] for r in rows])
+    
+    def test_progress_page_rows_are_flat(self):
+        """Progress rows carry the skill name without loading step or skill objects."""
+        difficulty = SkillDifficulty.objects.create(code=SkillDifficulty.EASY, label="Easy")
+        path = SkillPath.objects.create(name="Python Basics")
+        step = SkillPathStep.objects.create(
+            skill_path=path, skill=Skill.objects.create(name="Python"), order_index=1, difficulty=difficulty, level=1
+        )
+        UserSkillProgress.objects.create(user_profile=self.user, skill_path=path, step=step)
+        
+        with self.assertNumQueries(1):
+            rows, after = services.page_user_skill_progress(self.user)
+        
+        self.assertIsNone(after)
+        self.assertEqual(rows[0]["skill_name"], "Python")
+        self.assertEqual(rows[0]["step_id"], step.id)
+
+
+class ScreenLoaderTestCase(TestCase):
+    """Test per-screen cancellation and the short result cache of ScreenLoader."""
+    
+    def setUp(self):
+        self.dispatched = []
+        # One worker, so waiting on a no-op task waits for every earlier load
+        pool = background.TaskPool(self.dispatched.append, max_workers=1)
+        self.addCleanup(pool.shutdown)
+        self.loader = background.ScreenLoader(pool, ttl=60)
+    
+    def _run_dispatched(self):
+        for callback in self.dispatched:
+            callback()
+        self.dispatched.clear()
+    
+    def test_cached_result_renders_immediately(self):
+        """A second load within the TTL renders without touching the pool; refresh reloads."""
+        rendered, calls = [], []
+        
+        def load():
+            calls.append(1)
+            return len(calls)
+        
+        self.assertFalse(self.loader.load("progress", ("progress", 1), load, rendered.append))
+        self.loader.pool.submit(lambda: None).result(5)
+        self._run_dispatched()
+        self.assertTrue(self.loader.load("progress", ("progress", 1), load, rendered.append))
+        self.loader.load("progress", ("progress", 1), load, rendered.append, refresh=True)
+        self.loader.pool.submit(lambda: None).result(5)
+        self._run_dispatched()
+        
+        self.assertEqual(rendered, [1, 1, 2])
+    
+    def test_leaving_the_screen_drops_the_result(self):
+        """cancel() (on_leave) means a late result is never rendered."""
+        started, release = threading.Event(), threading.Event()
+        rendered = []
+        
+        def slow():
+            started.set()
+            release.wait(5)
+            return "late"
+        
+        self.loader.load("dashboard", ("dashboard", 1), slow, rendered.append)
+        self.assertTrue(started.wait(5))
+        self.loader.cancel("dashboard")
+        release.set()
+        self.loader.pool.submit(lambda: None).result(5)
+        self._run_dispatched()
+        
+        self.assertEqual(rendered, [])
+        self.assertEqual(self.loader.cache.peek(("dashboard", 1)), "late")
+
+
+class FakeSpeechEngine:
+    """Stands in for pyttsx3: each runAndWait fires one word event and waits for the test."""
+    
+    def __init__(self):
+        self.spoken = []
+        self.properties = {"rate": 150, "volume": 0.9, "voice": "v1", "voices": []}
+        self.gate = threading.Semaphore(0)
+        self.started = threading.Semaphore(0)
+        self.stops = 0
+        self._on_word = None
+    
+    def connect(self, topic, callback):
+        self._on_word = callback
+    
+    def getProperty(self, name):
+        return self.properties[name]
+    
+    def setProperty(self, name, value):
+        self.properties[name] = value
+    
+    def say(self, text):
+        self.spoken.append((text, self.properties["rate"]))
+    
+    def save_to_file(self, text, filename):
+        self.saved = getattr(self, "saved", []) + [text]
+        with open(filename, "wb") as f:
+            f.write(b"RIFF" + text.encode("utf-8"))
+    
+    def runAndWait(self):
+        self.started.release()
+        self.gate.acquire(timeout=5)
+        if self._on_word is not None:
+            self._on_word("word", 0, 1)
+    
+    def stop(self):
+        self.stops += 1
+
+
+class SpeechWorkerTestCase(TestCase):
+    """Test the speech thread that keeps text-to-speech off the GUI thread."""
+    
+    def setUp(self):
+        self.engine = FakeSpeechEngine()
+        self.worker = speech.SpeechWorker(lambda: self.engine)
+        self.addCleanup(self.worker.close)
+        self.assertTrue(self.worker.wait_ready(5))
+    
+    def _speak_next(self):
+        self.assertTrue(self.engine.started.acquire(timeout=5))
+        self.engine.gate.release()
+    
+    def test_split_sentences(self):
+        """Text is split at sentence ends and line breaks, and long sentences at commas."""
+        self.assertEqual(
+            speech.split_sentences("Plan A: Science. Why?\nBecause you like labs!  "),
+            ["Plan A: Science.", "Why?", "Because you like labs!"],
+        )
+        self.assertEqual(speech.split_sentences("aaaa, bbbb, cccc", max_chars=8), ["aaaa,", "bbbb,", "cccc"])
+    
+    def test_progress_and_completion(self):
+        """Each sentence reports progress before it is spoken, then on_done(True) fires once."""
+        progress, done = [], threading.Event()
+        finished = []
+        self.worker.speak(
+            "One. Two.",
+            on_progress=lambda i, total, text: progress.append((i, total, text)),
+            on_done=lambda completed: (finished.append(completed), done.set()),
+        )
+        self._speak_next()
+        self._speak_next()
+        
+        self.assertTrue(done.wait(5))
+        self.assertEqual(progress, [(0, 2, "One."), (1, 2, "Two.")])
+        self.assertEqual(finished, [True])
+    
+    def test_cancel_stops_between_words_and_drops_queue(self):
+        """cancel() stops the engine at the next word and nothing queued is spoken."""
+        finished = []
+        self.worker.speak("One. Two. Three.", on_done=finished.append)
+        self.worker.speak("Queued.", on_done=finished.append)
+        self.assertTrue(self.engine.started.acquire(timeout=5))
+        
+        self.worker.cancel()
+        self.engine.gate.release()
+        self.worker.close()
+        
+        self.assertEqual([text for text, _ in self.engine.spoken], ["One."])
+        self.assertEqual(self.engine.stops, 1)
+        self.assertEqual(sorted(finished), [False, False])
+    
+    def test_higher_priority_interrupts(self):
+        """A higher-priority utterance cuts in; its own properties apply to it only."""
+        finished, done = [], threading.Event()
+        self.worker.speak("Long one. Never read.", on_done=lambda c: finished.append(("long", c)))
+        self.assertTrue(self.engine.started.acquire(timeout=5))
+        
+        self.worker.speak("Urgent.", priority=speech.HIGH, properties={"rate": 200},
+                          on_done=lambda c: (finished.append(("urgent", c)), done.set()))
+        self.engine.gate.release()
+        self._speak_next()
+        self.assertTrue(done.wait(5))
+        
+        self.assertEqual(self.engine.spoken, [("Long one.", 150), ("Urgent.", 200)])
+        self.assertEqual(self.engine.properties["rate"], 150)
+        self.assertEqual(finished, [("long", False), ("urgent", True)])
+
+
+class TTSCacheTestCase(TestCase):
+    """Test the on-disk cache of pre-rendered read-aloud audio."""
+    
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.cache = tts_cache.TTSCache(tmp.name, max_bytes=1024)
+        self.engine = FakeSpeechEngine()
+        self.engine.gate.release(100)
+    
+    def test_key_covers_text_and_voice_settings(self):
+        """Whitespace does not matter; voice, rate and volume do."""
+        key = tts_cache.TTSCache.key("Hello  world.", "v1", 150, 0.9)
+        self.assertEqual(key, tts_cache.TTSCache.key(" Hello world. ", "v1", 150.0, 0.9))
+        self.assertNotEqual(key, tts_cache.TTSCache.key("Hello world.", "v2", 150, 0.9))
+        self.assertNotEqual(key, tts_cache.TTSCache.key("Hello world.", "v1", 200, 0.9))
+        self.assertNotEqual(key, tts_cache.TTSCache.key("Hello world.", "v1", 150, 0.5))
+    
+    def test_render_then_hit(self):
+        """A rendered sentence is served from disk afterwards."""
+        self.assertIsNone(self.cache.get("Hi.", "v1", 150, 0.9))
+        path = self.cache.render(self.engine, "Hi.", "v1", 150, 0.9)
+        
+        self.assertEqual(self.cache.get("Hi.", "v1", 150, 0.9), path)
+        self.assertEqual(path.read_bytes(), b"RIFFHi.")
+        self.assertEqual(list(self.cache.directory.glob("*.tmp.wav")), [])
+    
+    def test_least_recently_used_files_are_evicted(self):
+        """Past max_bytes the files read longest ago go first."""
+        text = "x" * 400
+        old = self.cache.render(self.engine, text + "old", "v1", 150, 0.9)
+        kept = self.cache.render(self.engine, text + "kept", "v1", 150, 0.9)
+        os.utime(old, (1000, 1000))
+        os.utime(kept, (1000, 1000))
+        self.cache.get(text + "kept", "v1", 150, 0.9)
+        
+        self.cache.render(self.engine, text + "new", "v1", 150, 0.9)
+        
+        self.assertFalse(old.exists())
+        self.assertTrue(kept.exists())
+        self.assertLessEqual(self.cache.size_bytes(), 1024)
+    
+    def test_worker_plays_cached_audio(self):
+        """With a cache the worker renders a miss once and plays files instead of speaking."""
+        played, done = [], threading.Event()
+        worker = speech.SpeechWorker(
+            lambda: self.engine, cache=self.cache, player=lambda path, cancelled: played.append(path) or True
+        )
+        self.addCleanup(worker.close)
+        worker.speak("One. One.", on_done=lambda completed: done.set())
+        
+        self.assertTrue(done.wait(5))
+        self.assertEqual(self.engine.spoken, [])
+        self.assertEqual(self.engine.saved, ["One."])
+        self.assertEqual(len(played), 2)
+        self.assertEqual(played[0], played[1])
+    
+    def test_catalog_texts_match_read_aloud(self):
+        """Prewarm texts come from the same helpers the read-aloud buttons use."""
+        stage = EducationStage.objects.create(code=EducationStage.PRIMARY, name="Primary")
+        ActivitySuggestion.objects.create(stage=stage, title="Build a kite", description="Try it outside.")
+        MotivationTip.objects.create(text="Keep going.", audience="SCHOOL")
+        
+        texts = list(tts_cache.catalog_texts())
+        
+        self.assertIn("Keep going.", texts)
+        self.assertIn("Build a kite. Try it outside.", texts)
+
+
+# Opt-in switch for the wall-clock start-up benchmarks below
+STARTUP_BENCHMARKS_ENV = "EDU_STARTUP_BENCHMARKS"
+
+
+class StartupBenchmarkTestCase(TestCase):
+    """Benchmarks for the launcher's cold start against ``launcher.STARTUP_BUDGET_MS``.
+    
+    The timed tests start real processes (the Kivy one opens a window on the
+    developer database), so they only run with ``EDU_STARTUP_BENCHMARKS=1``.
+    """
+    
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # launcher.py is a top-level script, importable only from the project directory
+        if importlib.util.find_spec("launcher") is None:
+            raise unittest.SkipTest("launcher.py is not importable")
+        cls.launcher = importlib.import_module("launcher")
+    
+    def run_python(self, code):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            cwd=settings.BASE_DIR, capture_output=True, text=True, timeout=60,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr[-2000:])
+        return (time.perf_counter() - started) * 1000, self.launcher.summarize_importtime(result.stderr.splitlines(), top=None)
+    
+    def test_summarize_importtime(self):
+        """Nested imports count towards their parent, not twice towards the total."""
+        summary = self.launcher.summarize_importtime([
+            "import time: self [us] | cumulative | imported package",
+            "import time:       200 |        200 |     json.scanner",
+            "import time:       500 |        700 |   json.decoder",
+            "import time:       300 |       1000 | json",
+            "import time:       400 |        400 | argparse",
+        ])
+        
+        self.assertEqual(summary["total_ms"], 1.4)
+        self.assertEqual(summary["modules"][0], ("json", 1.0))
+        self.assertEqual(summary["packages"], [("json", 1.0), ("argparse", 0.4)])
+    
+    def test_launcher_import_defers_django_and_kivy(self):
+        """Importing the launcher and checking dependencies loads neither Django nor Kivy."""
+        _, summary = self.run_python("import launcher; launcher.check_python_version(); launcher.check_dependencies()")
+        
+        packages = {name for name, _ in summary["packages"]}
+        self.assertIn("argparse", packages)
+        self.assertFalse({"django", "kivy"} & packages)
+    
+    @unittest.skipUnless(os.environ.get(STARTUP_BENCHMARKS_ENV), f"set {STARTUP_BENCHMARKS_ENV}=1 to run")
+    def test_django_bootstrap_within_budget(self):
+        """Setting up Django and importing the services the GUI needs takes under half the budget."""
+        elapsed_ms, _ = self.run_python(
+            "import os, django; "
+            "os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'edu_skill_recommender.settings'); "
+            "django.setup(); import recommender.services, recommender.session"
+        )
+        
+        self.assertLess(elapsed_ms, self.launcher.STARTUP_BUDGET_MS / 2)
+    
+    @unittest.skipUnless(os.environ.get(STARTUP_BENCHMARKS_ENV), f"set {STARTUP_BENCHMARKS_ENV}=1 to run")
+    @unittest.skipUnless(importlib.util.find_spec("kivy"), "Kivy is not installed")
+    def test_first_frame_within_budget(self):
+        """A cold launch draws its first frame within the time-to-interactive budget."""
+        self.assertTrue(self.launcher.profile_startup([]))
+
+
+class SetupFingerprintTestCase(TestCase):
+    """Tests for skipping migrations and seed sections that are already applied."""
+    
+    def section(self, key, source, calls):
+        return fingerprints.SeedSection(key, lambda: calls.append(key), [source])
+    
+    def test_migrations_recorded_after_migrate(self):
+        """Creating the test database records the migrations fingerprint."""
+        self.assertTrue(fingerprints.migrations_current())
+        
+        SetupFingerprint.objects.filter(key=SetupFingerprint.MIGRATIONS).update(digest="stale")
+        self.assertFalse(fingerprints.migrations_current())
+        
+        self.assertTrue(fingerprints.record_migrations())
+        self.assertTrue(fingerprints.migrations_current())
+    
+    def test_only_changed_sections_are_applied(self):
+        """A second run applies nothing, a changed section alone is reapplied and force applies all."""
+        def first_data():
+            return ["a"]
+        
+        def second_data():
+            return ["b"]
+        
+        def second_data_edited():
+            return ["b", "c"]
+        
+        calls = []
+        sections = [self.section("test.first", first_data, calls), self.section("test.second", second_data, calls)]
+        
+        self.assertEqual(fingerprints.apply_seed_sections(sections), ["test.first", "test.second"])
+        self.assertEqual(fingerprints.apply_seed_sections(sections), [])
+        
+        sections[1] = self.section("test.second", second_data_edited, calls)
+        self.assertEqual(fingerprints.apply_seed_sections(sections), ["test.second"])
+        self.assertEqual(fingerprints.apply_seed_sections(sections, force=True), ["test.first", "test.second"])
+        self.assertEqual(calls, ["test.first", "test.second", "test.second", "test.first", "test.second"])
+    
+    def test_failed_section_is_not_recorded(self):
+        """A section that raises is rolled back and retried on the next run."""
+        def fail():
+            raise RuntimeError("seed failed")
+        
+        section = fingerprints.SeedSection("test.failing", fail, [fail])
+        with self.assertRaises(RuntimeError):
+            fingerprints.apply_seed_sections([section])
+        
+        self.assertFalse(SetupFingerprint.objects.filter(key="test.failing").exists())
+    
+    def test_seed_commands_skip_when_unchanged(self):
+        """After both seed commands run once, the data is current and a rerun adds no rows."""
+        self.assertFalse(fingerprints.seeds_current())
+        call_command("seed_recommender", stdout=io.StringIO())
+        call_command("import_comprehensive_data", stdout=io.StringIO())
+        self.assertTrue(fingerprints.seeds_current())
+        
+        careers = Career.objects.count()
+        with self.assertNumQueries(1):
+            call_command("import_comprehensive_data", stdout=io.StringIO())
+        self.assertEqual(Career.objects.count(), careers)
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
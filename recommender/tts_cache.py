@@ -0,0 +1,146 @@
+"""On-disk cache of pre-rendered text-to-speech audio.
+
+Each sentence is rendered once with the engine's ``save_to_file`` into
+``<TTS_CACHE_DIR>/<key>.wav``, where the key hashes the normalised text with
+the voice, rate and volume it was rendered with. Reading a file refreshes its
+mtime, and once the directory grows past ``TTS_CACHE_MAX_MB`` the least
+recently used files are deleted. ``python manage.py prewarm_tts_cache``
+renders the catalog texts ahead of time so the first read-aloud already plays
+from disk.
+"""
+
+import hashlib
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Iterator, Optional
+
+from django.conf import settings
+
+from . import services
+from .models import ActivitySuggestion, MotivationTip, SkillPath, UserProfile
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    return _WHITESPACE.sub(" ", text or "").strip()
+
+
+class TTSCache:
+    def __init__(self, directory: Path, max_bytes: int):
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self._total: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_settings(cls) -> "TTSCache":
+        directory = getattr(settings, "TTS_CACHE_DIR", Path(settings.BASE_DIR) / "tts_cache")
+        max_mb = getattr(settings, "TTS_CACHE_MAX_MB", 200)
+        return cls(directory, max_mb * 1024 * 1024)
+
+    @staticmethod
+    def key(text: str, voice: object, rate: object, volume: object) -> str:
+        parts = [normalize(text), str(voice or ""), int(rate or 0), round(float(volume or 0), 2)]
+        return hashlib.sha256(json.dumps(parts, ensure_ascii=False).encode("utf-8")).hexdigest()
+
+    def path_for(self, key: str) -> Path:
+        return self.directory / f"{key}.wav"
+
+    def get(self, text: str, voice: object, rate: object, volume: object) -> Optional[Path]:
+        """Path of the cached rendering, or None; a hit counts as a use for LRU eviction."""
+        path = self.path_for(self.key(text, voice, rate, volume))
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def render(self, engine, text: str, voice: object, rate: object, volume: object) -> Optional[Path]:
+        """Render ``text`` with ``engine`` (already set to these properties) and cache the WAV."""
+        path = self.path_for(self.key(text, voice, rate, volume))
+        self.directory.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.wav")
+        try:
+            engine.save_to_file(normalize(text), str(tmp))
+            engine.runAndWait()
+            if not tmp.exists() or tmp.stat().st_size == 0:
+                return None
+            os.replace(tmp, path)
+        finally:
+            if tmp.exists():
+                tmp.unlink()
+        self._added(path.stat().st_size)
+        return path
+
+    def size_bytes(self) -> int:
+        return sum(p.stat().st_size for p in self._files())
+
+    def evict(self) -> int:
+        """Delete least recently used files until the cache fits ``max_bytes``; return the count."""
+        with self._lock:
+            files = []
+            for p in self._files():
+                try:
+                    st = p.stat()
+                except FileNotFoundError:
+                    continue
+                files.append((st.st_mtime, st.st_size, p))
+            files.sort()
+            total = sum(size for _, size, _ in files)
+            removed = 0
+            for _, size, p in files:
+                if total <= self.max_bytes:
+                    break
+                try:
+                    p.unlink()
+                except FileNotFoundError:
+                    pass
+                total -= size
+                removed += 1
+            self._total = total
+            return removed
+
+    def clear(self) -> None:
+        for p in self._files():
+            p.unlink(missing_ok=True)
+        self._total = 0
+
+    def _files(self):
+        if not self.directory.is_dir():
+            return []
+        return [p for p in self.directory.glob("*.wav") if not p.name.endswith(".tmp.wav")]
+
+    def _added(self, size: int) -> None:
+        with self._lock:
+            if self._total is not None:
+                self._total += size
+            over = self._total is None or self._total > self.max_bytes
+        if over:
+            self.evict()
+
+
+def catalog_texts() -> Iterator[str]:
+    """Static texts the read-aloud buttons speak, for ``prewarm_tts_cache``."""
+    for tip in MotivationTip.objects.values_list("text", flat=True).iterator():
+        yield tip
+    for activity in ActivitySuggestion.objects.all().iterator():
+        yield services.read_aloud_activity(activity)
+    for path in SkillPath.objects.prefetch_related("steps__skill", "steps__difficulty"):
+        for label in ("Plan A", "Plan B", "Plan C"):
+            yield f"{label}: {path.name}."
+        if path.description:
+            yield path.description
+        for i, step in enumerate(path.steps.all(), 1):
+            yield services.read_aloud_step(i, step)
+    roles = (
+        UserProfile.objects.exclude(current_role="")
+        .exclude(target_role="")
+        .values_list("current_role", "target_role")
+        .distinct()
+    )
+    for current_role, target_role in roles:
+        yield services.career_switch_roadmap(current_role, target_role)